@@ -21,7 +21,7 @@ import click
 import httpx
 
 from fetcher.config import AppConfig, load_config
-from fetcher.http import DomainRateLimiter
+from fetcher.http import DomainRateLimiter, create_client
 from fetcher.output import write_raw
 from fetcher.sources import SOURCE_REGISTRY, run_source
 
@@ -98,7 +98,7 @@ async def _run_all(
     if not source_filter:
         _validate_registry_config(config)
 
-    async with httpx.AsyncClient(follow_redirects=True, timeout=120) as shared_client:
+    async with create_client(timeout=120) as shared_client:
         limiter = DomainRateLimiter()
 
         # Single-source mode runs directly (no gather overhead)
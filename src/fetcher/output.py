@@ -4,17 +4,25 @@ Writes raw JSON files to the cc-data directory structure:
   {output_dir}/{date}/{source}.json
 
 Each file includes metadata: fetch_timestamp, source_name, version.
+Serialization uses orjson, which writes UTF-8 bytes directly (no
+``\\uXXXX`` escaping of Chinese text) and is several times faster than
+the stdlib encoder on large article payloads.
 """
 
 from __future__ import annotations
 
-import json
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 from fetcher import __version__
 
+# Pretty-printed like json.dump(indent=2).  Datetimes are passed through to
+# ``default=str`` so the output matches the previous stdlib encoding.
+_DUMP_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
 
 def write_raw(
     date: str,
@@ -47,7 +55,6 @@ def write_raw(
     }
 
     file_path = out_path / f"{source}.json"
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(envelope, f, ensure_ascii=False, indent=2, default=str)
+    file_path.write_bytes(orjson.dumps(envelope, default=str, option=_DUMP_OPTIONS))
 
     return file_path
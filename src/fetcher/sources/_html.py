@@ -0,0 +1,63 @@
+"""Shared parsing helpers for the HTML scrapers.
+
+Pages arrive already decoded to ``str`` (httpx picks the charset), and
+lxml refuses ``str`` input that still carries an XML encoding
+declaration, which XHTML pages often start with.  :func:`parse_html`
+drops such a declaration before parsing so those pages are read like
+any other.  :func:`has_class` builds the XPath class tests the scrapers
+compile their selectors from, and :func:`stripped_text` flattens an
+element's text the way bs4's ``get_text(strip=True)`` does.
+:func:`link_title` reads the title of an anchor on the listing pages
+that are still parsed with BeautifulSoup.
+"""
+
+from __future__ import annotations
+
+import re
+
+from bs4 import Tag
+from lxml import etree
+from lxml import html as lxml_html
+
+# Leading <?xml ...?> declaration, possibly after a byte order mark
+_XML_DECLARATION = re.compile(r"\A\ufeff?\s*<\?xml\b[^>]*\?>")
+
+
+def parse_html(html: str) -> lxml_html.HtmlElement | None:
+    """Parse *html* into an lxml document.
+
+    Returns:
+        The root ``<html>`` element, or None if the page is empty or
+        cannot be parsed.
+    """
+    try:
+        return lxml_html.document_fromstring(_XML_DECLARATION.sub("", html, count=1))
+    except (etree.ParserError, ValueError):
+        return None
+
+
+def has_class(name: str) -> str:
+    """Return an XPath predicate matching elements with CSS class *name*.
+
+    The plain substring test runs first and rejects most elements before
+    the costlier whitespace-normalized token match.
+    """
+    return (
+        f"contains(@class, '{name}')"
+        f" and contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+    )
+
+
+def stripped_text(elem: etree._Element) -> str:
+    """Return the text of *elem* with each text node stripped and joined."""
+    return "".join(text.strip() for text in elem.itertext())
+
+
+def link_title(link: Tag) -> str:
+    """Return the stripped text of a BeautifulSoup anchor.
+
+    Most listing anchors hold a single text node, which ``.string``
+    returns without walking the subtree; ``get_text`` is only needed for
+    anchors with nested markup.
+    """
+    return (link.string or link.get_text(strip=True) or "").strip()
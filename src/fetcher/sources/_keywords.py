@@ -0,0 +1,101 @@
+"""Shared keyword scanners for source relevance filters.
+
+Sources match their keyword lists against article text either as plain
+substrings (:func:`contains_keyword`, suited to Chinese text without word
+breaks) or on word boundaries (:func:`matched_keywords`).  Each keyword
+tuple is compiled once into a single alternation and cached, so every
+article is scanned in one pass and sources sharing a list share the
+compiled pattern.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+
+_NEVER = re.compile(r"(?!)")
+
+
+@lru_cache(maxsize=32)
+def _substring_pattern(keywords: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile lowercased *keywords* into one substring alternation."""
+    if not keywords:
+        return _NEVER
+    return re.compile("|".join(re.escape(kw.lower()) for kw in keywords))
+
+
+def contains_keyword(keywords: tuple[str, ...], text: str) -> bool:
+    """Return True if any of *keywords* occurs in *text* (case-insensitive).
+
+    Equivalent to ``any(kw.lower() in text.lower() for kw in keywords)``,
+    stopping at the first hit of a single scan.
+    """
+    return _substring_pattern(keywords).search(text.lower()) is not None
+
+
+@lru_cache(maxsize=32)
+def _word_scanner(keywords: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile keywords into one case-insensitive, word-bounded scanner.
+
+    The pattern is a zero-width lookahead over a longest-first alternation,
+    so a single ``finditer`` pass reports the longest keyword at every
+    position (see :func:`_keywords_at` for the shorter ones).
+    """
+    unique = sorted({kw for kw in keywords if kw}, key=len, reverse=True)
+    if not unique:
+        return _NEVER
+    alternation = "|".join(re.escape(kw) for kw in unique)
+    return re.compile(rf"(?=\b({alternation})\b)", re.IGNORECASE)
+
+
+@lru_cache(maxsize=32)
+def _lowercase_word_scanner(keywords: tuple[str, ...]) -> re.Pattern[str] | None:
+    """Case-sensitive variant of :func:`_word_scanner` for lowercased text.
+
+    Matching lowercased ASCII text is equivalent to a case-insensitive
+    match only when every keyword is ASCII too, so None is returned
+    otherwise.  Skipping case folding makes the scan about three times
+    faster.
+    """
+    if not all(kw.isascii() for kw in keywords):
+        return None
+    unique = sorted({kw.lower() for kw in keywords if kw}, key=len, reverse=True)
+    if not unique:
+        return _NEVER
+    alternation = "|".join(re.escape(kw) for kw in unique)
+    return re.compile(rf"(?=\b({alternation})\b)")
+
+
+@lru_cache(maxsize=1024)
+def _keywords_at(keywords: tuple[str, ...], matched: str) -> frozenset[str]:
+    """Return the keywords that match where the scanner reported *matched*.
+
+    Besides the reported keyword (and any case-insensitive equivalents),
+    shorter keywords that are prefixes of it ending on a word boundary
+    match at the same position.
+    """
+    return frozenset(
+        kw for kw in keywords
+        if kw and (
+            re.fullmatch(re.escape(kw), matched, re.IGNORECASE)
+            or (len(kw) < len(matched)
+                and re.match(re.escape(kw) + r"\b", matched, re.IGNORECASE))
+        )
+    )
+
+
+def matched_keywords(keywords: tuple[str, ...], text: str) -> set[str]:
+    """Return the *keywords* found in *text*.
+
+    Keywords match case-insensitively on word boundaries; the text is
+    scanned once for all of them rather than once per keyword.
+    """
+    scanner = _lowercase_word_scanner(keywords)
+    if scanner is not None and text.isascii():
+        text = text.lower()
+    else:
+        scanner = _word_scanner(keywords)
+    found: set[str] = set()
+    for m in scanner.finditer(text):
+        found |= _keywords_at(keywords, m.group(1))
+    return found
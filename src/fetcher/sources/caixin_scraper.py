@@ -13,10 +13,12 @@ from datetime import datetime, timedelta
 from typing import Any
 
 import httpx
-from bs4 import BeautifulSoup
+from lxml import etree
 
 from fetcher.config import SourceConfig
-from fetcher.http import request_with_retry
+from fetcher.http import ZH_BROWSER_HEADERS, create_client, request_with_retry
+from fetcher.sources._html import has_class, parse_html, stripped_text
+from fetcher.sources._keywords import contains_keyword
 from fetcher.sources._registry import register_source
 
 logger = logging.getLogger(__name__)
@@ -44,12 +46,12 @@ RELEVANCE_KEYWORDS = [
     "新疆", "xinjiang",
     "制裁", "sanction",
 ]
+_RELEVANCE_KEYWORDS = tuple(RELEVANCE_KEYWORDS)
 
 
 def _is_relevant(text: str) -> bool:
     """Check if article text contains relevant keywords."""
-    text_lower = text.lower()
-    return any(kw.lower() in text_lower for kw in RELEVANCE_KEYWORDS)
+    return contains_keyword(_RELEVANCE_KEYWORDS, text)
 
 
 def _parse_caixin_date(date_str: str) -> datetime | None:
@@ -78,6 +80,12 @@ def _parse_caixin_date(date_str: str) -> datetime | None:
     return None
 
 
+# Article links on section pages
+_ARTICLE_LINKS = etree.XPath(
+    "//a[contains(@href, '/articles/') or contains(@href, '/article/')]"
+)
+
+
 async def _scrape_section(
     client: httpx.AsyncClient,
     section: dict[str, str],
@@ -87,16 +95,18 @@ async def _scrape_section(
     articles = []
 
     try:
-        resp = await client.get(section["url"], timeout=timeout)
+        resp = await client.get(section["url"], headers=ZH_BROWSER_HEADERS, timeout=timeout)
         resp.raise_for_status()
     except (httpx.HTTPStatusError, httpx.RequestError) as exc:
         logger.warning("Failed to fetch Caixin section %s: %s", section["name"], exc)
         return []
 
-    soup = BeautifulSoup(resp.text, "html.parser")
+    tree = parse_html(resp.text)
+    if tree is None:
+        return []
 
     # Find article links - Caixin uses various article containers
-    for article_elem in soup.select("a[href*='/articles/'], a[href*='/article/']"):
+    for article_elem in _ARTICLE_LINKS(tree):
         href = article_elem.get("href", "")
         if not href:
             continue
@@ -107,7 +117,7 @@ async def _scrape_section(
         elif href.startswith("/"):
             href = "https://www.caixin.com" + href
 
-        title = article_elem.get_text(strip=True)
+        title = stripped_text(article_elem)
         if not title or len(title) < 5:
             continue
 
@@ -126,6 +136,54 @@ async def _scrape_section(
     return articles[:20]  # Limit per section
 
 
+# Elements dropped before extraction (their tail text is kept)
+_NOISE_TAGS = ("script", "style", "nav", "footer", "aside", "iframe")
+
+# Article content containers, in order of preference
+_CONTENT_XPATHS = [
+    etree.XPath(xpath)
+    for xpath in [
+        "//*[@id='Main_Content_Val']",
+        f"//*[{has_class('article-content')}]",
+        f"//*[{has_class('content')}]",
+        "//article",
+    ]
+]
+
+# Publish date element: the first of these in document order
+_DATE_XPATH = etree.XPath(
+    f"//*[{has_class('time')} or {has_class('date')} or {has_class('publish-time')}]"
+    " | //time"
+)
+
+
+def _parse_article_page(html: str) -> tuple[str, str | None]:
+    """Extract the body text and raw publish date text from an article page.
+
+    Returns:
+        ``(body_text, date_str)``; body_text is "" and date_str is None
+        when not found.
+    """
+    tree = parse_html(html)
+    if tree is None:
+        return "", None
+
+    # Remove unwanted elements in one pass
+    etree.strip_elements(tree, *_NOISE_TAGS, with_tail=False)
+
+    body_text = ""
+    for xpath in _CONTENT_XPATHS:
+        matches = xpath(tree)
+        if matches:
+            texts = (stripped_text(p) for p in matches[0].iterdescendants("p"))
+            body_text = " ".join(text for text in texts if text)
+            if body_text:
+                break
+
+    dates = _DATE_XPATH(tree)
+    return body_text, stripped_text(dates[0]) if dates else None
+
+
 async def _fetch_article_body(
     client: httpx.AsyncClient,
     article: dict[str, Any],
@@ -133,58 +191,37 @@ async def _fetch_article_body(
 ) -> None:
     """Fetch and extract the full article body."""
     try:
-        resp = await client.get(article["url"], timeout=timeout)
+        resp = await client.get(article["url"], headers=ZH_BROWSER_HEADERS, timeout=timeout)
         resp.raise_for_status()
     except (httpx.HTTPStatusError, httpx.RequestError) as exc:
         logger.debug("Failed to fetch article %s: %s", article["url"], exc)
         return
 
-    soup = BeautifulSoup(resp.text, "html.parser")
-
-    # Remove unwanted elements
-    for tag in soup.find_all(["script", "style", "nav", "footer", "aside", "iframe"]):
-        tag.decompose()
-
-    # Try to find article content
-    content_selectors = [
-        "#Main_Content_Val",
-        ".article-content",
-        ".content",
-        "article",
-    ]
-
-    body_text = ""
-    for selector in content_selectors:
-        container = soup.select_one(selector)
-        if container:
-            paragraphs = container.find_all("p")
-            body_text = " ".join(p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True))
-            if body_text:
-                break
+    body_text, date_str = _parse_article_page(resp.text)
 
     if body_text:
         article["body_text"] = body_text[:10000]
         article["body_snippet"] = body_text[:500]
 
-    # Try to find publish date
-    date_elem = soup.select_one(".time, .date, .publish-time, time")
-    if date_elem:
-        date_str = date_elem.get_text(strip=True)
+    if date_str:
         parsed = _parse_caixin_date(date_str)
         if parsed:
             article["date"] = parsed.strftime("%Y-%m-%d")
 
 
 @register_source("caixin")
-async def fetch(config: SourceConfig, date: str, **kwargs) -> dict[str, Any]:
+async def fetch(config: SourceConfig, date: str, *, client=None, **kwargs) -> dict[str, Any]:
     """Fetch articles from Caixin by web scraping.
 
-    Creates its own client with custom User-Agent headers required
-    by Caixin. The shared ``client`` kwarg is accepted but not used.
+    The browser User-Agent Caixin requires is sent per request, so the
+    shared client is reused when one is given.  Without one, an HTTP/2
+    client is created so concurrent body fetches multiplex over a single
+    connection per Caixin host.
 
     Args:
         config: Source configuration.
         date: Target date string (YYYY-MM-DD).
+        client: Optional shared httpx.AsyncClient.
 
     Returns:
         Dict with articles, counts, and metadata.
@@ -199,17 +236,13 @@ async def fetch(config: SourceConfig, date: str, **kwargs) -> dict[str, Any]:
 
     all_articles: list[dict[str, Any]] = []
 
-    async with httpx.AsyncClient(
-        follow_redirects=True,
-        headers={
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
-        }
-    ) as client:
+    should_close = client is None
+    _client = client or create_client(timeout=config.timeout)
+    try:
         # Scrape each section
         for section in CAIXIN_SECTIONS:
             result["sections_checked"] += 1
-            section_articles = await _scrape_section(client, section, config.timeout)
+            section_articles = await _scrape_section(_client, section, config.timeout)
             all_articles.extend(section_articles)
             await asyncio.sleep(1)  # Rate limiting
 
@@ -218,17 +251,20 @@ async def fetch(config: SourceConfig, date: str, **kwargs) -> dict[str, Any]:
 
         async def fetch_with_sem(article: dict[str, Any]) -> None:
             async with sem:
-                await _fetch_article_body(client, article, config.timeout)
+                await _fetch_article_body(_client, article, config.timeout)
                 await asyncio.sleep(0.5)
 
         await asyncio.gather(*[fetch_with_sem(a) for a in all_articles])
-
-    # Filter for relevant articles
-    relevant = []
-    for article in all_articles:
-        text = f"{article.get('title', '')} {article.get('body_snippet', '')}"
-        if _is_relevant(text):
-            relevant.append(article)
+    finally:
+        if should_close:
+            await _client.aclose()
+
+    # Filter for relevant articles; the snippet is only checked when the
+    # title does not already match
+    relevant = [
+        article for article in all_articles
+        if _is_relevant(article.get("title", "")) or _is_relevant(article.get("body_snippet", ""))
+    ]
 
     result["articles"] = relevant
     result["total_articles"] = len(relevant)
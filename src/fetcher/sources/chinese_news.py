@@ -137,9 +137,17 @@ def _is_duplicate(title: str, seen_titles: list[str]) -> bool:
     return False
 
 
-def _parse_feed(feed_content: str, feed_name: str, region: str = "mainland") -> list[dict[str, Any]]:
-    """Parse an RSS feed and return a list of article dicts."""
-    parsed = feedparser.parse(feed_content)
+def _parse_feed(
+    feed_content: bytes, feed_name: str, region: str = "mainland", content_type: str = "",
+) -> list[dict[str, Any]]:
+    """Parse raw RSS feed bytes and return a list of article dicts.
+
+    feedparser detects the encoding itself from the HTTP ``Content-Type``
+    header (*content_type*) and the XML declaration, so the response body
+    is passed through undecoded.
+    """
+    headers = {"content-type": content_type} if content_type else None
+    parsed = feedparser.parse(feed_content, response_headers=headers)
     articles: list[dict[str, Any]] = []
 
     for entry in parsed.entries:
@@ -197,14 +205,14 @@ async def _fetch_article_body(
     ]:
         container = soup.select_one(selector)
         if container:
-            paragraphs = container.find_all("p")
-            text = " ".join(p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True))
+            texts = (p.get_text(strip=True) for p in container.find_all("p"))
+            text = " ".join(t for t in texts if t)
             if text:
                 return text[:10000]  # Full article body for Chinese sources
 
     # Fallback: all paragraphs
-    paragraphs = soup.find_all("p")
-    text = " ".join(p.get_text(strip=True) for p in paragraphs if len(p.get_text(strip=True)) > 20)
+    texts = (p.get_text(strip=True) for p in soup.find_all("p"))
+    text = " ".join(t for t in texts if len(t) > 20)
     return text[:10000]  # Full article body for Chinese sources
 
 
@@ -272,7 +280,9 @@ async def fetch(config: SourceConfig, date: str, *, client=None, **kwargs) -> di
                 result["feed_errors"].append({"feed": feed_name, "error": str(exc)})
                 continue
 
-            articles = _parse_feed(resp.text, feed_name, feed_region)
+            articles = _parse_feed(
+                resp.content, feed_name, feed_region, resp.headers.get("content-type", ""),
+            )
 
             for article in articles:
                 title = article["title"]
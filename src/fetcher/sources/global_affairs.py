@@ -17,7 +17,7 @@ from typing import Any
 import httpx
 
 from fetcher.config import SourceConfig
-from fetcher.http import request_with_retry
+from fetcher.http import request_with_retry, response_json
 from fetcher.sources._registry import register_source
 
 logger = logging.getLogger(__name__)
@@ -147,7 +147,7 @@ async def fetch(config: SourceConfig, date: str, *, client=None, **kwargs) -> di
                             retry=config.retry,
                             params=params, timeout=timeout,
                         )
-                        data = resp.json()
+                        data = response_json(resp)
                         entries = data.get("feed", {}).get("entry", [])
                         articles = _extract_articles_from_api(entries)
                         all_articles.extend(articles)
@@ -19,6 +19,7 @@ from urllib.parse import urljoin
 from bs4 import BeautifulSoup
 
 from fetcher.config import SourceConfig
+from fetcher.sources._html import link_title
 from fetcher.sources._registry import register_source
 
 logger = logging.getLogger(__name__)
@@ -49,7 +50,7 @@ def _extract_articles_from_html(
     seen_titles: set[str] = set()
 
     for link in soup.find_all("a", href=True):
-        title = link.get_text(strip=True)
+        title = link_title(link)
         href = link["href"]
 
         if not title or len(title) < 10:
@@ -14,9 +14,12 @@ from datetime import UTC, datetime, timedelta
 from typing import Any
 from urllib.parse import urljoin
 
+import httpx
 from bs4 import BeautifulSoup
 
 from fetcher.config import SourceConfig
+from fetcher.http import create_client
+from fetcher.sources._html import link_title
 from fetcher.sources._registry import register_source
 
 logger = logging.getLogger(__name__)
@@ -73,7 +76,7 @@ def _extract_articles_from_html(
     url_to_date = _extract_timestamps(html)
 
     for link in soup.find_all("a", href=True):
-        title = link.get_text(strip=True)
+        title = link_title(link)
         href = link["href"]
 
         if not title or len(title) < 10:
@@ -118,27 +121,38 @@ def _extract_articles_from_html(
     return articles
 
 
-async def _fetch_article_body(url: str, timeout: int = 30) -> str:
-    """Fetch and extract body text from a MOFCOM article page."""
-    import httpx
+def _title_candidate(title: str, keywords: list[str] | None) -> bool:
+    """Return True if an article's title warrants fetching its body.
+
+    With no keywords configured every title is a candidate (the default:
+    MOFCOM keeps all articles from the last 24 hours).  Otherwise the
+    title must contain at least one keyword (case-insensitive), so
+    articles that cannot match are dropped before any body request.
+    """
+    if not keywords:
+        return True
+    title_lower = title.lower()
+    return any(kw.lower() in title_lower for kw in keywords)
+
 
+async def _fetch_article_body(client: httpx.AsyncClient, url: str, timeout: int = 30) -> str:
+    """Fetch and extract body text from a MOFCOM article page."""
     try:
-        async with httpx.AsyncClient(follow_redirects=True) as client:
-            resp = await client.get(url, timeout=timeout)
-            resp.raise_for_status()
-            html = resp.text
-
-            soup = BeautifulSoup(html, "html.parser")
-            selectors = [".art_con", ".TRS_Editor", ".article-body", "article", "#zoom", ".content"]
-            for selector in selectors:
-                container = soup.select_one(selector)
-                if container:
-                    paragraphs = container.find_all("p")
-                    texts = [p.get_text(strip=True) for p in paragraphs]
-                    text = " ".join(t for t in texts if t)
-                    if text and len(text) > 50:
-                        return text[:10000]  # Full article for Chinese government sources
-            return ""
+        resp = await client.get(url, timeout=timeout)
+        resp.raise_for_status()
+        html = resp.text
+
+        soup = BeautifulSoup(html, "html.parser")
+        selectors = [".art_con", ".TRS_Editor", ".article-body", "article", "#zoom", ".content"]
+        for selector in selectors:
+            container = soup.select_one(selector)
+            if container:
+                paragraphs = container.find_all("p")
+                texts = [p.get_text(strip=True) for p in paragraphs]
+                text = " ".join(t for t in texts if t)
+                if text and len(text) > 50:
+                    return text[:10000]  # Full article for Chinese government sources
+        return ""
     except Exception as exc:
         logger.warning("MOFCOM article fetch failed for %s: %s", url, exc)
         return ""
@@ -149,16 +163,17 @@ async def fetch(config: SourceConfig, date: str, *, client=None, **kwargs) -> di
     """Fetch all MOFCOM trade policy articles from the last 24 hours.
 
     Args:
-        config: Source configuration with URL and retry settings.
+        config: Source configuration with URL and retry settings.  An
+            optional ``title_keywords`` list restricts body fetches to
+            articles whose titles mention one of the keywords.
         date: Target date string (YYYY-MM-DD).
         client: Optional shared httpx.AsyncClient.
 
     Returns:
         Dict with articles, counts, and metadata.
     """
-    import httpx
-
     url = config.get("url", DEFAULT_URL)
+    title_keywords = config.get("title_keywords")
     result: dict[str, Any] = {
         "date": date,
         "articles": [],
@@ -171,21 +186,22 @@ async def fetch(config: SourceConfig, date: str, *, client=None, **kwargs) -> di
     target_date = datetime.strptime(date, "%Y-%m-%d").replace(tzinfo=UTC)
     cutoff = target_date - timedelta(days=1)
 
+    # One client serves the listing page and every article body, so
+    # connections to the MOFCOM host are reused rather than re-opened.
+    should_close = client is None
+    _client = client or create_client(timeout=config.timeout)
     try:
         # MOFCOM listing page is server-rendered, no JS needed
-        should_close = client is None
-        _client = client or httpx.AsyncClient(follow_redirects=True, timeout=config.timeout)
-        try:
-            resp = await _client.get(url, timeout=config.timeout)
-            resp.raise_for_status()
-            html = resp.text
-        finally:
-            if should_close:
-                await _client.aclose()
+        resp = await _client.get(url, timeout=config.timeout)
+        resp.raise_for_status()
+        html = resp.text
 
         articles = _extract_articles_from_html(html, url, cutoff)
         result["total_scraped"] = len(articles)
 
+        # Drop non-matching titles before any body I/O
+        articles = [a for a in articles if _title_candidate(a["title"], title_keywords)]
+
         if not articles:
             logger.info("MOFCOM: no articles found in last 24 hours")
             return result
@@ -194,7 +210,7 @@ async def fetch(config: SourceConfig, date: str, *, client=None, **kwargs) -> di
 
         # Fetch all article bodies from last 24 hours
         for article in articles:
-            body = await _fetch_article_body(article["source_url"], config.timeout)
+            body = await _fetch_article_body(_client, article["source_url"], config.timeout)
             article["body_text"] = body
             article["body"] = body[:500] if body else ""
             # Small delay between requests
@@ -207,5 +223,8 @@ async def fetch(config: SourceConfig, date: str, *, client=None, **kwargs) -> di
     except Exception as exc:
         logger.error("MOFCOM error: %s", exc)
         result["error"] = str(exc)
+    finally:
+        if should_close:
+            await _client.aclose()
 
     return result
@@ -14,42 +14,58 @@ from __future__ import annotations
 import asyncio
 import logging
 import re
+from collections import Counter, defaultdict
 from difflib import SequenceMatcher
+from functools import lru_cache
+from itertools import chain
 from typing import Any
+from urllib.parse import urlsplit
 
-# Regex patterns for paywall / CTA / newsletter-signup boilerplate.
+# Regex patterns for paywall / CTA / newsletter-signup boilerplate,
+# compiled into one case-insensitive alternation.
 # If any pattern matches a paragraph, that paragraph is skipped.
-_BOILERPLATE_PATTERNS = [
-    re.compile(p)
-    for p in [
-        r"(?i)members?\s+of\s+\w+\$?\d+.{0,30}(?:unlock|benefit|join|subscribe)",
-        r"(?i)you'?ve\s+read\s+\d+\s+article",
-        r"(?i)subscribe\s+(?:now|today|to)\s+(?:read|unlock|access|get)",
-        r"(?i)sign\s+up\s+(?:for|to)\s+(?:our|the|a)\s+(?:newsletter|daily|free)",
-        r"(?i)(?:join|become)\s+(?:a\s+)?(?:member|subscriber|patron)",
-        r"(?i)this\s+(?:article|story|content)\s+is\s+(?:for|available\s+to)\s+(?:premium|paid|subscriber)",
-        r"(?i)(?:free|premium)\s+(?:trial|access|membership)",
-        r"(?i)already\s+(?:a\s+)?(?:member|subscriber)\??\s*(?:log|sign)\s*in",
-        r"(?i)support\s+(?:our|independent|quality)\s+(?:journalism|reporting|team)",
-        r"(?i)(?:click|tap)\s+here\s+to\s+(?:subscribe|read|join|sign)",
-        r"(?i)member\s+benefits?",
-        r"(?i)(?:not\s+a\s+)?paywall.{0,30}(?:member|free|independent|thanks)",
-        r"(?i)thanks\s+to\s+(?:our\s+)?members",
-        r"(?i)no\s+ads.{0,20}no\s+pop.?ups",
-    ]
-]
+_BOILERPLATE_RE = re.compile(
+    "|".join(
+        f"(?:{p})"
+        for p in [
+            r"members?\s+of\s+\w+\$?\d+.{0,30}(?:unlock|benefit|join|subscribe)",
+            r"you'?ve\s+read\s+\d+\s+article",
+            r"subscribe\s+(?:now|today|to)\s+(?:read|unlock|access|get)",
+            r"sign\s+up\s+(?:for|to)\s+(?:our|the|a)\s+(?:newsletter|daily|free)",
+            r"(?:join|become)\s+(?:a\s+)?(?:member|subscriber|patron)",
+            r"this\s+(?:article|story|content)\s+is\s+(?:for|available\s+to)\s+(?:premium|paid|subscriber)",
+            r"(?:free|premium)\s+(?:trial|access|membership)",
+            r"already\s+(?:a\s+)?(?:member|subscriber)\??\s*(?:log|sign)\s*in",
+            r"support\s+(?:our|independent|quality)\s+(?:journalism|reporting|team)",
+            r"(?:click|tap)\s+here\s+to\s+(?:subscribe|read|join|sign)",
+            r"member\s+benefits?",
+            r"(?:not\s+a\s+)?paywall.{0,30}(?:member|free|independent|thanks)",
+            r"thanks\s+to\s+(?:our\s+)?members",
+            r"no\s+ads.{0,20}no\s+pop.?ups",
+        ]
+    ),
+    re.IGNORECASE,
+)
 
 import feedparser
 import httpx
-from bs4 import BeautifulSoup
+from lxml import etree
 
 from fetcher.config import RetryConfig, SourceConfig
-from fetcher.http import request_with_retry
+from fetcher.http import create_client, request_with_retry, retry_budget
+from fetcher.sources._html import has_class, parse_html, stripped_text
 from fetcher.sources._registry import register_source
 
 # Lighter retry for individual article fetches (many URLs, don't wait too long)
 DEFAULT_ARTICLE_RETRY = RetryConfig(max_retries=1, backoff_factor=0.3)
 
+# Extra seconds on top of the retry budget before a hanging feed is abandoned
+FEED_DEADLINE_SLACK = 2
+
+# Max concurrent full-article body fetches, overall and against one host
+ENRICH_CONCURRENCY = 10
+ENRICH_PER_HOST = 4
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_FEEDS = [
@@ -90,6 +106,15 @@ DEFAULT_KEYWORDS = [
 # Short acronyms that need word-boundary matching to avoid false positives
 # (e.g. "PRC" in "prices", "BRI" in "British", "NPC" in "NPC votes")
 _ACRONYM_KEYWORDS = ["PRC", "BRI", "CPC", "NPC", "PLA", "CPPCC"]
+_ACRONYM_ALTERNATION = "|".join(re.escape(acr.lower()) for acr in _ACRONYM_KEYWORDS)
+_ACRONYM_RE = re.compile(rf"\b(?:{_ACRONYM_ALTERNATION})\b", re.IGNORECASE)
+
+_PUNCT_RE = re.compile(r"[^\w\s]")
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+_SCRIPT_BLOCK_RE = re.compile(r"<(script|style)\b.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+_CHARSET_RE = re.compile(r"charset\s*=\s*[\"']?([^\s;\"']+)", re.IGNORECASE)
+# Leading emoji/symbol character; CTA lines often start with one
+_EMOJI_PREFIX_RE = re.compile(r"^[\U0001F300-\U0001FAD6\u2600-\u27BF]")
 
 # Bilingual keyword sets for category classification
 CATEGORY_KEYWORDS: dict[str, list[str]] = {
@@ -128,73 +153,334 @@ CATEGORY_KEYWORDS: dict[str, list[str]] = {
 }
 
 
+# Tag recorded for hits from the relevance keyword list (as opposed to a
+# category name from CATEGORY_KEYWORDS).
+_FILTER_TAG = "filter"
+
+# (pattern, tags-by-keyword) produced by _build_scanner
+KeywordScanner = tuple[re.Pattern[str], dict[str, frozenset[str]]]
+
+
+@lru_cache(maxsize=8)
+def _build_scanner(keywords: tuple[str, ...]) -> KeywordScanner:
+    """Build a single-pass scanner over relevance and category keywords.
+
+    Every keyword (lowercased) is mapped to the set of tags it implies:
+    ``_FILTER_TAG`` for relevance keywords, and the category name for each
+    CATEGORY_KEYWORDS entry.  The pattern is a zero-width lookahead over a
+    longest-first alternation, so ``finditer`` reports a hit at every
+    position; a hit also carries the tags of any shorter keyword that is a
+    prefix of it, which makes the scan equivalent to testing each keyword
+    with ``in`` individually.  Word-bounded acronyms are a second branch
+    of the same lookahead (group 2), so one pass covers everything.
+    Results are cached per keyword tuple, so repeated ``fetch()`` calls
+    with the same configuration reuse the compiled pattern.
+    """
+    tags: dict[str, set[str]] = {}
+    for kw in keywords:
+        if kw:
+            tags.setdefault(kw.lower(), set()).add(_FILTER_TAG)
+    for category, kws in CATEGORY_KEYWORDS.items():
+        for kw in kws:
+            tags.setdefault(kw.lower(), set()).add(category)
+
+    expanded = {
+        kw: frozenset().union(*(t for prefix, t in tags.items() if kw.startswith(prefix)))
+        for kw in tags
+    }
+    alternation = "|".join(re.escape(kw) for kw in sorted(tags, key=len, reverse=True))
+    pattern = re.compile(rf"(?=({alternation})|\b({_ACRONYM_ALTERNATION})\b)")
+    return pattern, expanded
+
+
+_CATEGORY_SCANNER = _build_scanner(())
+
+
+def _scan_article(text_lower: str, scanner: KeywordScanner) -> tuple[bool, list[str]]:
+    """Match relevance keywords and classify an article in one scan.
+
+    Returns ``(matched, categories)`` where *matched* is True if any
+    relevance keyword (or acronym, see :func:`_matches_keywords`) occurs in
+    *text_lower*, and *categories* follows :func:`_classify_article`.
+    *text_lower* must already be lowercased so callers that need both
+    checks convert the text only once.
+    """
+    pattern, tags = scanner
+    hits: set[str] = set()
+    for m in pattern.finditer(text_lower):
+        keyword = m.group(1)
+        if keyword is None:
+            hits.add(_FILTER_TAG)  # acronym branch
+            continue
+        hits |= tags[keyword]
+        # A keyword hit shadows the acronym branch at the same position
+        if _FILTER_TAG not in hits and _ACRONYM_RE.match(text_lower, m.start()):
+            hits.add(_FILTER_TAG)
+
+    matched = _FILTER_TAG in hits
+    categories = [category for category in CATEGORY_KEYWORDS if category in hits]
+    return matched, categories or ["general"]
+
+
 def _matches_keywords(text: str, keywords: list[str]) -> bool:
     """Check if text contains any of the given keywords (case-insensitive).
 
     Short acronyms in _ACRONYM_KEYWORDS use word-boundary matching
     to avoid false positives (e.g. "PRC" inside "prices").
     """
-    text_lower = text.lower()
-    if any(kw.lower() in text_lower for kw in keywords):
-        return True
-    # Word-boundary check for acronyms
-    for acr in _ACRONYM_KEYWORDS:
-        if re.search(rf"\b{re.escape(acr)}\b", text, re.IGNORECASE):
-            return True
-    return False
+    matched, _ = _scan_article(text.lower(), _build_scanner(tuple(keywords)))
+    return matched
 
 
 def _classify_article(text: str) -> list[str]:
     """Classify an article into categories based on keyword matching."""
-    categories: list[str] = []
-    text_lower = text.lower()
-    for category, kws in CATEGORY_KEYWORDS.items():
-        if any(kw.lower() in text_lower for kw in kws):
-            categories.append(category)
-    return categories or ["general"]
-
-
-def _is_duplicate(title: str, seen_titles: list[str], threshold: float = 0.75) -> bool:
-    """Check if a title is too similar to any previously seen title."""
-    title_clean = re.sub(r"[^\w\s]", "", title.lower())
-    for seen in seen_titles:
-        seen_clean = re.sub(r"[^\w\s]", "", seen.lower())
-        ratio = SequenceMatcher(None, title_clean, seen_clean).ratio()
-        if ratio >= threshold:
+    _, categories = _scan_article(text.lower(), _CATEGORY_SCANNER)
+    return categories
+
+
+SHINGLE_SIZE = 4
+
+
+def _shingles(text: str) -> frozenset[str]:
+    """Return the set of overlapping character shingles of *text*."""
+    if len(text) < SHINGLE_SIZE:
+        return frozenset([text])
+    return frozenset(text[i:i + SHINGLE_SIZE] for i in range(len(text) - SHINGLE_SIZE + 1))
+
+
+class TitleIndex:
+    """Near-duplicate detector over normalized article titles.
+
+    Titles are lowercased and stripped of punctuation; a title is a
+    duplicate if its ``SequenceMatcher`` ratio against an indexed title
+    reaches the threshold, exactly as a full pairwise scan would decide.
+    Exact repeats are caught by a set lookup.  Otherwise titles sharing a
+    character shingle (the likely matches) are tried first, then the
+    rest; before the full ratio is computed, each pair must pass the
+    same length and character-count upper bounds ``real_quick_ratio``
+    and ``quick_ratio`` use, which reject most pairs cheaply.  Sharing a
+    shingle only sets the order: "abcdefgh" and "abcXdefXgh" share none
+    yet match with a ratio of 0.89.
+    """
+
+    def __init__(self, threshold: float = 0.75) -> None:
+        self._threshold = threshold
+        self._titles: list[str] = []
+        self._counts: list[Counter[str]] = []
+        self._exact: set[str] = set()
+        self._postings: dict[str, list[int]] = {}
+
+    @staticmethod
+    def _normalize(title: str) -> str:
+        return _PUNCT_RE.sub("", title.lower())
+
+    def _matches(self, clean: str, counts: Counter[str], idx: int) -> bool:
+        seen = self._titles[idx]
+        total = len(clean) + len(seen)
+        if 2.0 * min(len(clean), len(seen)) / total < self._threshold:
+            return False
+        if 2.0 * (counts & self._counts[idx]).total() / total < self._threshold:
+            return False
+        return SequenceMatcher(None, clean, seen).ratio() >= self._threshold
+
+    def is_duplicate(self, title: str) -> bool:
+        """Check if *title* is too similar to any indexed title."""
+        clean = self._normalize(title)
+        if clean in self._exact:
             return True
-    return False
+        if not clean:
+            return False
 
+        likely: set[int] = set()
+        for shingle in _shingles(clean):
+            likely.update(self._postings.get(shingle, ()))
+        rest = (idx for idx in range(len(self._titles)) if idx not in likely)
 
-def _parse_feed(feed_content: str, feed_name: str) -> list[dict[str, Any]]:
-    """Parse RSS feed content into article records."""
-    parsed = feedparser.parse(feed_content)
-    articles: list[dict[str, Any]] = []
+        counts = Counter(clean)
+        return any(self._matches(clean, counts, idx) for idx in chain(sorted(likely), rest))
+
+    def add(self, title: str) -> None:
+        """Index *title* for subsequent duplicate checks."""
+        clean = self._normalize(title)
+        if clean in self._exact:
+            return
+        idx = len(self._titles)
+        self._exact.add(clean)
+        self._titles.append(clean)
+        self._counts.append(Counter(clean))
+        for shingle in _shingles(clean):
+            self._postings.setdefault(shingle, []).append(idx)
+
+
+_ATOM_NS = "{http://www.w3.org/2005/Atom}"
+_RSS_CONTENT = "{http://purl.org/rss/1.0/modules/content/}encoded"
+_DC_DATE = "{http://purl.org/dc/elements/1.1/}date"
+
+
+@lru_cache(maxsize=8)
+def _feed_xml_parser(encoding: str | None) -> etree.XMLParser:
+    """Return a feed parser, forcing *encoding* over the XML declaration if given.
 
-    for entry in parsed.entries:
-        title = entry.get("title", "")
-        summary = entry.get("summary", entry.get("description", ""))
-        link = entry.get("link", "")
-        published = entry.get("published", entry.get("updated", ""))
+    Entities are not resolved, so feeds relying on DTD entities fall back
+    to feedparser.
 
+    Raises:
+        LookupError: If libxml2 does not know *encoding*.
+    """
+    return etree.XMLParser(encoding=encoding, resolve_entities=False, no_network=True)
+
+
+def _first_text(el: etree._Element, *paths: str) -> str:
+    """Return the stripped text of the first non-empty child among *paths*."""
+    for path in paths:
+        text = (el.findtext(path) or "").strip()
+        if text:
+            return text
+    return ""
+
+
+def _atom_link(entry: etree._Element) -> str:
+    """Return the entry's alternate (or untyped) link href."""
+    for link in entry.iterfind(f"{_ATOM_NS}link"):
+        if link.get("rel", "alternate") == "alternate" and link.get("href"):
+            return link.get("href", "").strip()
+    return ""
+
+
+def _parse_feed_fast(
+    feed_content: bytes, encoding: str | None = None,
+) -> list[dict[str, str]] | None:
+    """Extract entries from plain RSS 2.0 / Atom feeds with lxml.
+
+    *encoding* is the charset from the HTTP ``Content-Type`` header, which
+    takes precedence over the XML declaration.
+
+    Returns a list of ``title``/``summary``/``link``/``published`` dicts,
+    or None when the document is malformed or has a shape this path does
+    not handle (RSS 1.0, XHTML Atom content, an encoding libxml2 does not
+    know, ...), in which case the caller falls back to feedparser.
+    Script/style blocks are dropped from summaries, as feedparser's
+    sanitizer would.
+    """
+    try:
+        root = etree.fromstring(feed_content, _feed_xml_parser(encoding))
+    except (etree.XMLSyntaxError, LookupError):
+        return None
+
+    entries: list[dict[str, str]] = []
+    if root.tag == "rss":
+        for item in root.iterfind("channel/item"):
+            link = _first_text(item, "link")
+            guid = item.find("guid")
+            if not link and guid is not None and guid.get("isPermaLink") != "false":
+                link = (guid.text or "").strip()
+            entries.append({
+                "title": _first_text(item, "title"),
+                "summary": _SCRIPT_BLOCK_RE.sub("", _first_text(item, "description", _RSS_CONTENT)),
+                "link": link,
+                "published": _first_text(item, "pubDate", _DC_DATE),
+            })
+    elif root.tag == f"{_ATOM_NS}feed":
+        for entry in root.iterfind(f"{_ATOM_NS}entry"):
+            if entry.find("*[@type='xhtml']") is not None:
+                return None
+            entries.append({
+                "title": _first_text(entry, f"{_ATOM_NS}title"),
+                "summary": _SCRIPT_BLOCK_RE.sub(
+                    "", _first_text(entry, f"{_ATOM_NS}summary", f"{_ATOM_NS}content"),
+                ),
+                "link": _atom_link(entry),
+                "published": _first_text(entry, f"{_ATOM_NS}published", f"{_ATOM_NS}updated"),
+            })
+    else:
+        return None
+    return entries
+
+
+def _parse_feed(
+    feed_content: bytes, feed_name: str, content_type: str = "",
+) -> list[dict[str, Any]]:
+    """Parse raw RSS feed bytes into article records.
+
+    Well-formed RSS 2.0 and Atom feeds are read directly with lxml;
+    anything else goes through feedparser.  Both decode the bytes
+    themselves: a charset in *content_type* (the HTTP ``Content-Type``
+    header) wins, otherwise the XML declaration is used.
+    """
+    charset = _CHARSET_RE.search(content_type)
+    entries = _parse_feed_fast(feed_content, charset.group(1).lower() if charset else None)
+    if entries is None:
+        headers = {"content-type": content_type} if content_type else None
+        entries = [
+            {
+                "title": entry.get("title", ""),
+                "summary": entry.get("summary", entry.get("description", "")),
+                "link": entry.get("link", ""),
+                "published": entry.get("published", entry.get("updated", "")),
+            }
+            for entry in feedparser.parse(feed_content, response_headers=headers).entries
+        ]
+
+    articles: list[dict[str, Any]] = []
+    for entry in entries:
         # Strip HTML from summary
-        clean_summary = re.sub(r"<[^>]+>", "", summary).strip()
+        clean_summary = _HTML_TAG_RE.sub("", entry["summary"]).strip()
         # Truncate to snippet
         snippet = clean_summary[:500] if clean_summary else ""
 
         articles.append({
-            "title": title,
+            "title": entry["title"],
             "source": feed_name,
-            "date": published,
+            "date": entry["published"],
             "body_snippet": snippet,
-            "url": link,
+            "url": entry["link"],
         })
 
     return articles
 
 
+# Noise tags removed in bulk before extraction
+_NOISE_TAGS = ("script", "style", "nav", "footer", "header", "aside")
+
+# Paywall/CTA/ad containers, matched by class or data attribute
+_NOISE_XPATH = etree.XPath(
+    "//*["
+    + " or ".join(
+        [has_class(c) for c in (
+            "ad", "ads", "sidebar", "paywall", "subscription", "membership", "cta",
+            "newsletter-signup", "subscribe-box", "piano-offer",
+        )]
+        + ["@data-paywall", "@data-piano", "@data-subscriber"]
+    )
+    + "]"
+)
+
+# Common article body containers (ordered by specificity)
+_CONTAINER_XPATHS = [
+    etree.XPath(xpath)
+    for xpath in [
+        f"//article//*[{has_class('article-body')}]",
+        f"//article//*[{has_class('story-body')}]",
+        f"//div[{has_class('article__body')}]",
+        f"//div[{has_class('article-body')}]",
+        f"//div[{has_class('story-body')}]",
+        "//div[@itemprop='articleBody']",
+        f"//div[{has_class('post-content')}]",
+        f"//div[{has_class('entry-content')}]",
+        f"//div[{has_class('article-content')}]",
+        f"//div[{has_class('content__body')}]",
+        "//article",
+        "//main",
+    ]
+]
+
+# Paragraphs, headings and list items, in document order
+_BODY_PARTS_XPATH = etree.XPath(".//h2 | .//h3 | .//h4 | .//li | .//p")
+
+
 def _is_boilerplate(text: str) -> bool:
     """Return True if text matches a paywall/CTA boilerplate pattern."""
-    return any(pat.search(text) for pat in _BOILERPLATE_PATTERNS)
+    return _BOILERPLATE_RE.search(text) is not None
 
 
 def _extract_article_body(html: str) -> str:
@@ -203,60 +489,45 @@ def _extract_article_body(html: str) -> str:
     Tries common article container selectors, then falls back to
     collecting all <p> tags from the page.  Returns cleaned plain text.
     """
-    soup = BeautifulSoup(html, "html.parser")
-
-    # Remove noise elements (including paywall/CTA containers)
-    for tag in soup.select(
-        "script, style, nav, footer, header, aside, "
-        ".ad, .ads, .sidebar, "
-        ".paywall, .subscription, .membership, .cta, "
-        ".newsletter-signup, .subscribe-box, .piano-offer, "
-        "[data-paywall], [data-piano], [data-subscriber]"
-    ):
-        tag.decompose()
+    tree = parse_html(html)
+    if tree is None:
+        return ""
 
-    # Try common article body selectors (ordered by specificity)
-    selectors = [
-        "article .article-body",
-        "article .story-body",
-        "div.article__body",
-        "div.article-body",
-        "div.story-body",
-        "div[itemprop='articleBody']",
-        "div.post-content",
-        "div.entry-content",
-        "div.article-content",
-        "div.content__body",
-        "article",
-        "main",
-    ]
+    # Remove noise elements: tag names in one C-level pass, then
+    # paywall/CTA containers.  Both keep the tail text that follows each
+    # removed element.
+    etree.strip_elements(tree, *_NOISE_TAGS, with_tail=False)
+    for el in _NOISE_XPATH(tree):
+        el.drop_tree()
 
+    # Try common article body selectors (ordered by specificity)
     container = None
-    for sel in selectors:
-        container = soup.select_one(sel)
-        if container:
+    for xpath in _CONTAINER_XPATHS:
+        matches = xpath(tree)
+        if matches:
+            container = matches[0]
             break
 
-    scope = container or soup
+    scope = container if container is not None else tree
 
     # Collect text from paragraphs, headings, and list items
     seen_text: set[str] = set()
     parts: list[str] = []
-    for tag in scope.find_all(["h2", "h3", "h4", "li", "p"]):
-        text = tag.get_text(strip=True)
+    for el in _BODY_PARTS_XPATH(scope):
+        text = stripped_text(el)
         if len(text) < 20 or text in seen_text:
             continue
         # Skip emoji-prefixed lines (e.g. HKFP "💡You've read...")
-        if re.match(r'^[\U0001F300-\U0001FAD6\u2600-\u27BF]', text):
+        if _EMOJI_PREFIX_RE.match(text):
             continue
         # Skip paywall / CTA boilerplate
         if _is_boilerplate(text):
             continue
         seen_text.add(text)
         # Prefix headings/list items so the summarizer can identify them
-        if tag.name in ("h2", "h3", "h4"):
+        if el.tag in ("h2", "h3", "h4"):
             parts.append(f"[heading] {text}")
-        elif tag.name == "li":
+        elif el.tag == "li":
             parts.append(f"[item] {text}")
         else:
             parts.append(text)
@@ -284,25 +555,35 @@ async def _fetch_article_body(
         return ""
 
 
-async def _enrich_articles_with_body(
+def _host_semaphores(per_host: int = ENRICH_PER_HOST) -> defaultdict[str, asyncio.Semaphore]:
+    """Return a lazily populated map of host name to per-host semaphore."""
+    return defaultdict(lambda: asyncio.Semaphore(per_host))
+
+
+def _url_host(url: str) -> str:
+    """Return the lowercased host[:port] of *url*, or "" if it cannot be parsed."""
+    try:
+        return urlsplit(url).netloc.lower()
+    except ValueError:
+        return ""
+
+
+async def _enrich_article(
     client: httpx.AsyncClient,
-    articles: list[dict[str, Any]],
-    concurrency: int = 10,
+    article: dict[str, Any],
+    sem: asyncio.Semaphore,
+    host_sems: defaultdict[str, asyncio.Semaphore],
 ) -> None:
-    """Fetch full article bodies for a batch of articles.
+    """Fetch one article's full body, updating ``body_text`` in place.
 
-    Updates each article's ``body_text`` in place.  Uses a semaphore
-    to limit concurrent requests.
+    The per-host slot is taken before the global one so requests queued
+    behind a busy host do not hold global slots other hosts could use.
     """
-    sem = asyncio.Semaphore(concurrency)
-
-    async def _fetch_one(article: dict[str, Any]) -> None:
-        async with sem:
-            body = await _fetch_article_body(client, article.get("url", ""))
-            if body:
-                article["body_text"] = body[:3000]
-
-    await asyncio.gather(*[_fetch_one(a) for a in articles])
+    url = article.get("url", "")
+    async with host_sems[_url_host(url)], sem:
+        body = await _fetch_article_body(client, url)
+        if body:
+            article["body_text"] = body[:3000]
 
 
 @register_source("news")
@@ -310,7 +591,9 @@ async def fetch(config: SourceConfig, date: str, *, client=None, **kwargs) -> di
     """Fetch and filter news articles from RSS feeds.
 
     After keyword filtering, fetches each article's full page to
-    extract body text for proper summarization downstream.
+    extract body text for proper summarization downstream.  Body fetches
+    start as soon as an article is accepted, overlapping with the
+    download of the remaining feeds.
 
     Args:
         config: Source configuration with feeds list and keywords.
@@ -325,53 +608,80 @@ async def fetch(config: SourceConfig, date: str, *, client=None, **kwargs) -> di
     timeout = config.timeout
 
     all_articles: list[dict[str, Any]] = []
-    seen_titles: list[str] = []
+    seen_titles = TitleIndex()
     feed_errors: list[dict[str, str]] = []
+    scanner = _build_scanner(tuple(keywords))
+
+    async def _fetch_feed(feed_url: str) -> httpx.Response:
+        return await asyncio.wait_for(
+            request_with_retry(_client, "GET", feed_url, retry=config.retry, timeout=timeout),
+            timeout=retry_budget(timeout, config.retry) + FEED_DEADLINE_SLACK,
+        )
 
     should_close = client is None
-    _client = client or httpx.AsyncClient(follow_redirects=True, timeout=timeout)
+    _client = client or create_client(timeout=timeout)
+    # Fetch all feeds concurrently; one slow or failing feed neither
+    # cancels its siblings nor delays client cleanup past its deadline.
+    feed_tasks = [asyncio.create_task(_fetch_feed(f.get("url", ""))) for f in feeds]
+    enrich_sem = asyncio.Semaphore(ENRICH_CONCURRENCY)
+    host_sems = _host_semaphores()
+    enrich_tasks: list[asyncio.Task[None]] = []
     try:
-        for feed_cfg in feeds:
+        # Process in feed order so deduplication stays deterministic
+        for feed_cfg, feed_task in zip(feeds, feed_tasks):
             feed_url = feed_cfg.get("url", "")
             feed_name = feed_cfg.get("name", feed_url)
 
             try:
-                resp = await request_with_retry(
-                    _client, "GET", feed_url,
-                    retry=config.retry,
-                    timeout=timeout,
-                )
-                raw_articles = _parse_feed(resp.text, feed_name)
-
-                for article in raw_articles:
-                    searchable = f"{article['title']} {article['body_snippet']}"
-
-                    # Keyword filter
-                    if not _matches_keywords(searchable, keywords):
-                        continue
-
-                    # Deduplication
-                    if _is_duplicate(article["title"], seen_titles):
-                        continue
-
-                    # Classify
-                    article["categories"] = _classify_article(searchable)
-                    all_articles.append(article)
-                    seen_titles.append(article["title"])
-
+                resp = await feed_task
             except httpx.HTTPStatusError as exc:
-                logger.warning("Feed %s HTTP error: %s", feed_name, exc.response.status_code)
-                feed_errors.append({"feed": feed_name, "error": f"HTTP {exc.response.status_code}"})
+                status = exc.response.status_code
+                logger.warning("Feed %s HTTP error: %s", feed_name, status)
+                feed_errors.append({"feed": feed_name, "error": f"HTTP {status}"})
+                continue
             except httpx.RequestError as exc:
                 logger.warning("Feed %s request error: %s", feed_name, exc)
                 feed_errors.append({"feed": feed_name, "error": str(exc)})
+                continue
+            except TimeoutError:
+                logger.warning("Feed %s timed out", feed_name)
+                feed_errors.append({"feed": feed_name, "error": "timeout"})
+                continue
+
+            raw_articles = _parse_feed(
+                resp.content, feed_name, resp.headers.get("content-type", ""),
+            )
+
+            for article in raw_articles:
+                # Deduplication first; it is cheaper than the keyword scan
+                if seen_titles.is_duplicate(article["title"]):
+                    continue
+
+                searchable = f"{article['title']} {article['body_snippet']}".lower()
+                matched, categories = _scan_article(searchable, scanner)
+                if not matched:
+                    continue
+
+                article["categories"] = categories
+                all_articles.append(article)
+                seen_titles.add(article["title"])
+
+                # Start the body fetch now, while later feeds are still in flight
+                enrich_tasks.append(
+                    asyncio.create_task(_enrich_article(_client, article, enrich_sem, host_sems))
+                )
 
-        # Fetch full article bodies for all matched articles
+        # Wait for the remaining full article body fetches
         logger.info("Fetching full article bodies for %d articles...", len(all_articles))
-        await _enrich_articles_with_body(_client, all_articles)
+        await asyncio.gather(*enrich_tasks)
         enriched = sum(1 for a in all_articles if a.get("body_text"))
         logger.info("Enriched %d/%d articles with full body text", enriched, len(all_articles))
     finally:
+        # Only does anything if an unexpected error escaped the loop above
+        pending = [t for t in (*feed_tasks, *enrich_tasks) if not t.done()]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
         if should_close:
             await _client.aclose()
 
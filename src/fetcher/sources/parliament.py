@@ -12,11 +12,14 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import re
+from collections import Counter
 from typing import Any
 
 import httpx
 
 from fetcher.config import SourceConfig
+from fetcher.http import create_client, response_json
 from fetcher.sources._registry import register_source
 
 logger = logging.getLogger(__name__)
@@ -32,6 +35,90 @@ PARLIAMENT_SESSION = "45-1"
 
 OPEN_PARLIAMENT_BASE = "https://api.openparliament.ca"
 
+# Max debates searched concurrently (each is up to 4 sequential requests)
+DEBATE_CONCURRENCY = 5
+
+
+# (pattern, keyword -> keywords that are prefixes of it) from _build_keyword_matcher
+KeywordMatcher = tuple[re.Pattern[str], dict[str, list[str]]]
+
+
+def _build_keyword_matcher(keywords: list[str]) -> KeywordMatcher:
+    """Compile lowercased keywords into one multi-pattern regex.
+
+    The pattern is a zero-width lookahead over a longest-first alternation,
+    so a single ``finditer`` pass reports the longest keyword starting at
+    every position.  Each keyword also maps to the shorter keywords that
+    are prefixes of it, since those occur at the same position.
+    """
+    lowered = {kw.lower() for kw in keywords if kw}
+    prefixes = {kw: [p for p in lowered if kw.startswith(p)] for kw in lowered}
+    alternation = "|".join(re.escape(kw) for kw in sorted(lowered, key=len, reverse=True))
+    return re.compile(f"(?=({alternation}))"), prefixes
+
+
+def _count_keywords(
+    text: str,
+    matcher: KeywordMatcher,
+    counts: dict[str, int] | None = None,
+) -> dict[str, int]:
+    """Count keyword occurrences in lowercase *text* in a single scan.
+
+    Counts are keyed by lowercased keyword and match ``str.count``
+    semantics (non-overlapping occurrences of each keyword).  Pass an
+    existing *counts* dict to accumulate across several texts.
+    """
+    pattern, prefixes = matcher
+    if counts is None:
+        counts = dict.fromkeys(prefixes, 0)
+    if not prefixes:
+        return counts
+    next_allowed: dict[str, int] = dict.fromkeys(prefixes, 0)
+    for m in pattern.finditer(text):
+        pos = m.start()
+        for kw in prefixes[m.group(1)]:
+            if pos >= next_allowed[kw]:
+                counts[kw] += 1
+                next_allowed[kw] = pos + len(kw)
+    return counts
+
+
+async def _fetch_bill(
+    client: httpx.AsyncClient,
+    base_url: str,
+    bill_id: str,
+    sessions_to_try: list[str],
+    timeout: int,
+) -> dict[str, Any] | None:
+    """Fetch one bill, trying each session in order until it is found."""
+    for try_session in sessions_to_try:
+        try:
+            url = f"{base_url}/bills/{try_session}/{bill_id}/?format=json"
+            resp = await client.get(url, timeout=timeout)
+
+            if resp.status_code == 404:
+                logger.info("Bill %s not found in session %s", bill_id, try_session)
+                continue
+
+            resp.raise_for_status()
+            data = response_json(resp)
+
+            name = data.get("name", {})
+            return {
+                "id": bill_id,
+                "title": name.get("en", "") if isinstance(name, dict) else str(name),
+                "title_fr": name.get("fr", "") if isinstance(name, dict) else "",
+                "status": data.get("status_code", ""),
+                "introduced": data.get("introduced", ""),
+                "session": try_session,
+                "sponsor": data.get("sponsor_politician_url", ""),
+            }
+        except httpx.HTTPStatusError as exc:
+            logger.warning("Failed to fetch bill %s: HTTP %s", bill_id, exc.response.status_code)
+        except httpx.RequestError as exc:
+            logger.warning("Request error fetching bill %s: %s", bill_id, exc)
+    return None
+
 
 async def _fetch_bills(
     client: httpx.AsyncClient,
@@ -42,44 +129,16 @@ async def _fetch_bills(
     """Fetch bill status from Open Parliament API.
 
     Tries the current session first, then falls back to 44-1 for older bills.
+    Bills are fetched concurrently; sessions for one bill are tried in order.
     Returns a list of bill records with id, title, status.
     """
-    bills: list[dict[str, Any]] = []
     sessions_to_try = [session, "44-1"] if session != "44-1" else [session]
 
-    for bill_id in TRACKED_BILLS:
-        found = False
-        for try_session in sessions_to_try:
-            if found:
-                break
-            try:
-                url = f"{base_url}/bills/{try_session}/{bill_id}/?format=json"
-                resp = await client.get(url, timeout=timeout)
-
-                if resp.status_code == 404:
-                    logger.info("Bill %s not found in session %s", bill_id, try_session)
-                    continue
-
-                resp.raise_for_status()
-                data = resp.json()
-
-                name = data.get("name", {})
-                bills.append({
-                    "id": bill_id,
-                    "title": name.get("en", "") if isinstance(name, dict) else str(name),
-                    "title_fr": name.get("fr", "") if isinstance(name, dict) else "",
-                    "status": data.get("status_code", ""),
-                    "introduced": data.get("introduced", ""),
-                    "session": try_session,
-                    "sponsor": data.get("sponsor_politician_url", ""),
-                })
-                found = True
-            except httpx.HTTPStatusError as exc:
-                logger.warning("Failed to fetch bill %s: HTTP %s", bill_id, exc.response.status_code)
-            except httpx.RequestError as exc:
-                logger.warning("Request error fetching bill %s: %s", bill_id, exc)
-
-    return bills
+    results = await asyncio.gather(*[
+        _fetch_bill(client, base_url, bill_id, sessions_to_try, timeout)
+        for bill_id in TRACKED_BILLS
+    ])
+    return [bill for bill in results if bill is not None]
 
 
 async def _fetch_recent_debates(
@@ -95,7 +154,7 @@ async def _fetch_recent_debates(
             timeout=timeout,
         )
         resp.raise_for_status()
-        data = resp.json()
+        data = response_json(resp)
         sessions = data.get("objects", [])[:limit]
         return [{"date": s.get("date", ""), "url": s.get("url", "")} for s in sessions]
     except (httpx.HTTPStatusError, httpx.RequestError) as exc:
@@ -107,15 +166,17 @@ async def _search_debate_content(
     client: httpx.AsyncClient,
     base_url: str,
     debate_url: str,
-    keywords: list[str],
+    matcher: KeywordMatcher,
     timeout: int,
-) -> dict[str, int]:
+) -> Counter[str]:
     """Search a single debate session for keyword mentions.
 
     Fetches speeches from the debate via the speeches endpoint and counts
-    keyword occurrences in the actual speech content.
+    keyword occurrences in the actual speech content.  *matcher* is built
+    once by the caller and shared by every debate; counts are keyed by
+    lowercased keyword.
     """
-    counts: dict[str, int] = {kw: 0 for kw in keywords}
+    counts: Counter[str] = Counter()
     try:
         # First get the debate detail to find the speeches URL
         resp = await client.get(
@@ -123,15 +184,17 @@ async def _search_debate_content(
             timeout=timeout,
         )
         resp.raise_for_status()
-        data = resp.json()
+        data = response_json(resp)
 
         speeches_url = data.get("related", {}).get("speeches_url", "")
         if not speeches_url:
             logger.warning("No speeches_url for debate %s", debate_url)
             return counts
 
-        # Fetch speeches (paginated, get up to 500 per debate)
-        all_text_parts: list[str] = []
+        # Fetch speeches (paginated, get up to 500 per debate).  Each
+        # segment is counted as it arrives rather than joined into one
+        # large lowercase string.
+        segments = 0
         sep = "&" if "?" in speeches_url else "?"
         next_url = f"{base_url}{speeches_url}{sep}format=json&limit=200"
 
@@ -141,7 +204,7 @@ async def _search_debate_content(
             try:
                 speeches_resp = await client.get(next_url, timeout=timeout)
                 speeches_resp.raise_for_status()
-                speeches_data = speeches_resp.json()
+                speeches_data = response_json(speeches_resp)
             except (httpx.HTTPStatusError, httpx.RequestError) as exc:
                 logger.warning("Failed to fetch speeches page: %s", exc)
                 break
@@ -150,10 +213,15 @@ async def _search_debate_content(
                 # Speech content is in content.en / content.fr (HTML)
                 content = speech.get("content", {})
                 if isinstance(content, dict):
-                    all_text_parts.append(content.get("en", ""))
-                    all_text_parts.append(content.get("fr", ""))
+                    texts = (content.get("en", ""), content.get("fr", ""))
                 elif isinstance(content, str):
-                    all_text_parts.append(content)
+                    texts = (content,)
+                else:
+                    continue
+                segments += 1
+                for text in texts:
+                    if text:
+                        _count_keywords(text.lower(), matcher, counts)
 
             # Follow pagination
             pagination = speeches_data.get("pagination", {})
@@ -163,13 +231,9 @@ async def _search_debate_content(
             else:
                 break
 
-        combined_text = " ".join(all_text_parts).lower()
-        for kw in keywords:
-            counts[kw] = combined_text.count(kw.lower())
-
         logger.info(
             "Debate %s: %d speech segments, %d keyword matches",
-            debate_url, len(all_text_parts) // 2, sum(counts.values()),
+            debate_url, segments, sum(counts.values()),
         )
 
     except (httpx.HTTPStatusError, httpx.RequestError) as exc:
@@ -195,21 +259,31 @@ async def fetch(config: SourceConfig, date: str, *, client=None, **kwargs) -> di
     timeout = config.timeout
 
     should_close = client is None
-    _client = client or httpx.AsyncClient(follow_redirects=True, timeout=timeout)
+    _client = client or create_client(timeout=timeout)
     try:
         # Fetch bills and recent debates in parallel
         bills_task = _fetch_bills(_client, base_url, session, timeout)
         debates_task = _fetch_recent_debates(_client, base_url, timeout)
         bills, recent_debates = await asyncio.gather(bills_task, debates_task)
 
-        # Search recent debates for keyword mentions
-        keyword_totals: dict[str, int] = {kw: 0 for kw in keywords}
-        for debate in recent_debates:
-            counts = await _search_debate_content(
-                _client, base_url, debate["url"], keywords, timeout,
-            )
-            for kw, count in counts.items():
-                keyword_totals[kw] = keyword_totals.get(kw, 0) + count
+        # Search recent debates for keyword mentions (concurrently, max 5 at a time)
+        semaphore = asyncio.Semaphore(DEBATE_CONCURRENCY)
+        matcher = _build_keyword_matcher(keywords)
+
+        async def search_with_semaphore(debate: dict[str, str]) -> Counter[str]:
+            async with semaphore:
+                return await _search_debate_content(
+                    _client, base_url, debate["url"], matcher, timeout,
+                )
+
+        debate_counts = await asyncio.gather(*[
+            search_with_semaphore(debate) for debate in recent_debates
+        ])
+
+        found: Counter[str] = Counter()
+        for counts in debate_counts:
+            found += counts
+        keyword_totals: dict[str, int] = {kw: found[kw.lower()] for kw in keywords}
     finally:
         if should_close:
             await _client.aclose()
@@ -25,12 +25,18 @@ Coordinate system for table 12100175 (commodity trade):
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 import httpx
+import msgspec
+import orjson
 
 from fetcher.config import SourceConfig
+from fetcher.http import create_client
 from fetcher.sources._registry import register_source
 
 logger = logging.getLogger(__name__)
@@ -39,14 +45,35 @@ WDS_BASE = "https://www150.statcan.gc.ca/t1/wds/rest"
 TABLE_PID = 12100011
 COMMODITY_TABLE_PID = 12100175
 
+# WDS response bodies larger than this are decoded off the event loop
+_THREADED_PARSE_BYTES = 64 * 1024
+
 # Scalar factor codes: 0=units, 3=thousands, 6=millions, 9=billions
 SCALAR_LABELS = {0: "", 3: "thousands", 6: "millions", 9: "billions"}
 
+@dataclass(frozen=True, slots=True)
+class _TradeCoord:
+    """One aggregate trade series in table 12-10-0011-01."""
+
+    label: str
+    coordinate: str
+
+
+@dataclass(frozen=True, slots=True)
+class _Commodity:
+    """One commodity group in table 12-10-0175-01 with its two coordinates."""
+
+    label: str
+    label_zh: str
+    import_coordinate: str
+    export_coordinate: str
+
+
 # Trade data coordinates (Geography=Canada, Basis=Customs, Unadjusted, Partner=China)
-TRADE_COORDS = [
-    {"label": "Imports from China", "coordinate": "1.1.1.1.11.0.0.0.0.0"},
-    {"label": "Exports to China", "coordinate": "1.2.1.1.11.0.0.0.0.0"},
-]
+TRADE_COORDS: tuple[_TradeCoord, ...] = (
+    _TradeCoord("Imports from China", "1.1.1.1.11.0.0.0.0.0"),
+    _TradeCoord("Exports to China", "1.2.1.1.11.0.0.0.0.0"),
+)
 
 # ---------------------------------------------------------------------------
 # Commodity-level trade coordinates for table 12-10-0175-01
@@ -59,71 +86,190 @@ TRADE_COORDS = [
 # Values are in CAD x 1,000 (divide by 1000 to get millions).
 # Member ID 14 (Other BoP adjustments) has no country-level data.
 # ---------------------------------------------------------------------------
-COMMODITY_COORDS: list[dict[str, Any]] = [
-    {
-        "label": "Electronic & Electrical Equipment",
-        "label_zh": "电子电气设备",
+COMMODITY_COORDS: tuple[_Commodity, ...] = (
+    _Commodity(
+        label="Electronic & Electrical Equipment",
+        label_zh="电子电气设备",
         # NAPCS C18 (member 9)
-        "import_coordinate": "1.1.9.3.0.0.0.0.0.0",
-        "export_coordinate": "1.2.9.3.0.0.0.0.0.0",
-    },
-    {
-        "label": "Consumer Goods",
-        "label_zh": "消费品",
+        import_coordinate="1.1.9.3.0.0.0.0.0.0",
+        export_coordinate="1.2.9.3.0.0.0.0.0.0",
+    ),
+    _Commodity(
+        label="Consumer Goods",
+        label_zh="消费品",
         # NAPCS C22 (member 12)
-        "import_coordinate": "1.1.12.3.0.0.0.0.0.0",
-        "export_coordinate": "1.2.12.3.0.0.0.0.0.0",
-    },
-    {
-        "label": "Industrial Machinery & Equipment",
-        "label_zh": "工业机械设备",
+        import_coordinate="1.1.12.3.0.0.0.0.0.0",
+        export_coordinate="1.2.12.3.0.0.0.0.0.0",
+    ),
+    _Commodity(
+        label="Industrial Machinery & Equipment",
+        label_zh="工业机械设备",
         # NAPCS C17 (member 8)
-        "import_coordinate": "1.1.8.3.0.0.0.0.0.0",
-        "export_coordinate": "1.2.8.3.0.0.0.0.0.0",
-    },
-    {
-        "label": "Metal & Mineral Products",
-        "label_zh": "金属和矿产品",
+        import_coordinate="1.1.8.3.0.0.0.0.0.0",
+        export_coordinate="1.2.8.3.0.0.0.0.0.0",
+    ),
+    _Commodity(
+        label="Metal & Mineral Products",
+        label_zh="金属和矿产品",
         # NAPCS C14 (member 5)
-        "import_coordinate": "1.1.5.3.0.0.0.0.0.0",
-        "export_coordinate": "1.2.5.3.0.0.0.0.0.0",
-    },
-    {
-        "label": "Forestry & Building Materials",
-        "label_zh": "林产品和建筑材料",
+        import_coordinate="1.1.5.3.0.0.0.0.0.0",
+        export_coordinate="1.2.5.3.0.0.0.0.0.0",
+    ),
+    _Commodity(
+        label="Forestry & Building Materials",
+        label_zh="林产品和建筑材料",
         # NAPCS C16 (member 7)
-        "import_coordinate": "1.1.7.3.0.0.0.0.0.0",
-        "export_coordinate": "1.2.7.3.0.0.0.0.0.0",
-    },
-    {
-        "label": "Energy Products",
-        "label_zh": "能源产品",
+        import_coordinate="1.1.7.3.0.0.0.0.0.0",
+        export_coordinate="1.2.7.3.0.0.0.0.0.0",
+    ),
+    _Commodity(
+        label="Energy Products",
+        label_zh="能源产品",
         # NAPCS C12 (member 3)
-        "import_coordinate": "1.1.3.3.0.0.0.0.0.0",
-        "export_coordinate": "1.2.3.3.0.0.0.0.0.0",
-    },
-    {
-        "label": "Farm, Fishing & Food Products",
-        "label_zh": "农渔食品",
+        import_coordinate="1.1.3.3.0.0.0.0.0.0",
+        export_coordinate="1.2.3.3.0.0.0.0.0.0",
+    ),
+    _Commodity(
+        label="Farm, Fishing & Food Products",
+        label_zh="农渔食品",
         # NAPCS C11 (member 2) -- includes canola/oilseeds
-        "import_coordinate": "1.1.2.3.0.0.0.0.0.0",
-        "export_coordinate": "1.2.2.3.0.0.0.0.0.0",
-    },
-    {
-        "label": "Chemicals, Plastics & Rubber",
-        "label_zh": "化工塑料橡胶",
+        import_coordinate="1.1.2.3.0.0.0.0.0.0",
+        export_coordinate="1.2.2.3.0.0.0.0.0.0",
+    ),
+    _Commodity(
+        label="Chemicals, Plastics & Rubber",
+        label_zh="化工塑料橡胶",
         # NAPCS C15 (member 6)
-        "import_coordinate": "1.1.6.3.0.0.0.0.0.0",
-        "export_coordinate": "1.2.6.3.0.0.0.0.0.0",
-    },
-    {
-        "label": "Motor Vehicles & Parts",
-        "label_zh": "汽车及零部件",
+        import_coordinate="1.1.6.3.0.0.0.0.0.0",
+        export_coordinate="1.2.6.3.0.0.0.0.0.0",
+    ),
+    _Commodity(
+        label="Motor Vehicles & Parts",
+        label_zh="汽车及零部件",
         # NAPCS C19 (member 10)
-        "import_coordinate": "1.1.10.3.0.0.0.0.0.0",
-        "export_coordinate": "1.2.10.3.0.0.0.0.0.0",
-    },
-]
+        import_coordinate="1.1.10.3.0.0.0.0.0.0",
+        export_coordinate="1.2.10.3.0.0.0.0.0.0",
+    ),
+)
+
+
+# (productId, coordinate) queries for the aggregate and commodity series,
+# fixed at import time
+_TRADE_QUERIES = tuple((TABLE_PID, c.coordinate) for c in TRADE_COORDS)
+_COMMODITY_QUERIES = tuple(
+    (COMMODITY_TABLE_PID, coord)
+    for comm in COMMODITY_COORDS
+    for coord in (comm.import_coordinate, comm.export_coordinate)
+)
+_COMMODITY_COORDINATES = frozenset(coord for _, coord in _COMMODITY_QUERIES)
+
+
+@lru_cache(maxsize=8)
+def _wds_payload(queries: tuple[tuple[int, str], ...], periods: int) -> bytes:
+    """Return the encoded JSON body for a batched WDS coordinate query.
+
+    *queries* are ``(productId, coordinate)`` pairs; WDS accepts entries
+    from different tables in one batch.  Only ``periods`` (and, with
+    ``parallel_series``, the split of the batch) varies between calls, so
+    the encoded body is built once and reused.
+    """
+    return orjson.dumps([
+        {"productId": product_id, "coordinate": coord, "latestN": periods}
+        for product_id, coord in queries
+    ])
+
+
+class _WdsDataPoint(msgspec.Struct, rename="camel"):
+    """One observation of a WDS vector.
+
+    ``value`` is read through :func:`_point_value`, so a non-numeric value
+    blanks only that observation instead of failing the whole decode.
+    """
+
+    ref_per: str = ""
+    value: float | str | None = None
+    scalar_factor_code: int = 6
+
+
+class _WdsObject(msgspec.Struct, rename="camel"):
+    """The ``object`` of a successful WDS result item."""
+
+    coordinate: str = ""
+    vector_data_point: list[_WdsDataPoint] | None = None
+
+
+class _WdsItem(msgspec.Struct):
+    """One result item of a batched WDS query.
+
+    Failed items may carry an error string instead of an object.  Fields
+    the fetcher never reads (footnotes, release metadata, vector IDs) are
+    skipped while decoding rather than built and discarded.
+    """
+
+    status: str = ""
+    object: _WdsObject | str | None = None
+
+
+_WDS_DECODER = msgspec.json.Decoder(list[_WdsItem])
+
+
+async def _query_wds(
+    client: httpx.AsyncClient,
+    base_url: str,
+    payload: bytes,
+    timeout: int,
+) -> list[_WdsItem]:
+    """POST a batched getDataFromCubePidCoordAndLatestNPeriods query.
+
+    *payload* is a body from :func:`_wds_payload`, encoded with orjson.
+    The (much larger) response is decoded with msgspec straight into
+    :class:`_WdsItem` structs instead of intermediate dicts.  Bodies over
+    ``_THREADED_PARSE_BYTES`` (long ``periods`` backfills) are decoded in
+    a worker thread so a big parse does not stall sibling fetchers
+    sharing the event loop.
+
+    Raises:
+        httpx.HTTPStatusError: On a non-2xx response.
+        httpx.RequestError: On transport failures.
+        msgspec.DecodeError: If the body is not a list of WDS result items.
+    """
+    resp = await client.post(
+        f"{base_url}/getDataFromCubePidCoordAndLatestNPeriods",
+        content=payload,
+        headers={"Content-Type": "application/json"},
+        timeout=timeout,
+    )
+    # Confirms whether the aggregate and commodity POSTs share an HTTP/2
+    # connection and whether the body came compressed
+    logger.debug(
+        "StatCan WDS POST answered over %s (content-encoding: %s)",
+        resp.http_version, resp.headers.get("Content-Encoding", "identity"),
+    )
+    resp.raise_for_status()
+
+    if len(resp.content) > _THREADED_PARSE_BYTES:
+        return await asyncio.to_thread(_WDS_DECODER.decode, resp.content)
+    return _WDS_DECODER.decode(resp.content)
+
+
+# (periods, values, scalar label) for one aggregate series
+SeriesColumns = tuple[list[str], list[float | None], str]
+
+
+def _format_series(columns: SeriesColumns, series_format: str) -> Any:
+    """Shape one aggregate series for output.
+
+    ``"columnar"`` returns ``{"scalar", "periods", "values"}`` with parallel
+    lists (one dict per series); the default ``"rows"`` returns the
+    original list of ``{"period", "value", "scalar"}`` dicts.
+    """
+    periods, values, scalar = columns
+    if series_format == "columnar":
+        return {"scalar": scalar, "periods": periods, "values": values}
+    return [
+        {"period": period, "value": value, "scalar": scalar}
+        for period, value in zip(periods, values)
+    ]
 
 
 def _to_millions(val: float | None) -> float | None:
@@ -131,6 +277,13 @@ def _to_millions(val: float | None) -> float | None:
     return round(val / 1000, 1) if val is not None else None
 
 
+# Relative change beyond which a series counts as moving up or down
+TREND_THRESHOLD = 0.01
+
+# Indexed by (up) - (down) + 1
+_TREND_LABELS = ("down", "stable", "up")
+
+
 def _determine_trend(
     latest: float | None,
     previous: float | None,
@@ -144,153 +297,172 @@ def _determine_trend(
     if latest is None or previous is None or previous == 0:
         return "stable"
     pct_change = (latest - previous) / abs(previous)
-    if pct_change > 0.01:
-        return "up"
-    if pct_change < -0.01:
-        return "down"
-    return "stable"
+    return _TREND_LABELS[(pct_change > TREND_THRESHOLD) - (pct_change < -TREND_THRESHOLD) + 1]
+
+
+def _point_value(point: _WdsDataPoint) -> float | None:
+    """Return the value of a data point as a float, or None if it is not numeric."""
+    value = point.value
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return value
 
 
 def _extract_latest_and_previous(
-    points: list[dict[str, Any]],
+    points: list[_WdsDataPoint],
 ) -> tuple[float | None, float | None]:
     """Extract the latest and second-latest values from a data-point list.
 
     The StatCan WDS returns data points in chronological order (oldest first).
     """
-    if not points:
-        return None, None
-    latest = points[-1].get("value")
-    previous = points[-2].get("value") if len(points) >= 2 else None
-    return latest, previous
+    match points:
+        case [*_, previous, latest]:
+            return _point_value(latest), _point_value(previous)
+        case [latest]:
+            return _point_value(latest), None
+        case _:
+            return None, None
+
+
+def _commodity_record(
+    comm: _Commodity,
+    import_latest: float | None,
+    import_previous: float | None,
+    export_latest: float | None,
+    export_previous: float | None,
+) -> dict[str, Any]:
+    """Build one commodity's output record from raw values in CAD x 1,000.
+
+    Converts all four values to millions in one pass, then derives the
+    balance (exports - imports; positive means Canada exports more) and
+    the trend of total trade volume (imports + exports).
+    """
+    imp_m, imp_prev_m, exp_m, exp_prev_m = map(
+        _to_millions, (import_latest, import_previous, export_latest, export_previous),
+    )
 
+    balance: float | None = None
+    if exp_m is not None and imp_m is not None:
+        balance = round(exp_m - imp_m, 1)
 
-async def _fetch_commodities(
-    client: httpx.AsyncClient,
-    base_url: str,
-    timeout: int,
-    periods: int,
+    trend = _determine_trend((imp_m or 0) + (exp_m or 0), (imp_prev_m or 0) + (exp_prev_m or 0))
+
+    return {
+        "name": comm.label,
+        "name_zh": comm.label_zh,
+        "export_cad_millions": exp_m,
+        "import_cad_millions": imp_m,
+        "balance_cad_millions": balance,
+        "trend": trend,
+    }
+
+
+def _item_points(item: _WdsItem) -> list[_WdsDataPoint]:
+    """Return the data points of a WDS result item ([] if it has none)."""
+    obj = item.object
+    if not isinstance(obj, _WdsObject):
+        return []
+    return obj.vector_data_point or []
+
+
+def _item_coordinate(item: _WdsItem) -> str:
+    """Return the coordinate of a WDS result item, or "" if it has none.
+
+    Failed items may carry an error string instead of an ``object``.
+    """
+    obj = item.object
+    return obj.coordinate if isinstance(obj, _WdsObject) else ""
+
+
+def _slim_commodity_item(item: _WdsItem) -> _WdsItem:
+    """Keep only the last two data points of a commodity result item.
+
+    Only the latest and previous values are used, so the remaining
+    requested points are dropped before the item is mapped.
+    """
+    obj = item.object
+    if not isinstance(obj, _WdsObject) or len(obj.vector_data_point or ()) <= 2:
+        return item
+    return msgspec.structs.replace(
+        item,
+        object=msgspec.structs.replace(obj, vector_data_point=obj.vector_data_point[-2:]),
+    )
+
+
+def _split_queries(queries: list[tuple[int, str]]) -> list[list[tuple[int, str]]]:
+    """Split a batch into one request per aggregate series plus the rest.
+
+    Used with ``parallel_series`` so the aggregate series are answered
+    concurrently instead of inside one batch; order is preserved.
+    """
+    groups = [[query] for query in queries if query[0] == TABLE_PID]
+    others = [query for query in queries if query[0] != TABLE_PID]
+    if others:
+        groups.append(others)
+    return groups
+
+
+def _wds_error(exc: BaseException) -> str | None:
+    """Describe a recoverable WDS query failure, or None for anything else."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return f"HTTP {exc.response.status_code}"
+    if isinstance(exc, httpx.RequestError):
+        return str(exc)
+    if isinstance(exc, msgspec.DecodeError):
+        return f"Invalid WDS response: {exc}"
+    return None
+
+
+def _build_commodities(
+    result_by_coord: dict[str, _WdsItem],
+    failed_status: dict[str, str],
 ) -> list[dict[str, Any]]:
-    """Fetch commodity-level Canada-China trade data from table 12-10-0175-01.
+    """Build commodity records from results in table 12-10-0175-01.
 
-    Makes a single batched WDS API call for all commodity coordinates.
     Values from the API are in CAD x 1,000 and are converted to millions.
+    Commodities with neither side available are skipped.
 
     Args:
-        client: An open ``httpx.AsyncClient``.
-        base_url: StatCan WDS base URL.
-        timeout: Request timeout in seconds.
-        periods: Number of most-recent periods to request.
+        result_by_coord: Successful (slimmed) result items by coordinate.
+        failed_status: Non-SUCCESS statuses by coordinate, reported when
+            a side is missing.
 
     Returns:
         A list of commodity dicts, each containing ``name``, ``name_zh``,
         ``export_cad_millions``, ``import_cad_millions``,
-        ``balance_cad_millions``, and ``trend``.  Returns an empty list
-        if the overall request fails.
+        ``balance_cad_millions``, and ``trend``.
     """
-    # Build a single batched payload for all commodity coordinates.
-    # Each commodity needs two entries: one for imports, one for exports.
-    payload: list[dict[str, Any]] = []
-    for comm in COMMODITY_COORDS:
-        payload.append({
-            "productId": COMMODITY_TABLE_PID,
-            "coordinate": comm["import_coordinate"],
-            "latestN": periods,
-        })
-        payload.append({
-            "productId": COMMODITY_TABLE_PID,
-            "coordinate": comm["export_coordinate"],
-            "latestN": periods,
-        })
-
-    try:
-        resp = await client.post(
-            f"{base_url}/getDataFromCubePidCoordAndLatestNPeriods",
-            json=payload,
-            timeout=timeout,
-        )
-        resp.raise_for_status()
-        results = resp.json()
-    except httpx.HTTPStatusError as exc:
-        logger.warning(
-            "StatCan commodity query HTTP error: %s -- returning empty commodities",
-            exc.response.status_code,
-        )
-        return []
-    except httpx.RequestError as exc:
-        logger.warning(
-            "StatCan commodity query failed: %s -- returning empty commodities",
-            exc,
-        )
-        return []
-
-    # The WDS batch API does NOT preserve request order — results are
-    # sorted by vectorId.  Map results back by coordinate string.
-    result_by_coord: dict[str, dict[str, Any]] = {}
-    for item in results:
-        if item.get("status") == "SUCCESS":
-            coord = item.get("object", {}).get("coordinate", "")
-            result_by_coord[coord] = item
-
     commodities: list[dict[str, Any]] = []
 
     for comm in COMMODITY_COORDS:
-        import_item = result_by_coord.get(comm["import_coordinate"], {})
-        export_item = result_by_coord.get(comm["export_coordinate"], {})
-
-        # --- imports -------------------------------------------------------
-        import_latest: float | None = None
-        import_previous: float | None = None
-        if import_item:
-            pts = import_item.get("object", {}).get("vectorDataPoint", [])
-            import_latest, import_previous = _extract_latest_and_previous(pts)
-        else:
-            logger.warning(
-                "StatCan commodity %s import not found for coordinate %s",
-                comm["label"],
-                comm["import_coordinate"],
-            )
-
-        # --- exports -------------------------------------------------------
-        export_latest: float | None = None
-        export_previous: float | None = None
-        if export_item:
-            pts = export_item.get("object", {}).get("vectorDataPoint", [])
-            export_latest, export_previous = _extract_latest_and_previous(pts)
-        else:
-            logger.warning(
-                "StatCan commodity %s export not found for coordinate %s",
-                comm["label"],
-                comm["export_coordinate"],
-            )
+        sides: list[tuple[float | None, float | None]] = []
+        for side, coord in (
+            ("import", comm.import_coordinate),
+            ("export", comm.export_coordinate),
+        ):
+            item = result_by_coord.get(coord)
+            if item is not None:
+                sides.append(_extract_latest_and_previous(_item_points(item)))
+            else:
+                # Skip building the arguments when warnings are filtered out
+                if logger.isEnabledFor(logging.WARNING):
+                    logger.warning(
+                        "StatCan commodity %s %s not found for coordinate %s (status: %s)",
+                        comm.label, side, coord, failed_status.get(coord, "no result"),
+                    )
+                sides.append((None, None))
+        (import_latest, import_previous), (export_latest, export_previous) = sides
 
         # Skip entirely if both sides failed
         if import_latest is None and export_latest is None:
             continue
 
-        imp_m = _to_millions(import_latest)
-        exp_m = _to_millions(export_latest)
-        imp_prev_m = _to_millions(import_previous)
-        exp_prev_m = _to_millions(export_previous)
-
-        # Balance = exports - imports (positive means Canada exports more)
-        balance: float | None = None
-        if exp_m is not None and imp_m is not None:
-            balance = round(exp_m - imp_m, 1)
-
-        # Trend is based on total trade volume (imports + exports)
-        total_latest = (imp_m or 0) + (exp_m or 0)
-        total_previous = (imp_prev_m or 0) + (exp_prev_m or 0)
-        trend = _determine_trend(total_latest, total_previous)
-
-        commodities.append({
-            "name": comm["label"],
-            "name_zh": comm["label_zh"],
-            "export_cad_millions": exp_m,
-            "import_cad_millions": imp_m,
-            "balance_cad_millions": balance,
-            "trend": trend,
-        })
+        commodities.append(_commodity_record(
+            comm, import_latest, import_previous, export_latest, export_previous,
+        ))
 
     return commodities
 
@@ -299,8 +471,17 @@ async def _fetch_commodities(
 async def fetch(config: SourceConfig, date: str, *, client=None, **kwargs) -> dict[str, Any]:
     """Fetch bilateral trade data from Statistics Canada WDS.
 
+    The aggregate series and every commodity coordinate go out in a
+    single batched WDS query; with ``parallel_series`` set, each
+    aggregate series is instead sent as its own concurrent POST alongside
+    the commodity batch.  Failed requests only produce an error when no
+    aggregate series could be obtained; otherwise the series that did
+    answer are kept.
+
     Args:
-        config: Source configuration with base_url, timeout.
+        config: Source configuration with base_url, timeout, and optional
+            periods, parallel_series and series_format ("rows" or
+            "columnar").
         date: Target date (YYYY-MM-DD).
         client: Optional shared httpx.AsyncClient.
 
@@ -310,83 +491,104 @@ async def fetch(config: SourceConfig, date: str, *, client=None, **kwargs) -> di
     """
     base_url = config.get("base_url", WDS_BASE)
     periods = config.get("periods", 3)
+    series_format = config.get("series_format", "rows")
+    parallel_series = bool(config.get("parallel_series", False))
     timeout = config.timeout
 
-    payload = [
-        {
-            "productId": TABLE_PID,
-            "coordinate": coord["coordinate"],
-            "latestN": periods,
-        }
-        for coord in TRADE_COORDS
-    ]
-
+    queries = [*_TRADE_QUERIES, *_COMMODITY_QUERIES]
+    groups = _split_queries(queries) if parallel_series else [queries]
     should_close = client is None
-    _client = client or httpx.AsyncClient(timeout=timeout)
+    _client = client or create_client(timeout=timeout)
     try:
-        try:
-            resp = await _client.post(
-                f"{base_url}/getDataFromCubePidCoordAndLatestNPeriods",
-                json=payload,
-                timeout=timeout,
-            )
-            resp.raise_for_status()
-            results = resp.json()
-        except httpx.HTTPStatusError as exc:
-            logger.error("StatCan WDS error: HTTP %s", exc.response.status_code)
-            return {
-                "date": date,
-                "error": f"HTTP {exc.response.status_code}",
-                "commodities": [],
-                "totals": {},
-            }
-        except httpx.RequestError as exc:
-            logger.error("StatCan WDS request failed: %s", exc)
+        outcomes = await asyncio.gather(*[
+            _query_wds(_client, base_url, _wds_payload(tuple(group), periods), timeout)
+            for group in groups
+        ], return_exceptions=True)
+    finally:
+        if should_close:
+            await _client.aclose()
+
+    # Items in request order per request; None where that request failed
+    aligned: list[_WdsItem | None] = []
+    errors: list[str] = []
+    for group, outcome in zip(groups, outcomes):
+        if not isinstance(outcome, BaseException):
+            aligned.extend(outcome)
+            continue
+        error = _wds_error(outcome)
+        if error is None:
+            raise outcome
+        errors.append(error)
+        aligned.extend([None] * len(group))
+
+    if errors:
+        error = "; ".join(errors)
+        # Aggregate queries come first; fail only if none of them answered
+        if all(item is None for item in aligned[:len(TRADE_COORDS)]):
+            logger.error("StatCan WDS request failed: %s", error)
             return {
                 "date": date,
-                "error": str(exc),
+                "error": error,
                 "commodities": [],
                 "totals": {},
             }
+        logger.warning("StatCan WDS query failed: %s", error)
+    results = [item for item in aligned if item is not None]
 
-        # Fetch commodity breakdowns (tolerates failures gracefully)
-        commodities = await _fetch_commodities(_client, base_url, timeout, periods)
-    finally:
-        if should_close:
-            await _client.aclose()
+    # The WDS batch API does NOT preserve request order -- results are
+    # sorted by vectorId.  Map results back by coordinate string.
+    by_coord = {_item_coordinate(item): item for item in results}
+    result_by_coord: dict[str, _WdsItem] = {}
+    failed_status: dict[str, str] = {}
+    for coord, item in by_coord.items():
+        if coord not in _COMMODITY_COORDINATES:
+            continue
+        if item.status == "SUCCESS":
+            result_by_coord[coord] = _slim_commodity_item(item)
+        else:
+            failed_status[coord] = item.status
 
-    # Parse aggregate results
-    series: dict[str, list[dict[str, Any]]] = {}
+    # Position is only a fallback for aggregate items (requested first)
+    # that do not echo their coordinate.
+    aggregate: list[_WdsItem] = []
     for i, coord in enumerate(TRADE_COORDS):
-        label = coord["label"]
-        item = results[i] if i < len(results) else {}
-
-        if item.get("status") != "SUCCESS":
-            logger.warning("StatCan %s query failed: %s", label, item.get("status"))
-            series[label] = []
+        item = by_coord.get(coord.coordinate)
+        if item is None and i < len(aligned) and aligned[i] is not None:
+            if not _item_coordinate(aligned[i]):
+                item = aligned[i]
+        aggregate.append(item if item is not None else _WdsItem())
+
+    commodities = (
+        _build_commodities(result_by_coord, failed_status) if result_by_coord else []
+    )
+
+    # Parse aggregate results into parallel period/value columns
+    columns: dict[str, SeriesColumns] = {}
+    for coord, item in zip(TRADE_COORDS, aggregate):
+        label = coord.label
+        if item.status != "SUCCESS":
+            logger.warning("StatCan %s query failed: %s", label, item.status or None)
+            columns[label] = ([], [], "")
             continue
 
-        points = item.get("object", {}).get("vectorDataPoint", [])
-        scalar_code = points[0].get("scalarFactorCode", 6) if points else 6
-        scalar_label = SCALAR_LABELS.get(scalar_code, "")
+        points = _item_points(item)
+        scalar_code = points[0].scalar_factor_code if points else 6
+        columns[label] = (
+            [p.ref_per for p in points],
+            [_point_value(p) for p in points],
+            SCALAR_LABELS.get(scalar_code, ""),
+        )
 
-        series[label] = [
-            {
-                "period": p.get("refPer", ""),
-                "value": p.get("value"),
-                "scalar": scalar_label,
-            }
-            for p in points
-        ]
+    series = {label: _format_series(cols, series_format) for label, cols in columns.items()}
 
     # Build summary from most recent period
-    imports_series = series.get("Imports from China", [])
-    exports_series = series.get("Exports to China", [])
+    import_periods, import_values, _ = columns.get("Imports from China", ([], [], ""))
+    export_periods, export_values, _ = columns.get("Exports to China", ([], [], ""))
 
-    latest_imports = imports_series[-1]["value"] if imports_series else None
-    latest_exports = exports_series[-1]["value"] if exports_series else None
-    latest_period = (imports_series[-1]["period"] if imports_series
-                     else exports_series[-1]["period"] if exports_series
+    latest_imports = import_values[-1] if import_values else None
+    latest_exports = export_values[-1] if export_values else None
+    latest_period = (import_periods[-1] if import_periods
+                     else export_periods[-1] if export_periods
                      else "")
 
     balance = None
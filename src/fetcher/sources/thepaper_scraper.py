@@ -14,9 +14,12 @@ from datetime import datetime
 from typing import Any
 
 import httpx
-from bs4 import BeautifulSoup
+from lxml import etree
 
 from fetcher.config import SourceConfig
+from fetcher.http import ZH_BROWSER_HEADERS, create_client, get_text_capped
+from fetcher.sources._html import has_class, parse_html, stripped_text
+from fetcher.sources._keywords import contains_keyword
 from fetcher.sources._registry import register_source
 
 logger = logging.getLogger(__name__)
@@ -24,6 +27,11 @@ logger = logging.getLogger(__name__)
 # The Paper uses a JSON API for article listings
 THEPAPER_API = "https://www.thepaper.cn/load_index.jsp"
 
+# Article body fetches: at most this many in flight, and request starts
+# spaced this many seconds apart (<= 10 new requests per second)
+BODY_CONCURRENCY = 16
+BODY_START_INTERVAL = 0.1
+
 # Channel IDs for relevant sections
 CHANNELS = [
     {"id": "25950", "name": "澎湃国际"},  # International
@@ -47,12 +55,20 @@ RELEVANCE_KEYWORDS = [
     "科技战", "tech war",
     "脱钩", "decoupling",
 ]
+_RELEVANCE_KEYWORDS = tuple(RELEVANCE_KEYWORDS)
+
+
+# Publish dates on article pages: 2025-01-17 or 2025年01月17日
+_DATE_ISO = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+_DATE_CN = re.compile(r"(\d{4})年(\d{2})月(\d{2})日")
+
+# Article links on channel pages
+_ARTICLE_LINKS = etree.XPath("//a[contains(@href, 'newsDetail')]")
 
 
 def _is_relevant(text: str) -> bool:
     """Check if article text contains relevant keywords."""
-    text_lower = text.lower()
-    return any(kw.lower() in text_lower for kw in RELEVANCE_KEYWORDS)
+    return contains_keyword(_RELEVANCE_KEYWORDS, text)
 
 
 async def _fetch_channel_articles(
@@ -62,21 +78,24 @@ async def _fetch_channel_articles(
 ) -> list[dict[str, Any]]:
     """Fetch articles from a channel using The Paper's API."""
     articles = []
+    seen_urls: set[str] = set()
 
     # The Paper uses a custom API endpoint
     url = f"https://www.thepaper.cn/channel_{channel['id']}"
 
     try:
-        resp = await client.get(url, timeout=timeout)
+        resp = await client.get(url, headers=ZH_BROWSER_HEADERS, timeout=timeout)
         resp.raise_for_status()
     except (httpx.HTTPStatusError, httpx.RequestError) as exc:
         logger.warning("Failed to fetch The Paper channel %s: %s", channel["name"], exc)
         return []
 
-    soup = BeautifulSoup(resp.text, "html.parser")
+    tree = parse_html(resp.text)
+    if tree is None:
+        return []
 
     # Find article links
-    for link in soup.select("a[href*='newsDetail']"):
+    for link in _ARTICLE_LINKS(tree):
         href = link.get("href", "")
         if not href:
             continue
@@ -85,13 +104,14 @@ async def _fetch_channel_articles(
         if href.startswith("/"):
             href = "https://www.thepaper.cn" + href
 
-        title = link.get_text(strip=True)
+        title = stripped_text(link)
         if not title or len(title) < 5:
             continue
 
         # Skip duplicates
-        if any(a["url"] == href for a in articles):
+        if href in seen_urls:
             continue
+        seen_urls.add(href)
 
         articles.append({
             "title": title,
@@ -104,6 +124,52 @@ async def _fetch_channel_articles(
     return articles[:15]  # Limit per channel
 
 
+# Elements dropped before extraction (their tail text is kept)
+_NOISE_TAGS = ("script", "style", "nav", "footer", "aside")
+
+# Article content containers, in order of preference
+_CONTENT_XPATHS = [
+    etree.XPath(xpath)
+    for xpath in [
+        f"//*[{has_class('news_txt')}]",
+        f"//*[{has_class('newsDetail_content')}]",
+        f"//*[{has_class('content_txt')}]",
+        "//article",
+    ]
+]
+
+
+def _parse_article_page(html: str) -> tuple[str, str | None]:
+    """Extract the body text and publish date from an article page.
+
+    Returns:
+        ``(body_text, date)``; body_text is "" and date is None when
+        not found.
+    """
+    tree = parse_html(html)
+    if tree is None:
+        return "", None
+
+    etree.strip_elements(tree, *_NOISE_TAGS, with_tail=False)
+
+    body_text = ""
+    for xpath in _CONTENT_XPATHS:
+        matches = xpath(tree)
+        if matches:
+            paragraphs = matches[0].iterdescendants("p")
+            texts = (stripped_text(p) for p in paragraphs)
+            body_text = " ".join(text for text in texts if text)
+            if body_text:
+                break
+
+    page_text = tree.text_content()
+    for pattern in (_DATE_ISO, _DATE_CN):
+        match = pattern.search(page_text)
+        if match:
+            return body_text, "-".join(match.groups())
+    return body_text, None
+
+
 async def _fetch_article_body(
     client: httpx.AsyncClient,
     article: dict[str, Any],
@@ -111,69 +177,32 @@ async def _fetch_article_body(
 ) -> None:
     """Fetch and extract the full article body."""
     try:
-        resp = await client.get(article["url"], timeout=timeout)
-        resp.raise_for_status()
+        html = await get_text_capped(
+            client, article["url"], headers=ZH_BROWSER_HEADERS, timeout=timeout,
+        )
     except (httpx.HTTPStatusError, httpx.RequestError) as exc:
         logger.debug("Failed to fetch article %s: %s", article["url"], exc)
         return
 
-    soup = BeautifulSoup(resp.text, "html.parser")
-
-    # Remove unwanted elements
-    for tag in soup.find_all(["script", "style", "nav", "footer", "aside"]):
-        tag.decompose()
-
-    # Try to find article content
-    content_selectors = [
-        ".news_txt",
-        ".newsDetail_content",
-        ".content_txt",
-        "article",
-    ]
-
-    body_text = ""
-    for selector in content_selectors:
-        container = soup.select_one(selector)
-        if container:
-            paragraphs = container.find_all("p")
-            body_text = " ".join(p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True))
-            if body_text:
-                break
-
+    body_text, date = _parse_article_page(html)
     if body_text:
         article["body_text"] = body_text[:10000]
         article["body_snippet"] = body_text[:500]
-
-    # Try to find publish date
-    date_patterns = [
-        r"(\d{4})-(\d{2})-(\d{2})",
-        r"(\d{4})年(\d{2})月(\d{2})日",
-    ]
-
-    page_text = soup.get_text()
-    for pattern in date_patterns:
-        match = re.search(pattern, page_text)
-        if match:
-            try:
-                if "年" in pattern:
-                    article["date"] = f"{match.group(1)}-{match.group(2)}-{match.group(3)}"
-                else:
-                    article["date"] = f"{match.group(1)}-{match.group(2)}-{match.group(3)}"
-                break
-            except (ValueError, IndexError):
-                continue
+    if date:
+        article["date"] = date
 
 
 @register_source("thepaper")
-async def fetch(config: SourceConfig, date: str, **kwargs) -> dict[str, Any]:
+async def fetch(config: SourceConfig, date: str, *, client=None, **kwargs) -> dict[str, Any]:
     """Fetch articles from The Paper by web scraping.
 
-    Creates its own client with custom User-Agent headers required
-    by The Paper. The shared ``client`` kwarg is accepted but not used.
+    The browser User-Agent The Paper requires is sent per request, so the
+    shared client is reused when one is given.
 
     Args:
         config: Source configuration.
         date: Target date string (YYYY-MM-DD).
+        client: Optional shared httpx.AsyncClient.
 
     Returns:
         Dict with articles, counts, and metadata.
@@ -188,36 +217,43 @@ async def fetch(config: SourceConfig, date: str, **kwargs) -> dict[str, Any]:
 
     all_articles: list[dict[str, Any]] = []
 
-    async with httpx.AsyncClient(
-        follow_redirects=True,
-        headers={
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
-        }
-    ) as client:
+    should_close = client is None
+    _client = client or create_client(timeout=config.timeout)
+    try:
         # Fetch each channel
         for channel in CHANNELS:
             result["channels_checked"] += 1
-            channel_articles = await _fetch_channel_articles(client, channel, config.timeout)
+            channel_articles = await _fetch_channel_articles(_client, channel, config.timeout)
             all_articles.extend(channel_articles)
             await asyncio.sleep(1)  # Rate limiting
 
-        # Fetch article bodies concurrently
-        sem = asyncio.Semaphore(5)
+        # Fetch article bodies concurrently.  Each task that gets a slot
+        # reserves the next start time, so starts stay at least
+        # BODY_START_INTERVAL apart even when several slots free at once.
+        sem = asyncio.Semaphore(BODY_CONCURRENCY)
+        loop = asyncio.get_running_loop()
+        next_start = loop.time()
 
         async def fetch_with_sem(article: dict[str, Any]) -> None:
+            nonlocal next_start
             async with sem:
-                await _fetch_article_body(client, article, config.timeout)
-                await asyncio.sleep(0.5)
+                now = loop.time()
+                start = max(now, next_start)
+                next_start = start + BODY_START_INTERVAL
+                await asyncio.sleep(start - now)
+                await _fetch_article_body(_client, article, config.timeout)
 
         await asyncio.gather(*[fetch_with_sem(a) for a in all_articles])
-
-    # Filter for relevant articles
-    relevant = []
-    for article in all_articles:
-        text = f"{article.get('title', '')} {article.get('body_snippet', '')}"
-        if _is_relevant(text):
-            relevant.append(article)
+    finally:
+        if should_close:
+            await _client.aclose()
+
+    # Filter for relevant articles; the snippet is only checked when the
+    # title does not already match
+    relevant = [
+        article for article in all_articles
+        if _is_relevant(article.get("title", "")) or _is_relevant(article.get("body_snippet", ""))
+    ]
 
     result["articles"] = relevant
     result["total_articles"] = len(relevant)
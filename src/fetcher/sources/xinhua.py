@@ -5,21 +5,24 @@ Scrapes Xinhua English section pages (english.news.cn) for:
   - Foreign policy and geopolitical news
   - Economic and infrastructure announcements
 
-Uses BeautifulSoup for HTML parsing.
+Pages are parsed with lxml and queried with precompiled XPath.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
 from typing import Any
 from urllib.parse import urljoin
 
 import httpx
-from bs4 import BeautifulSoup
+from lxml import etree
 
 from fetcher.config import SourceConfig
-from fetcher.http import request_with_retry
+from fetcher.http import create_client, get_text_capped, request_with_retry
+from fetcher.sources._html import has_class, parse_html, stripped_text
+from fetcher.sources._keywords import matched_keywords
 from fetcher.sources._registry import register_source
 
 logger = logging.getLogger(__name__)
@@ -55,6 +58,59 @@ CHINA_INDICATORS = [
     "China", "Chinese", "Beijing", "PRC", "mainland",
 ]
 
+# Section pages are only parsed up to this many characters, and at most
+# this many article elements are read from each (``max_page_chars`` /
+# ``max_page_articles`` settings)
+MAX_PAGE_CHARS = 256 * 1024
+MAX_PAGE_ARTICLES = 50
+
+# Xinhua article body containers (in order of preference).  Each is paired
+# with a string the raw HTML must contain for it to match, so containers of
+# other layouts are skipped without evaluating their XPath.
+_BODY_CONTAINERS = [
+    (marker, etree.XPath(xpath))
+    for marker, xpath in [
+        ("detail_con", f"//div[{has_class('detail_con')}]"),  # Main article container
+        ("detail", "//div[@id='detail']"),
+        ("article-body", f"//div[{has_class('article-body')}]"),
+        ("content", f"//div[{has_class('content')}]"),
+        ("", "//article//p"),
+        ("story", f"//div[{has_class('story')}]//p"),
+    ]
+]
+_ALL_PARAGRAPHS = etree.XPath("//p")
+
+# Xinhua uses various article list containers; the first that matches wins
+_ARTICLE_XPATHS = [
+    etree.XPath(xpath)
+    for xpath in [
+        f"//div[{has_class('news_item')}]",
+        f"//div[{has_class('tit')}]",
+        f"//li[{has_class('clearfix')}]",
+        f"//div[{has_class('part_01')}]//li",
+        f"//div[{has_class('dataList')}]//li",
+        "//article",
+        f"//div[{has_class('story')}]",
+    ]
+]
+
+# Parts of an article list element: link, body snippet and date.  The
+# snippet and date each try a preferred tag first, then a fallback.
+_ALL_LINKS = etree.XPath("//a[@href]")
+_FIRST_LINK = etree.XPath("descendant::a[1]")
+_BODY_XPATHS = (
+    etree.XPath("descendant::p[1]"),
+    etree.XPath(f"descendant::div[{has_class('des')}][1]"),
+)
+_DATE_XPATHS = (
+    etree.XPath(f"descendant::span[{has_class('time')}][1]"),
+    etree.XPath("descendant::em[1]"),
+)
+
+# Article URLs carry their date, e.g. /2026-01/29/c_xxxxx.htm
+_ARTICLE_LINK = re.compile(r"/\d{4}-\d{2}/\d{2}/")
+_URL_DATE = re.compile(r"/(\d{4}-\d{2})/(\d{2})/")
+
 
 def _extract_article_body(html: str) -> str:
     """Extract article body text from a Xinhua article page.
@@ -65,97 +121,100 @@ def _extract_article_body(html: str) -> str:
     Returns:
         Extracted body text, or empty string if not found.
     """
-    soup = BeautifulSoup(html, "html.parser")
-
-    # Xinhua article body selectors (in order of preference)
-    body_selectors = [
-        "div.detail_con",  # Main article container
-        "div#detail",
-        "div.article-body",
-        "div.content",
-        "article p",
-        "div.story p",
-    ]
+    tree = parse_html(html)
+    if tree is None:
+        return ""
 
-    for selector in body_selectors:
-        container = soup.select_one(selector)
-        if container:
+    for marker, xpath in _BODY_CONTAINERS:
+        if marker not in html:
+            continue
+        containers = xpath(tree)
+        if containers:
             # Get all paragraph text
-            paragraphs = container.find_all("p")
-            if paragraphs:
-                text = " ".join(p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True))
-                if len(text) > 50:  # Meaningful content
-                    return text[:10000]  # Cap at 10000 chars for full Chinese articles
+            texts = (stripped_text(p) for p in containers[0].iterdescendants("p"))
+            text = " ".join(t for t in texts if t)
+            if len(text) > 50:  # Meaningful content
+                return text[:10000]  # Cap at 10000 chars for full Chinese articles
 
     # Fallback: find any substantial paragraph content
-    all_paragraphs = soup.find_all("p")
-    texts = [p.get_text(strip=True) for p in all_paragraphs if len(p.get_text(strip=True)) > 50]
+    texts = [t for t in map(stripped_text, _ALL_PARAGRAPHS(tree)) if len(t) > 50]
     if texts:
         return " ".join(texts[:10])[:10000]  # More paragraphs, higher limit for Chinese
 
     return ""
 
 
-def _extract_articles_from_html(html: str, base_url: str) -> list[dict[str, Any]]:
+def _first_match(elem: etree._Element, xpaths: tuple[etree.XPath, ...]) -> etree._Element | None:
+    """Return the first element found by *xpaths*, tried in order."""
+    for xpath in xpaths:
+        matches = xpath(elem)
+        if matches:
+            return matches[0]
+    return None
+
+
+def _extract_articles_from_html(
+    html: str,
+    base_url: str,
+    max_chars: int = MAX_PAGE_CHARS,
+    max_articles: int = MAX_PAGE_ARTICLES,
+) -> list[dict[str, Any]]:
     """Parse Xinhua HTML page and extract article data.
 
+    Only the first *max_chars* of the page are parsed (article lists sit
+    near the top; the tail is footers and scripts), and at most
+    *max_articles* matching elements are read.
+
     Args:
         html: Raw HTML content.
         base_url: Base URL for resolving relative links.
+        max_chars: Number of leading characters of *html* to parse.
+        max_articles: Maximum number of article elements to read.
 
     Returns:
         List of article dictionaries.
     """
-    soup = BeautifulSoup(html, "html.parser")
+    tree = parse_html(html[:max_chars])
+    if tree is None:
+        return []
     articles: list[dict[str, Any]] = []
 
-    # Xinhua uses various container patterns; try common selectors
-    article_selectors = [
-        "div.news_item",
-        "div.tit",
-        "li.clearfix",
-        "div.part_01 li",
-        "div.dataList li",
-        "article",
-        "div.story",
-    ]
-
     elements: list = []
-    for selector in article_selectors:
-        elements = soup.select(selector)
+    for xpath in _ARTICLE_XPATHS:
+        elements = xpath(tree)
         if elements:
             break
 
     # Fallback: find all links that look like article links
     if not elements:
-        elements = soup.find_all("a", href=re.compile(r"/\d{4}-\d{2}/\d{2}/"))
+        elements = [a for a in _ALL_LINKS(tree) if _ARTICLE_LINK.search(a.get("href"))]
 
-    for elem in elements:
+    for elem in elements[:max_articles]:
         title = ""
         url = ""
         body = ""
         date = ""
 
-        if elem.name == "a":
-            title = elem.get_text(strip=True)
+        if elem.tag == "a":
+            title = stripped_text(elem)
             url = elem.get("href", "")
         else:
-            link_tag = elem.find("a")
-            if link_tag:
-                title = link_tag.get_text(strip=True)
-                url = link_tag.get("href", "")
+            links = _FIRST_LINK(elem)
+            if links:
+                title = stripped_text(links[0])
+                url = links[0].get("href", "")
             else:
-                title = elem.get_text(strip=True)
+                title = stripped_text(elem)
 
             # Try to find a body snippet
-            body_tag = elem.find("p") or elem.find("div", class_="des")
-            if body_tag:
-                body = body_tag.get_text(strip=True)
+            body_tag = _first_match(elem, _BODY_XPATHS)
+            if body_tag is not None:
+                body = stripped_text(body_tag)
 
             # Try to find a date
-            date_tag = elem.find("span", class_="time") or elem.find("em")
-            if date_tag:
-                date = date_tag.get_text(strip=True)
+            date_tag = _first_match(elem, _DATE_XPATHS)
+            if date_tag is not None:
+                date = stripped_text(date_tag)
 
         if not title:
             continue
@@ -166,7 +225,7 @@ def _extract_articles_from_html(html: str, base_url: str) -> list[dict[str, Any]
 
         # Try to extract date from URL pattern like /2026-01/29/c_xxxxx.htm
         if not date and url:
-            url_date_match = re.search(r"/(\d{4}-\d{2})/(\d{2})/", url)
+            url_date_match = _URL_DATE.search(url)
             if url_date_match:
                 date = f"{url_date_match.group(1)}-{url_date_match.group(2)}"
 
@@ -200,9 +259,9 @@ async def _fetch_article_body(
         return
 
     try:
-        resp = await client.get(url, timeout=timeout)
-        resp.raise_for_status()
-        body_text = _extract_article_body(resp.text)
+        html = await get_text_capped(client, url, timeout=timeout)
+        # Parse in a worker thread so other body fetches keep progressing
+        body_text = await asyncio.to_thread(_extract_article_body, html)
         if body_text:
             article["body_text"] = body_text
             # Also update body snippet for filtering
@@ -212,11 +271,6 @@ async def _fetch_article_body(
         logger.debug("Failed to fetch article body from %s: %s", url, exc)
 
 
-def _kw_match(keyword: str, text: str) -> bool:
-    """Match a keyword against text using word boundaries."""
-    return bool(re.search(r'\b' + re.escape(keyword) + r'\b', text, re.IGNORECASE))
-
-
 def _filter_relevant(
     articles: list[dict[str, Any]],
     canada_keywords: list[str],
@@ -229,34 +283,34 @@ def _filter_relevant(
     Beijing/PRC/mainland) unless they matched a Canada keyword.
     """
     filtered: list[dict[str, Any]] = []
+    # Canada, policy and China-indicator keywords share one scan per field
+    all_keywords = (*canada_keywords, *policy_keywords, *CHINA_INDICATORS)
 
     for article in articles:
-        searchable = f"{article['title']} {article.get('body', '')}"
+        # Title and body are scanned separately rather than concatenated
+        found = matched_keywords(all_keywords, article["title"])
+        body = article.get("body", "")
+        if body:
+            found |= matched_keywords(all_keywords, body)
+        if not found:
+            continue
         tags: list[str] = []
-        has_canada = False
 
-        for kw in canada_keywords:
-            if _kw_match(kw, searchable):
-                tags.append(f"canada:{kw}")
-                has_canada = True
-                break
+        canada_kw = next((kw for kw in canada_keywords if kw in found), None)
+        if canada_kw is not None:
+            tags.append(f"canada:{canada_kw}")
 
-        for kw in policy_keywords:
-            if _kw_match(kw, searchable):
-                tags.append(f"policy:{kw}")
-                break
+        policy_kw = next((kw for kw in policy_keywords if kw in found), None)
+        if policy_kw is not None:
+            tags.append(f"policy:{policy_kw}")
 
         if not tags:
             continue
 
         # China-context gate: unless the article matched a Canada keyword
         # (inherently bilateral), it must also mention a China indicator.
-        if not has_canada:
-            has_china = any(
-                _kw_match(ci, searchable) for ci in CHINA_INDICATORS
-            )
-            if not has_china:
-                continue
+        if canada_kw is None and found.isdisjoint(CHINA_INDICATORS):
+            continue
 
         article["relevance_tags"] = tags
         filtered.append(article)
@@ -276,9 +330,9 @@ async def fetch(config: SourceConfig, date: str, *, client=None, **kwargs) -> di
     Returns:
         Dictionary with filtered articles and metadata.
     """
-    import asyncio
-
     urls = config.get("section_urls", SECTION_URLS)
+    max_chars = config.get("max_page_chars", MAX_PAGE_CHARS)
+    max_articles = config.get("max_page_articles", MAX_PAGE_ARTICLES)
     timeout = config.timeout
 
     all_articles: list[dict[str, Any]] = []
@@ -286,29 +340,36 @@ async def fetch(config: SourceConfig, date: str, *, client=None, **kwargs) -> di
     errors: list[str] = []
 
     should_close = client is None
-    _client = client or httpx.AsyncClient(follow_redirects=True, timeout=timeout)
+    _client = client or create_client(timeout=timeout)
     try:
-        for url in urls:
-            try:
-                resp = await request_with_retry(
-                    _client, "GET", url,
-                    retry=config.retry,
-                    timeout=timeout,
-                )
-                html = resp.text
-                page_articles = _extract_articles_from_html(html, url)
-                for article in page_articles:
-                    title = article.get("title", "")
-                    if title and title not in seen_titles:
-                        seen_titles.add(title)
-                        all_articles.append(article)
-                logger.info("Xinhua %s: %d articles", url, len(page_articles))
-            except httpx.HTTPStatusError as exc:
-                logger.warning("Xinhua %s HTTP error: %s", url, exc.response.status_code)
-                errors.append(f"{url}: HTTP {exc.response.status_code}")
-            except httpx.RequestError as exc:
-                logger.warning("Xinhua %s request failed: %s", url, exc)
-                errors.append(f"{url}: {exc}")
+        # Section pages are independent; fetch them concurrently and merge
+        # in section order so title de-duplication stays deterministic
+        responses = await asyncio.gather(*[
+            request_with_retry(_client, "GET", url, retry=config.retry, timeout=timeout)
+            for url in urls
+        ], return_exceptions=True)
+
+        for url, resp in zip(urls, responses):
+            if isinstance(resp, httpx.HTTPStatusError):
+                logger.warning("Xinhua %s HTTP error: %s", url, resp.response.status_code)
+                errors.append(f"{url}: HTTP {resp.response.status_code}")
+                continue
+            if isinstance(resp, httpx.RequestError):
+                logger.warning("Xinhua %s request failed: %s", url, resp)
+                errors.append(f"{url}: {resp}")
+                continue
+            if isinstance(resp, BaseException):
+                raise resp
+            page_articles = await asyncio.to_thread(
+                _extract_articles_from_html, resp.text, url, max_chars, max_articles,
+            )
+            for article in page_articles:
+                # Titles differing only in case or spacing are duplicates
+                key = " ".join(article.get("title", "").lower().split())
+                if key and key not in seen_titles:
+                    seen_titles.add(key)
+                    all_articles.append(article)
+            logger.info("Xinhua %s: %d articles", url, len(page_articles))
 
         if not all_articles and errors:
             return {
@@ -17,10 +17,18 @@ Handles market holidays gracefully (returns last available data).
 from __future__ import annotations
 
 import asyncio
+import heapq
 import logging
-from datetime import datetime, timedelta
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from operator import itemgetter
 from typing import Any
 
+import pandas as pd
 import yfinance as yf
 
 from fetcher.config import SourceConfig
@@ -76,346 +84,248 @@ DEFAULT_CURRENCY_PAIRS = [
 SPARKLINE_DAYS = 5
 MOVERS_COUNT = 5
 
+_change_pct = itemgetter("change_pct")
 
-def _fetch_index_data(ticker_symbol: str, name: str, target_date: str) -> dict[str, Any]:
-    """Fetch data for a single market index.
-
-    Args:
-        ticker_symbol: yfinance ticker symbol.
-        name: Human-readable index name.
-        target_date: Target date as YYYY-MM-DD.
+# Maximum yfinance requests in flight at once (``max_workers`` setting)
+MAX_WORKERS = 8
 
-    Returns:
-        Dictionary with index data including value, change, and sparkline.
-    """
-    try:
-        ticker = yf.Ticker(ticker_symbol)
+# Price history is reused for this many seconds across fetch() calls in
+# the same process, keeping at most HISTORY_CACHE_SIZE windows
+HISTORY_CACHE_TTL = 5 * 60
+HISTORY_CACHE_SIZE = 512
 
-        # Fetch recent history for sparkline and current value
-        end_date = datetime.strptime(target_date, "%Y-%m-%d") + timedelta(days=1)
-        start_date = end_date - timedelta(days=SPARKLINE_DAYS + 5)  # extra buffer for holidays
 
-        start_str = start_date.strftime("%Y-%m-%d")
-        end_str = end_date.strftime("%Y-%m-%d")
-        hist = ticker.history(start=start_str, end=end_str)
+@lru_cache(maxsize=32)
+def _parse_date(target_date: str) -> date:
+    """Parse a YYYY-MM-DD target date (memoized; one date per run)."""
+    return datetime.strptime(target_date, "%Y-%m-%d").date()
 
-        if hist.empty:
-            logger.warning(
-                "No data available for %s (%s) near %s",
-                name, ticker_symbol, target_date,
-            )
-            return {
-                "ticker": ticker_symbol,
-                "name": name,
-                "value": None,
-                "change_pct": None,
-                "sparkline": [],
-                "market_holiday": True,
-            }
-
-        # Get the most recent available close prices
-        recent = hist.tail(SPARKLINE_DAYS + 1)
-        closes = recent["Close"].tolist()
-        sparkline = [round(float(c), 2) for c in closes[-SPARKLINE_DAYS:]]
 
-        current_close = float(closes[-1])
-        prev_close = float(closes[-2]) if len(closes) >= 2 else current_close
-        if prev_close:
-            change_pct = round(((current_close - prev_close) / prev_close) * 100, 2)
-        else:
-            change_pct = 0.0
-
-        latest_date = recent.index[-1].strftime("%Y-%m-%d")
-
-        return {
-            "ticker": ticker_symbol,
-            "name": name,
-            "value": round(current_close, 2),
-            "change_pct": change_pct,
-            "prev_close": round(prev_close, 2),
-            "sparkline": sparkline,
-            "latest_date": latest_date,
-            "market_holiday": latest_date != target_date,
-        }
-
-    except Exception as exc:
-        logger.error("Error fetching %s (%s): %s", name, ticker_symbol, exc)
-        return {
-            "ticker": ticker_symbol,
-            "name": name,
-            "value": None,
-            "change_pct": None,
-            "sparkline": [],
-            "error": str(exc),
-        }
-
-
-def _fetch_sector_data(ticker_symbol: str, name: str, target_date: str) -> dict[str, Any]:
-    """Fetch data for a single sector index.
+@lru_cache(maxsize=32)
+def _date_window(target_date: str, lookback_days: int) -> tuple[str, str]:
+    """Return the ``(start, end)`` history window for *target_date*.
 
-    Args:
-        ticker_symbol: yfinance ticker symbol.
-        name: Human-readable sector name.
-        target_date: Target date as YYYY-MM-DD.
-
-    Returns:
-        Dictionary with sector data including value, change_pct, and direction.
+    The window ends the day after *target_date* (yfinance's end is
+    exclusive) and spans *lookback_days*.  Every ticker in a run shares
+    the same target date, so the parsing and formatting is memoized.
     """
-    try:
-        ticker = yf.Ticker(ticker_symbol)
-
-        end_date = datetime.strptime(target_date, "%Y-%m-%d") + timedelta(days=1)
-        start_date = end_date - timedelta(days=10)  # buffer for holidays
-
-        start_str = start_date.strftime("%Y-%m-%d")
-        end_str = end_date.strftime("%Y-%m-%d")
-        hist = ticker.history(start=start_str, end=end_str)
-
-        if hist.empty:
-            logger.warning(
-                "No sector data available for %s (%s) near %s",
-                name, ticker_symbol, target_date,
-            )
-            return {
-                "ticker": ticker_symbol,
-                "name": name,
-                "index_name": name,
-                "value": None,
-                "change_pct": None,
-                "direction": "unchanged",
-            }
-
-        closes = hist["Close"].tolist()
-        current_close = float(closes[-1])
-        prev_close = float(closes[-2]) if len(closes) >= 2 else current_close
+    end_date = _parse_date(target_date) + timedelta(days=1)
+    start_date = end_date - timedelta(days=lookback_days)
+    return start_date.strftime("%Y-%m-%d"), end_date.strftime("%Y-%m-%d")
 
-        if prev_close:
-            change_pct = round(((current_close - prev_close) / prev_close) * 100, 2)
-        else:
-            change_pct = 0.0
 
-        if change_pct > 0:
-            direction = "up"
-        elif change_pct < 0:
-            direction = "down"
-        else:
-            direction = "unchanged"
+@lru_cache(maxsize=256)
+def _ticker(ticker_symbol: str) -> yf.Ticker:
+    """Return the process-wide ``yf.Ticker`` for *ticker_symbol*.
 
-        return {
-            "ticker": ticker_symbol,
-            "name": name,
-            "index_name": name,
-            "value": round(current_close, 2),
-            "change_pct": change_pct,
-            "direction": direction,
-        }
-
-    except Exception as exc:
-        logger.error("Error fetching sector %s (%s): %s", name, ticker_symbol, exc)
-        return {
-            "ticker": ticker_symbol,
-            "name": name,
-            "index_name": name,
-            "value": None,
-            "change_pct": None,
-            "direction": "unchanged",
-            "error": str(exc),
-        }
-
-
-def _fetch_stock_data(ticker_symbol: str, name: str, target_date: str) -> dict[str, Any]:
-    """Fetch data for a single stock from the watchlist.
-
-    Args:
-        ticker_symbol: yfinance ticker symbol.
-        name: Human-readable stock name.
-        target_date: Target date as YYYY-MM-DD.
-
-    Returns:
-        Dictionary with stock data including close, change_pct, and prev_close.
+    Ticker objects hold per-symbol state (timezone, metadata) that
+    yfinance otherwise looks up again for every new instance, so one is
+    kept per symbol across fetches.
     """
-    try:
-        ticker = yf.Ticker(ticker_symbol)
-
-        end_date = datetime.strptime(target_date, "%Y-%m-%d") + timedelta(days=1)
-        start_date = end_date - timedelta(days=10)  # buffer for holidays
-
-        start_str = start_date.strftime("%Y-%m-%d")
-        end_str = end_date.strftime("%Y-%m-%d")
-        hist = ticker.history(start=start_str, end=end_str)
-
-        if hist.empty:
-            logger.warning(
-                "No stock data available for %s (%s) near %s",
-                name, ticker_symbol, target_date,
-            )
-            return {
-                "ticker": ticker_symbol,
-                "name": name,
-                "close": None,
-                "change_pct": None,
-                "prev_close": None,
-            }
-
-        closes = hist["Close"].tolist()
-        current_close = float(closes[-1])
-        prev_close = float(closes[-2]) if len(closes) >= 2 else current_close
+    return yf.Ticker(ticker_symbol)
 
-        if prev_close:
-            change_pct = round(((current_close - prev_close) / prev_close) * 100, 2)
-        else:
-            change_pct = 0.0
 
-        return {
-            "ticker": ticker_symbol,
-            "name": name,
-            "close": round(current_close, 2),
-            "change_pct": change_pct,
-            "prev_close": round(prev_close, 2),
-        }
+# (ticker, start, end) -> (expires_at, history).  Filled from worker
+# threads, hence the lock.
+_history_cache: dict[tuple[str, str, str], tuple[float, pd.DataFrame]] = {}
+_history_lock = threading.Lock()
 
-    except Exception as exc:
-        logger.error("Error fetching stock %s (%s): %s", name, ticker_symbol, exc)
-        return {
-            "ticker": ticker_symbol,
-            "name": name,
-            "close": None,
-            "change_pct": None,
-            "prev_close": None,
-            "error": str(exc),
-        }
 
+def _history(ticker_symbol: str, start: str, end: str) -> pd.DataFrame:
+    """Return daily closes for *ticker_symbol* between *start* and *end*.
 
-def _fetch_currency_pair(ticker_symbol: str, name: str, target_date: str) -> dict[str, Any]:
-    """Fetch exchange rate data for a currency pair.
+    Non-empty results are cached for :data:`HISTORY_CACHE_TTL` seconds, so
+    repeated fetches for the same date skip the network.  Empty results
+    are not cached since they are often transient.
+    """
+    key = (ticker_symbol, start, end)
+    with _history_lock:
+        entry = _history_cache.get(key)
+        if entry is not None:
+            expires_at, hist = entry
+            if time.monotonic() < expires_at:
+                return hist
+            del _history_cache[key]
+
+    # Only closes are used: skip the dividend/split columns and keep just
+    # Close, so cached frames hold one column instead of seven
+    hist = _ticker(ticker_symbol).history(start=start, end=end, actions=False)
+
+    if not hist.empty:
+        hist = hist[["Close"]]
+        with _history_lock:
+            if len(_history_cache) >= HISTORY_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del _history_cache[next(iter(_history_cache))]
+            _history_cache[key] = (time.monotonic() + HISTORY_CACHE_TTL, hist)
+    return hist
+
+
+@dataclass(frozen=True, slots=True)
+class _QuoteKind:
+    """Shape of the result dict for one kind of quote."""
+
+    label: str  # inserted into log messages, e.g. "sector"
+    lookback_days: int
+    value_key: str
+    digits: int = 2
+    prev_key: str | None = None
+    sparkline: bool = False
+    direction: bool = False
+    index_name: bool = False
+    latest_date: bool = False
+    market_holiday: bool = False
+
+
+_INDEX = _QuoteKind(
+    "", SPARKLINE_DAYS + 5, "value", prev_key="prev_close",
+    sparkline=True, latest_date=True, market_holiday=True,
+)
+_SECTOR = _QuoteKind("sector", 10, "value", direction=True, index_name=True)
+_STOCK = _QuoteKind("stock", 10, "close", prev_key="prev_close")
+_FX = _QuoteKind(
+    "FX", SPARKLINE_DAYS + 5, "rate", digits=4, prev_key="prev_rate",
+    sparkline=True, latest_date=True,
+)
+
+
+def _missing_quote(kind: _QuoteKind, ticker_symbol: str, name: str) -> dict[str, Any]:
+    """Return the result for a ticker with no usable data."""
+    result: dict[str, Any] = {"ticker": ticker_symbol, "name": name}
+    if kind.index_name:
+        result["index_name"] = name
+    result[kind.value_key] = None
+    result["change_pct"] = None
+    if kind.sparkline:
+        result["sparkline"] = []
+    elif kind.prev_key:
+        result[kind.prev_key] = None
+    if kind.direction:
+        result["direction"] = "unchanged"
+    return result
+
+
+def _fetch_quote(
+    kind: _QuoteKind, ticker_symbol: str, name: str, target_date: str,
+) -> dict[str, Any]:
+    """Fetch the latest close and daily change for one ticker.
 
     Args:
-        ticker_symbol: yfinance forex ticker (e.g. "USDCNY=X").
-        name: Human-readable pair name (e.g. "USD/CNY").
+        kind: Which fields to report and how to round them.
+        ticker_symbol: yfinance ticker symbol.
+        name: Human-readable name.
         target_date: Target date as YYYY-MM-DD.
 
     Returns:
-        Dictionary with rate, change_pct, and sparkline.
+        Dictionary shaped by *kind*; value fields are None and an
+        ``error`` key is set if the fetch failed.
     """
+    noun = f"{kind.label} " if kind.label else ""
     try:
-        ticker = yf.Ticker(ticker_symbol)
-
-        end_date = datetime.strptime(target_date, "%Y-%m-%d") + timedelta(days=1)
-        start_date = end_date - timedelta(days=SPARKLINE_DAYS + 5)
-
-        start_str = start_date.strftime("%Y-%m-%d")
-        end_str = end_date.strftime("%Y-%m-%d")
-        hist = ticker.history(start=start_str, end=end_str)
+        # Extra days in the window cover weekends and holidays
+        start_str, end_str = _date_window(target_date, kind.lookback_days)
+        hist = _history(ticker_symbol, start_str, end_str)
 
         if hist.empty:
             logger.warning(
-                "No FX data available for %s (%s) near %s",
-                name, ticker_symbol, target_date,
+                "No %sdata available for %s (%s) near %s",
+                noun, name, ticker_symbol, target_date,
             )
-            return {
-                "ticker": ticker_symbol,
-                "name": name,
-                "rate": None,
-                "change_pct": None,
-                "sparkline": [],
-            }
+            result = _missing_quote(kind, ticker_symbol, name)
+            if kind.market_holiday:
+                result["market_holiday"] = True
+            return result
 
+        # Most recent closes as one float array
         recent = hist.tail(SPARKLINE_DAYS + 1)
-        closes = recent["Close"].tolist()
-        sparkline = [round(float(c), 4) for c in closes[-SPARKLINE_DAYS:]]
+        closes = recent["Close"].to_numpy(dtype=float)
 
         current_close = float(closes[-1])
-        prev_close = float(closes[-2]) if len(closes) >= 2 else current_close
+        prev_close = float(closes[-2]) if closes.size >= 2 else current_close
         if prev_close:
-            change_pct = round(((current_close - prev_close) / prev_close) * 100, 4)
+            change_pct = round(((current_close - prev_close) / prev_close) * 100, kind.digits)
         else:
             change_pct = 0.0
 
-        latest_date = recent.index[-1].strftime("%Y-%m-%d")
-
-        return {
-            "ticker": ticker_symbol,
-            "name": name,
-            "rate": round(current_close, 4),
-            "change_pct": change_pct,
-            "prev_rate": round(prev_close, 4),
-            "sparkline": sparkline,
-            "latest_date": latest_date,
-        }
+        result = {"ticker": ticker_symbol, "name": name}
+        if kind.index_name:
+            result["index_name"] = name
+        result[kind.value_key] = round(current_close, kind.digits)
+        result["change_pct"] = change_pct
+        if kind.prev_key:
+            result[kind.prev_key] = round(prev_close, kind.digits)
+        if kind.sparkline:
+            result["sparkline"] = [
+                round(c, kind.digits) for c in closes[-SPARKLINE_DAYS:].tolist()
+            ]
+        if kind.direction:
+            if change_pct > 0:
+                result["direction"] = "up"
+            elif change_pct < 0:
+                result["direction"] = "down"
+            else:
+                result["direction"] = "unchanged"
+        latest = recent.index[-1]
+        if kind.latest_date:
+            result["latest_date"] = latest.strftime("%Y-%m-%d")
+        if kind.market_holiday:
+            result["market_holiday"] = latest.date() != _parse_date(target_date)
+        return result
 
     except Exception as exc:
-        logger.error("Error fetching FX %s (%s): %s", name, ticker_symbol, exc)
-        return {
-            "ticker": ticker_symbol,
-            "name": name,
-            "rate": None,
-            "change_pct": None,
-            "sparkline": [],
-            "error": str(exc),
-        }
-
-
-def _fetch_all_sync(config: SourceConfig, date: str) -> dict[str, Any]:
-    """Synchronous inner function for yfinance calls (runs in thread)."""
-    indices_config = config.get("indices", DEFAULT_INDICES)
-    sectors_config = config.get("sectors", DEFAULT_SECTORS)
-    watchlist_config = config.get("watchlist", DEFAULT_WATCHLIST)
-    currency_config = config.get("currency_pairs", DEFAULT_CURRENCY_PAIRS)
-
-    # --- Indices ---
-    indices: list[dict[str, Any]] = []
-    for idx_cfg in indices_config:
-        ticker_symbol = idx_cfg.get("ticker", "")
-        name = idx_cfg.get("name", ticker_symbol)
+        logger.error("Error fetching %s%s (%s): %s", noun, name, ticker_symbol, exc)
+        result = _missing_quote(kind, ticker_symbol, name)
+        result["error"] = str(exc)
+        return result
 
-        if not ticker_symbol:
-            continue
 
-        result = _fetch_index_data(ticker_symbol, name, date)
-        indices.append(result)
+def _fetch_index_data(ticker_symbol: str, name: str, target_date: str) -> dict[str, Any]:
+    """Fetch value, change and sparkline for a single market index."""
+    return _fetch_quote(_INDEX, ticker_symbol, name, target_date)
 
-    # --- Sectors ---
-    sectors: list[dict[str, Any]] = []
-    for sec_cfg in sectors_config:
-        ticker_symbol = sec_cfg.get("ticker", "")
-        name = sec_cfg.get("name", ticker_symbol)
 
-        if not ticker_symbol:
-            continue
+def _fetch_sector_data(ticker_symbol: str, name: str, target_date: str) -> dict[str, Any]:
+    """Fetch value, change_pct and direction for a single sector index."""
+    return _fetch_quote(_SECTOR, ticker_symbol, name, target_date)
 
-        result = _fetch_sector_data(ticker_symbol, name, date)
-        sectors.append(result)
 
-    # --- Watchlist / Top Movers ---
-    stock_results: list[dict[str, Any]] = []
-    for stock_cfg in watchlist_config:
-        ticker_symbol = stock_cfg.get("ticker", "")
-        name = stock_cfg.get("name", ticker_symbol)
+def _fetch_stock_data(ticker_symbol: str, name: str, target_date: str) -> dict[str, Any]:
+    """Fetch close, change_pct and prev_close for a single watchlist stock."""
+    return _fetch_quote(_STOCK, ticker_symbol, name, target_date)
 
-        if not ticker_symbol:
-            continue
 
-        result = _fetch_stock_data(ticker_symbol, name, date)
-        stock_results.append(result)
+def _fetch_currency_pair(ticker_symbol: str, name: str, target_date: str) -> dict[str, Any]:
+    """Fetch rate, change_pct and sparkline for a currency pair (e.g. "USDCNY=X")."""
+    return _fetch_quote(_FX, ticker_symbol, name, target_date)
+
+
+async def _fetch_group(
+    fetcher: Callable[[str, str, str], dict[str, Any]],
+    entries: list[dict[str, str]],
+    date: str,
+    sem: asyncio.Semaphore,
+) -> list[dict[str, Any]]:
+    """Run *fetcher* for every configured ticker in *entries* concurrently.
 
-    # --- Currency Pairs ---
-    currency_results: list[dict[str, Any]] = []
-    for pair_cfg in currency_config:
-        ticker_symbol = pair_cfg.get("ticker", "")
-        name = pair_cfg.get("name", ticker_symbol)
+    yfinance is synchronous, so each call runs in a worker thread; *sem*
+    caps how many are in flight across all groups.  Results keep the
+    order of *entries* (entries without a ticker are skipped).
+    """
+    async def run(ticker_symbol: str, name: str) -> dict[str, Any]:
+        async with sem:
+            return await asyncio.to_thread(fetcher, ticker_symbol, name, date)
+
+    tasks = []
+    for entry in entries:
+        ticker_symbol = entry.get("ticker", "")
+        name = entry.get("name", ticker_symbol)
 
         if not ticker_symbol:
             continue
 
-        result = _fetch_currency_pair(ticker_symbol, name, date)
-        currency_results.append(result)
+        tasks.append(run(ticker_symbol, name))
 
-    return {
-        "indices": indices,
-        "sectors": sectors,
-        "stock_results": stock_results,
-        "currency_pairs": currency_results,
-    }
+    return list(await asyncio.gather(*tasks))
 
 
 @register_source("yahoo_finance")
@@ -431,25 +341,34 @@ async def fetch(config: SourceConfig, date: str, **kwargs) -> dict[str, Any]:
     Returns:
         Dictionary with index data, sector data, and movers for all configured tickers.
     """
-    # yfinance is synchronous — run in a thread to avoid blocking the event loop
-    raw = await asyncio.to_thread(_fetch_all_sync, config, date)
-    indices = raw["indices"]
-    sectors = raw["sectors"]
-    stock_results = raw["stock_results"]
-    currency_pairs = raw["currency_pairs"]
-
-    # Filter out stocks with no data, then sort by change_pct descending
+    # Every ticker is fetched concurrently, at most max_workers at a time
+    sem = asyncio.Semaphore(config.get("max_workers", MAX_WORKERS))
+    indices, sectors, stock_results, currency_pairs = await asyncio.gather(
+        _fetch_group(_fetch_index_data, config.get("indices", DEFAULT_INDICES), date, sem),
+        _fetch_group(_fetch_sector_data, config.get("sectors", DEFAULT_SECTORS), date, sem),
+        _fetch_group(_fetch_stock_data, config.get("watchlist", DEFAULT_WATCHLIST), date, sem),
+        _fetch_group(
+            _fetch_currency_pair, config.get("currency_pairs", DEFAULT_CURRENCY_PAIRS), date, sem,
+        ),
+    )
+
+    # Filter out stocks with no data; gainers are listed best first and
+    # losers worst first
     valid_stocks = [s for s in stock_results if s.get("change_pct") is not None]
-    sorted_stocks = sorted(valid_stocks, key=lambda s: s["change_pct"], reverse=True)
-
-    top_gainers = sorted_stocks[:MOVERS_COUNT]
-    top_losers = sorted_stocks[-MOVERS_COUNT:] if len(sorted_stocks) >= MOVERS_COUNT else sorted_stocks
-
-    # Compute summary
-    available = [i for i in indices if i.get("value") is not None]
-    all_holiday = all(i.get("market_holiday", False) for i in available) if available else True
-    sectors_available = [s for s in sectors if s.get("value") is not None]
-    currency_available = [c for c in currency_pairs if c.get("rate") is not None]
+    top_gainers = heapq.nlargest(MOVERS_COUNT, valid_stocks, key=_change_pct)
+    top_losers = heapq.nsmallest(MOVERS_COUNT, valid_stocks, key=_change_pct)
+
+    # Compute summary; markets count as closed when every index with data
+    # (or none at all) is on a holiday
+    indices_fetched = indices_on_holiday = 0
+    for index in indices:
+        if index.get("value") is not None:
+            indices_fetched += 1
+            if index.get("market_holiday", False):
+                indices_on_holiday += 1
+    all_holiday = indices_on_holiday == indices_fetched
+    sectors_fetched = sum(1 for s in sectors if s.get("value") is not None)
+    currency_fetched = sum(1 for c in currency_pairs if c.get("rate") is not None)
 
     return {
         "date": date,
@@ -461,14 +380,14 @@ async def fetch(config: SourceConfig, date: str, **kwargs) -> dict[str, Any]:
         },
         "currency_pairs": currency_pairs,
         "summary": {
-            "indices_fetched": len(available),
-            "indices_failed": len(indices) - len(available),
-            "sectors_fetched": len(sectors_available),
-            "sectors_failed": len(sectors) - len(sectors_available),
+            "indices_fetched": indices_fetched,
+            "indices_failed": len(indices) - indices_fetched,
+            "sectors_fetched": sectors_fetched,
+            "sectors_failed": len(sectors) - sectors_fetched,
             "watchlist_fetched": len(valid_stocks),
             "watchlist_failed": len(stock_results) - len(valid_stocks),
-            "currency_pairs_fetched": len(currency_available),
-            "currency_pairs_failed": len(currency_pairs) - len(currency_available),
+            "currency_pairs_fetched": currency_fetched,
+            "currency_pairs_failed": len(currency_pairs) - currency_fetched,
             "all_markets_closed": all_holiday,
         },
     }
@@ -0,0 +1,102 @@
+"""Tests for the Caixin web scraper."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import httpx
+import pytest
+import respx
+
+from fetcher.sources.caixin_scraper import _parse_article_page, _scrape_section
+
+SECTION = {"url": "https://economy.caixin.com/", "name": "财新经济"}
+
+
+@pytest.fixture
+def section_html(fixtures_dir: Path) -> str:
+    return (fixtures_dir / "caixin_section.html").read_text()
+
+
+@pytest.fixture
+def article_html(fixtures_dir: Path) -> str:
+    return (fixtures_dir / "caixin_article.html").read_text()
+
+
+def test_parse_article_page(article_html: str) -> None:
+    """Test body paragraphs and the raw date text are extracted."""
+    body, date_str = _parse_article_page(article_html)
+
+    assert body == (
+        "商务部2月5日公告，对原产于加拿大的进口油菜籽反倾销调查作出初裁。"
+        " 初裁认定，涉案产品存在倾销，国内产业受到实质损害。"
+    )
+    assert date_str == "2026年02月05日 10:30"
+
+
+def test_parse_article_page_skips_comments_and_noise(article_html: str) -> None:
+    """Test comments inside <p>, scripts and iframes are left out of the body."""
+    body, _ = _parse_article_page(article_html)
+
+    assert "广告" not in body
+    assert "adSlot" not in body
+    assert "版权所有" not in body
+
+
+def test_parse_article_page_with_xml_declaration(article_html: str) -> None:
+    """Test XHTML pages starting with an encoding declaration still parse."""
+    declared = '<?xml version="1.0" encoding="utf-8"?>\n' + article_html
+
+    assert _parse_article_page(declared) == _parse_article_page(article_html)
+
+
+def test_parse_article_page_falls_back_to_article() -> None:
+    """Test the <article> element is used when no content container matches."""
+    html = "<html><body><article><p>正文一</p><p>正文二</p></article></body></html>"
+
+    assert _parse_article_page(html) == ("正文一 正文二", None)
+
+
+def test_parse_article_page_empty() -> None:
+    """Test an empty page yields no body and no date."""
+    assert _parse_article_page("") == ("", None)
+
+
+@respx.mock
+async def test_scrape_section(section_html: str) -> None:
+    """Test article links are normalized, deduplicated and short titles dropped."""
+    respx.get(SECTION["url"]).mock(return_value=httpx.Response(200, text=section_html))
+
+    async with httpx.AsyncClient() as client:
+        articles = await _scrape_section(client, SECTION, timeout=10)
+
+    assert [(a["title"], a["url"]) for a in articles] == [
+        (
+            "商务部就加拿大油菜籽反倾销调查作出初裁",
+            "https://economy.caixin.com/articles/2026-02-05/102345678.html",
+        ),
+        ("稀土出口管制新规解读", "https://www.caixin.com/article/2026-02-05/102345679.html"),
+        ("一月制造业PMI回升", "https://economy.caixin.com/articles/2026-02-05/102345680.html"),
+    ]
+    assert all(a["source"] == "财新经济" and a["language"] == "zh" for a in articles)
+
+
+@respx.mock
+async def test_scrape_section_with_xml_declaration(section_html: str) -> None:
+    """Test section pages starting with an encoding declaration still parse."""
+    declared = '<?xml version="1.0" encoding="utf-8"?>\n' + section_html
+    respx.get(SECTION["url"]).mock(return_value=httpx.Response(200, text=declared))
+
+    async with httpx.AsyncClient() as client:
+        articles = await _scrape_section(client, SECTION, timeout=10)
+
+    assert len(articles) == 3
+
+
+@respx.mock
+async def test_scrape_section_http_error() -> None:
+    """Test a failed section page yields no articles."""
+    respx.get(SECTION["url"]).mock(return_value=httpx.Response(503))
+
+    async with httpx.AsyncClient() as client:
+        assert await _scrape_section(client, SECTION, timeout=10) == []
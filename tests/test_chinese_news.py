@@ -33,8 +33,8 @@ def chinese_news_config() -> SourceConfig:
 
 
 @pytest.fixture
-def chinese_rss_feed(fixtures_dir: Path) -> str:
-    return (fixtures_dir / "chinese_rss_feed.xml").read_text()
+def chinese_rss_feed(fixtures_dir: Path) -> bytes:
+    return (fixtures_dir / "chinese_rss_feed.xml").read_bytes()
 
 
 def test_matches_keywords_finds_chinese() -> None:
@@ -64,7 +64,7 @@ def test_is_duplicate_allows_different() -> None:
     assert not _is_duplicate("商务部公布对加拿大油菜籽反倾销调查结果", seen)
 
 
-def test_parse_feed(chinese_rss_feed: str) -> None:
+def test_parse_feed(chinese_rss_feed: bytes) -> None:
     """Test RSS feed parsing produces article dicts."""
     articles = _parse_feed(chinese_rss_feed, "新华社")
 
@@ -76,7 +76,7 @@ def test_parse_feed(chinese_rss_feed: str) -> None:
         assert article["language"] == "zh"
 
 
-def test_parse_feed_language_tag(chinese_rss_feed: str) -> None:
+def test_parse_feed_language_tag(chinese_rss_feed: bytes) -> None:
     """Test that all parsed articles are tagged with language: zh."""
     articles = _parse_feed(chinese_rss_feed, "测试源")
     for article in articles:
@@ -86,11 +86,11 @@ def test_parse_feed_language_tag(chinese_rss_feed: str) -> None:
 @respx.mock
 @pytest.mark.asyncio
 async def test_fetch_filters_by_keywords(
-    chinese_news_config: SourceConfig, chinese_rss_feed: str
+    chinese_news_config: SourceConfig, chinese_rss_feed: bytes
 ) -> None:
     """Test that fetch filters articles by Chinese keywords."""
     respx.get("http://example.com/rss.xml").mock(
-        return_value=httpx.Response(200, text=chinese_rss_feed)
+        return_value=httpx.Response(200, content=chinese_rss_feed)
     )
     # Mock article body fetches
     respx.get(url__regex=r".*xinhuanet\.com.*").mock(
@@ -113,14 +113,38 @@ async def test_fetch_filters_by_keywords(
     assert any("加拿大" in t for t in titles)
 
 
+@respx.mock
+@pytest.mark.asyncio
+async def test_fetch_decodes_feed_with_header_charset(
+    chinese_news_config: SourceConfig,
+) -> None:
+    """Test a GBK feed whose charset is declared only in Content-Type."""
+    feed = (
+        '<?xml version="1.0"?><rss version="2.0"><channel><title>测试</title>'
+        "<item><title>商务部公布对加拿大油菜籽反倾销调查结果</title>"
+        "<link>http://example.com/a</link></item></channel></rss>"
+    ).encode("gbk")
+    respx.get("http://example.com/rss.xml").mock(
+        return_value=httpx.Response(
+            200, content=feed, headers={"content-type": "text/xml; charset=gbk"},
+        )
+    )
+    respx.get("http://example.com/a").mock(return_value=httpx.Response(404))
+
+    result = await fetch(chinese_news_config, "2026-01-30")
+
+    assert [a["title"] for a in result["articles"]] == ["商务部公布对加拿大油菜籽反倾销调查结果"]
+    assert result["articles"][0]["matched_keywords"] == ["加拿大", "油菜籽"]
+
+
 @respx.mock
 @pytest.mark.asyncio
 async def test_fetch_excludes_irrelevant(
-    chinese_news_config: SourceConfig, chinese_rss_feed: str
+    chinese_news_config: SourceConfig, chinese_rss_feed: bytes
 ) -> None:
     """Test that irrelevant articles are excluded."""
     respx.get("http://example.com/rss.xml").mock(
-        return_value=httpx.Response(200, text=chinese_rss_feed)
+        return_value=httpx.Response(200, content=chinese_rss_feed)
     )
     # Mock article body fetches
     respx.get(url__regex=r".*xinhuanet\.com.*").mock(
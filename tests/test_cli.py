@@ -187,6 +187,16 @@ def test_write_raw_overwrites_existing(tmp_output_dir: Path) -> None:
     assert written["data"]["version"] == 2
 
 
+def test_write_raw_keeps_chinese_unescaped(tmp_output_dir: Path) -> None:
+    """Test that write_raw writes non-ASCII text as UTF-8, not escapes."""
+    out_path = write_raw("2025-01-17", "source", {"title": "关税"}, str(tmp_output_dir))
+
+    raw = out_path.read_text(encoding="utf-8")
+    assert "关税" in raw
+    assert "\\u" not in raw
+    assert json.loads(raw)["data"]["title"] == "关税"
+
+
 @patch("fetcher.cli.run_source")
 @patch("fetcher.cli.load_config")
 def test_validate_warns_missing_config(
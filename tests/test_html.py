@@ -0,0 +1,56 @@
+"""Tests for the shared HTML parsing helpers."""
+
+from __future__ import annotations
+
+from bs4 import BeautifulSoup
+from lxml import etree
+
+from fetcher.sources._html import has_class, link_title, parse_html, stripped_text
+
+
+def test_parse_html_drops_xml_declaration() -> None:
+    """Test pages with a leading encoding declaration (and BOM) parse."""
+    html = (
+        "\ufeff" '<?xml version="1.0" encoding="utf-8"?>\n'
+        "<html><body><p>正文</p></body></html>"
+    )
+    tree = parse_html(html)
+
+    assert tree is not None
+    assert tree.findtext(".//p") == "正文"
+
+
+def test_parse_html_empty_page() -> None:
+    """Test an empty page yields None instead of raising."""
+    assert parse_html("") is None
+    assert parse_html("   ") is None
+
+
+def test_has_class_matches_whole_class_tokens() -> None:
+    """Test class tests match tokens, not substrings of other classes."""
+    tree = parse_html(
+        '<html><body><div class="news content"><p>a</p></div>'
+        '<div class="content_txt"><p>b</p></div></body></html>'
+    )
+    assert tree is not None
+
+    matches = etree.XPath(f"//div[{has_class('content')}]")(tree)
+
+    assert [stripped_text(div) for div in matches] == ["a"]
+
+
+def test_stripped_text_joins_stripped_text_nodes() -> None:
+    """Test each text node is stripped before joining, as bs4 strip=True does."""
+    tree = parse_html("<html><body><p>  加拿大 <b> 油菜籽 </b>\n 关税 </p></body></html>")
+    assert tree is not None
+
+    assert stripped_text(tree.find(".//p")) == "加拿大油菜籽关税"
+
+
+def test_link_title_reads_plain_and_nested_anchors() -> None:
+    """Test single-text and nested-markup anchors both yield stripped titles."""
+    soup = BeautifulSoup(
+        '<a href="/a">\n  Plain title  \n</a><a href="/b"> Nested <b>title</b> </a>', "lxml"
+    )
+
+    assert [link_title(link) for link in soup.find_all("a")] == ["Plain title", "Nestedtitle"]
@@ -1,12 +1,20 @@
-"""Tests for DomainRateLimiter."""
+"""Tests for DomainRateLimiter and HTTP helpers."""
 
 from __future__ import annotations
 
 import asyncio
 
+import httpx
 import pytest
 
-from fetcher.http import DomainRateLimiter
+from fetcher.config import RetryConfig
+from fetcher.http import (
+    DomainRateLimiter,
+    create_client,
+    get_text_capped,
+    response_json,
+    retry_budget,
+)
 
 
 @pytest.fixture
@@ -88,3 +96,48 @@ async def test_different_domains_independent(limiter: DomainRateLimiter) -> None
 
     assert max_concurrent_a <= 2
     assert max_concurrent_b <= 2
+
+
+def test_response_json_decodes_bytes() -> None:
+    """response_json parses the raw body, including non-ASCII text."""
+    resp = httpx.Response(200, json={"title": "加拿大", "items": [1, 2]})
+    assert response_json(resp) == {"title": "加拿大", "items": [1, 2]}
+
+
+def test_retry_budget_covers_attempts_and_backoff() -> None:
+    """retry_budget sums per-attempt timeouts and backoff sleeps."""
+    retry = RetryConfig(max_retries=2, backoff_factor=0.5)
+    # 3 attempts x 10s + (0.5 + 1.0) backoff
+    assert retry_budget(10, retry) == 31.5
+    assert retry_budget(10, RetryConfig(max_retries=0)) == 10
+
+
+async def test_create_client_pools_connections() -> None:
+    """create_client applies redirect/pool defaults and honours overrides."""
+    async with create_client(timeout=5, headers={"X-Test": "1"}) as client:
+        assert client.follow_redirects is True
+        assert client.timeout.connect == 5
+        assert client.headers["X-Test"] == "1"
+
+
+async def test_get_text_capped_stops_at_cap() -> None:
+    """get_text_capped returns only the head of a large body."""
+    body = ("加拿大" * 1000).encode("utf-8")
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(
+            200, content=body, headers={"Content-Type": "text/html; charset=utf-8"},
+        )
+    )
+    async with httpx.AsyncClient(transport=transport) as client:
+        text = await get_text_capped(client, "https://example.com/a", max_bytes=10)
+
+    # 10 bytes = three 3-byte characters plus one cut (replaced) byte
+    assert text == "加拿大�"
+
+
+async def test_get_text_capped_raises_for_status() -> None:
+    """get_text_capped surfaces HTTP errors like raise_for_status."""
+    transport = httpx.MockTransport(lambda request: httpx.Response(404))
+    async with httpx.AsyncClient(transport=transport) as client:
+        with pytest.raises(httpx.HTTPStatusError):
+            await get_text_capped(client, "https://example.com/missing")
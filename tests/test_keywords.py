@@ -0,0 +1,42 @@
+"""Tests for the shared source keyword scanners."""
+
+from __future__ import annotations
+
+from fetcher.sources._keywords import contains_keyword, matched_keywords
+
+
+def test_contains_keyword_matches_substrings() -> None:
+    """Test keywords match anywhere in the text, ignoring case."""
+    keywords = ("加拿大", "rare earth", "Huawei")
+
+    assert contains_keyword(keywords, "中国与加拿大贸易")
+    assert contains_keyword(keywords, "RARE EARTHS export curbs")
+    assert contains_keyword(keywords, "huaweicloud")
+    assert not contains_keyword(keywords, "Spring Festival travel rush")
+
+
+def test_contains_keyword_without_keywords() -> None:
+    """Test an empty keyword list matches nothing."""
+    assert not contains_keyword((), "anything")
+
+
+def test_matched_keywords_includes_nested_matches() -> None:
+    """Test one scan finds every keyword, including nested prefixes."""
+    keywords = ("Council", "State Council", "BRI", "BRICS")
+
+    assert matched_keywords(keywords, "The state council met BRICS envoys") == {
+        "Council", "State Council", "BRICS",
+    }
+    assert matched_keywords(keywords, "Brisbane") == set()
+
+
+def test_matched_keywords_ignores_case_in_ascii_and_unicode_text() -> None:
+    """Test case-insensitive matching with and without non-ASCII text."""
+    keywords = ("China", "Belt and Road")
+
+    assert matched_keywords(keywords, "CHINA hosts belt AND road forum") == {
+        "China", "Belt and Road",
+    }
+    assert matched_keywords(keywords, "Pékin: china hosts BELT and road forum") == {
+        "China", "Belt and Road",
+    }
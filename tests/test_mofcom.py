@@ -13,6 +13,7 @@ from fetcher.config import RetryConfig, SourceConfig
 from fetcher.sources.mofcom import (
     _extract_articles_from_html,
     _extract_timestamps,
+    _title_candidate,
     fetch,
 )
 
@@ -118,6 +119,36 @@ async def test_fetch_success(mofcom_config: SourceConfig, mofcom_html: str) -> N
     assert "error" not in result
 
 
+def test_title_candidate() -> None:
+    """Test title pre-filter: no keywords keeps everything, else substring match."""
+    assert _title_candidate("MOFCOM spokesperson remarks", None)
+    assert _title_candidate("Tariff adjustments announced", ["tariff", "Canada"])
+    assert not _title_candidate("Regular press conference", ["tariff", "Canada"])
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_fetch_title_keywords_skip_body_fetch(mofcom_html: str) -> None:
+    """Test that title_keywords filters articles before fetching bodies."""
+    config = SourceConfig(
+        name="mofcom",
+        settings={"url": "http://english.mofcom.gov.cn/", "title_keywords": ["no-such-term"]},
+        timeout=10,
+    )
+    respx.get("http://english.mofcom.gov.cn/").mock(
+        return_value=httpx.Response(200, text=mofcom_html)
+    )
+    body_route = respx.get(url__regex=r".*mofcom\.gov\.cn/.*art_.*\.html").mock(
+        return_value=httpx.Response(200, text="<html></html>")
+    )
+
+    result = await fetch(config, "2026-01-30")
+
+    assert result["total_scraped"] == 2
+    assert result["articles"] == []
+    assert not body_route.called
+
+
 @respx.mock
 @pytest.mark.asyncio
 async def test_fetch_http_error(mofcom_config: SourceConfig) -> None:
@@ -10,10 +10,16 @@ import respx
 
 from fetcher.config import RetryConfig, SourceConfig
 from fetcher.sources.news_scraper import (
+    TitleIndex,
+    _build_scanner,
     _classify_article,
-    _is_duplicate,
+    _enrich_article,
+    _extract_article_body,
+    _host_semaphores,
     _matches_keywords,
     _parse_feed,
+    _parse_feed_fast,
+    _scan_article,
     fetch,
 )
 
@@ -34,8 +40,8 @@ def news_config() -> SourceConfig:
 
 
 @pytest.fixture
-def rss_xml(fixtures_dir: Path) -> str:
-    return (fixtures_dir / "rss_feed.xml").read_text()
+def rss_xml(fixtures_dir: Path) -> bytes:
+    return (fixtures_dir / "rss_feed.xml").read_bytes()
 
 
 def test_matches_keywords_positive() -> None:
@@ -85,19 +91,57 @@ def test_classify_article_general_fallback() -> None:
     assert cats == ["general"]
 
 
+def test_scan_article_filters_and_classifies() -> None:
+    """Test the fused scan returns the same answers as the separate checks."""
+    scanner = _build_scanner(("China", "Beijing"))
+    text = "Beijing weighs tariff response to Ottawa"
+
+    assert _scan_article(text.lower(), scanner) == (
+        _matches_keywords(text, ["China", "Beijing"]),
+        _classify_article(text),
+    )
+    assert _scan_article("weather forecast for the week", scanner) == (False, ["general"])
+
+
+def test_scan_article_overlapping_keywords() -> None:
+    """Test that keywords nested inside longer ones are still detected."""
+    scanner = _build_scanner(("Hong Kong",))
+    matched, categories = _scan_article("hong kong tariffs", scanner)
+
+    assert matched is True
+    assert "social" in categories  # "Hong Kong"
+    assert "trade" in categories  # "tarif" / "tariff"
+
+
+def test_scan_article_acronyms_use_word_boundaries() -> None:
+    """Test acronyms are matched whole-word within the same scan."""
+    scanner = _build_scanner(("Beijing",))
+
+    assert _scan_article("prc officials meet", scanner)[0] is True
+    assert _scan_article("oil prices rise", scanner)[0] is False
+    # "CPC" is both an acronym and a political keyword
+    assert _scan_article("cpc plenum opens", scanner) == (True, ["political"])
+
+
+def _index(*titles: str) -> TitleIndex:
+    index = TitleIndex()
+    for title in titles:
+        index.add(title)
+    return index
+
+
 def test_is_duplicate_exact() -> None:
     """Test deduplication with very similar titles."""
-    seen = ["Canada announces new trade restrictions on China"]
-    assert _is_duplicate("Canada announces new trade restrictions on China", seen) is True
+    index = _index("Canada announces new trade restrictions on China")
+    assert index.is_duplicate("Canada announces new trade restrictions on China") is True
 
 
 def test_is_duplicate_similar() -> None:
     """Test deduplication with similar but not identical titles."""
-    seen = ["Canada announces new trade restrictions on China technology exports"]
+    index = _index("Canada announces new trade restrictions on China technology exports")
     assert (
-        _is_duplicate(
-            "Canada announces new trade restrictions on China technology exports (updated)",
-            seen,
+        index.is_duplicate(
+            "Canada announces new trade restrictions on China technology exports (updated)"
         )
         is True
     )
@@ -105,11 +149,89 @@ def test_is_duplicate_similar() -> None:
 
 def test_is_duplicate_different() -> None:
     """Test that different titles are not flagged as duplicates."""
-    seen = ["Canada announces new trade restrictions"]
-    assert _is_duplicate("European Central Bank holds interest rates", seen) is False
+    index = _index("Canada announces new trade restrictions")
+    assert index.is_duplicate("European Central Bank holds interest rates") is False
+
+
+def test_is_duplicate_scattered_edits() -> None:
+    """Test edits that share few shingles are still judged by SequenceMatcher."""
+    index = _index("Beijing retaliates against canola exports from Canada")
+    # SequenceMatcher ratio 0.906, but only 43% of 4-char shingles shared
+    assert index.is_duplicate("Beijing retaliaxes agaixst canoxa exporxs from xanada") is True
+
+
+def test_is_duplicate_without_shared_shingle() -> None:
+    """Test titles sharing no 4-char shingle are still compared."""
+    index = _index("abcdefgh")
+    # SequenceMatcher ratio 0.89 with no common shingle
+    assert index.is_duplicate("abcXdefXgh") is True
+
+
+def test_build_scanner_is_cached() -> None:
+    """Test that scanners are reused for the same keyword tuple."""
+    assert _build_scanner(("China", "Beijing")) is _build_scanner(("China", "Beijing"))
+
+
+def test_title_index_detects_near_duplicates() -> None:
+    """Test that the shingle index flags near-duplicates and ignores punctuation/case."""
+    index = TitleIndex()
+    index.add("Canada announces new trade restrictions on China")
+
+    assert index.is_duplicate("CANADA announces new trade restrictions on China!") is True
+    assert index.is_duplicate("European Central Bank holds interest rates") is False
+
 
+def test_title_index_short_titles() -> None:
+    """Test titles shorter than a shingle still compare correctly."""
+    index = TitleIndex()
+    index.add("PLA")
 
-def test_parse_feed(rss_xml: str) -> None:
+    assert index.is_duplicate("pla") is True
+    assert index.is_duplicate("NPC") is False
+    assert _index("PRC").is_duplicate("PC") is True
+
+
+ARTICLE_HTML = """
+<html><head><script>var x = 1;</script></head><body>
+<nav><p>Navigation link text that is long enough</p></nav>
+<article><div class="article-body">
+  <h2>Beijing responds to new Canadian tariffs</h2>
+  <p>Chinese officials said on Monday they would review the measures.</p>
+  <p>Chinese officials said on Monday they would review the measures.</p>
+  <p>Short.</p>
+  <ul><li>Tariffs on electric vehicles rise to 100 percent</li></ul>
+  <p>Click here to subscribe and get the full story today.</p>
+  <div class="paywall"><p>This paragraph sits inside a paywall container.</p></div>
+  <p>\U0001F4A1You've read three articles this month, thank you.</p>
+</div></article>
+</body></html>
+"""
+
+
+def test_extract_article_body() -> None:
+    """Test body extraction keeps content and drops noise/boilerplate."""
+    body = _extract_article_body(ARTICLE_HTML)
+
+    assert body.split("\n") == [
+        "[heading] Beijing responds to new Canadian tariffs",
+        "Chinese officials said on Monday they would review the measures.",
+        "[item] Tariffs on electric vehicles rise to 100 percent",
+    ]
+
+
+def test_extract_article_body_falls_back_to_all_paragraphs() -> None:
+    """Test pages without a known container still yield paragraph text."""
+    html = "<html><body><div><p>Plain paragraph text without any container.</p></div></body></html>"
+    assert _extract_article_body(html) == "Plain paragraph text without any container."
+
+
+def test_extract_article_body_with_xml_declaration() -> None:
+    """Test XHTML pages starting with an encoding declaration are parsed."""
+    html = '<?xml version="1.0" encoding="utf-8"?>\n' + ARTICLE_HTML
+    assert _extract_article_body(html) == _extract_article_body(ARTICLE_HTML) != ""
+
+
+def test_parse_feed(rss_xml: bytes) -> None:
     """Test RSS feed parsing extracts articles correctly."""
     articles = _parse_feed(rss_xml, "Reuters")
 
@@ -119,7 +241,57 @@ def test_parse_feed(rss_xml: str) -> None:
     assert articles[0]["url"] != ""
 
 
-def test_parse_feed_article_structure(rss_xml: str) -> None:
+def test_parse_feed_fast_path_matches_feedparser(rss_xml: bytes) -> None:
+    """Test the lxml fast path reads the same entries feedparser would."""
+    entries = _parse_feed_fast(rss_xml)
+
+    assert entries is not None
+    assert [e["title"] for e in entries] == [a["title"] for a in _parse_feed(rss_xml, "R")]
+    assert all(e["link"].startswith("http") for e in entries)
+
+
+def test_parse_feed_falls_back_on_malformed_xml() -> None:
+    """Test feeds lxml rejects are still parsed by feedparser."""
+    xml = (
+        b'<rss version="2.0"><channel><item><title>Canada&nbsp;news</title>'
+        b"<link>https://example.com/a</link></item></channel></rss>"
+    )
+    assert _parse_feed_fast(xml) is None
+
+    articles = _parse_feed(xml, "Test")
+    assert [a["url"] for a in articles] == ["https://example.com/a"]
+
+
+@pytest.mark.parametrize(
+    "content_type",
+    ["application/rss+xml; charset=GBK", 'text/xml; charset="gbk"'],
+)
+def test_parse_feed_uses_header_charset(content_type: str) -> None:
+    """Test a charset declared only in Content-Type decodes the feed."""
+    feed = (
+        '<?xml version="1.0"?><rss version="2.0"><channel>'
+        "<item><title>加拿大油菜籽</title><link>https://example.com/a</link></item>"
+        "</channel></rss>"
+    ).encode("gbk")
+
+    articles = _parse_feed(feed, "Test", content_type)
+
+    assert [a["title"] for a in articles] == ["加拿大油菜籽"]
+
+
+def test_parse_feed_unknown_header_charset_falls_back() -> None:
+    """Test an encoding lxml does not know is left to feedparser."""
+    feed = (
+        b'<rss version="2.0"><channel><item><title>Canada</title>'
+        b"<link>https://example.com/a</link></item></channel></rss>"
+    )
+    assert _parse_feed_fast(feed, "no-such-charset") is None
+
+    articles = _parse_feed(feed, "Test", "text/xml; charset=no-such-charset")
+    assert [a["title"] for a in articles] == ["Canada"]
+
+
+def test_parse_feed_article_structure(rss_xml: bytes) -> None:
     """Test that parsed articles have the required fields."""
     articles = _parse_feed(rss_xml, "Reuters")
 
@@ -135,11 +307,11 @@ def test_parse_feed_article_structure(rss_xml: str) -> None:
 @pytest.mark.asyncio
 async def test_fetch_filters_by_keywords(
     news_config: SourceConfig,
-    rss_xml: str,
+    rss_xml: bytes,
 ) -> None:
     """Test that fetch filters articles by keywords."""
     respx.get("https://feeds.reuters.com/reuters/worldNews").mock(
-        return_value=httpx.Response(200, text=rss_xml)
+        return_value=httpx.Response(200, content=rss_xml)
     )
 
     result = await fetch(news_config, "2025-01-17")
@@ -153,15 +325,36 @@ async def test_fetch_filters_by_keywords(
         )
 
 
+@respx.mock
+@pytest.mark.asyncio
+async def test_fetch_enriches_articles_with_body(
+    news_config: SourceConfig,
+    rss_xml: bytes,
+) -> None:
+    """Test that fetch adds the extracted page body to each accepted article."""
+    respx.get("https://feeds.reuters.com/reuters/worldNews").mock(
+        return_value=httpx.Response(200, content=rss_xml)
+    )
+    respx.get(url__regex=r"https://www\.reuters\.com/.*").mock(
+        return_value=httpx.Response(200, text=ARTICLE_HTML)
+    )
+
+    result = await fetch(news_config, "2025-01-17")
+
+    assert result["total_articles"] > 0
+    expected = _extract_article_body(ARTICLE_HTML)
+    assert all(a["body_text"] == expected for a in result["articles"])
+
+
 @respx.mock
 @pytest.mark.asyncio
 async def test_fetch_deduplicates(
     news_config: SourceConfig,
-    rss_xml: str,
+    rss_xml: bytes,
 ) -> None:
     """Test that fetch removes duplicate articles."""
     respx.get("https://feeds.reuters.com/reuters/worldNews").mock(
-        return_value=httpx.Response(200, text=rss_xml)
+        return_value=httpx.Response(200, content=rss_xml)
     )
 
     result = await fetch(news_config, "2025-01-17")
@@ -176,11 +369,11 @@ async def test_fetch_deduplicates(
 @pytest.mark.asyncio
 async def test_fetch_classifies_articles(
     news_config: SourceConfig,
-    rss_xml: str,
+    rss_xml: bytes,
 ) -> None:
     """Test that each article is classified into categories."""
     respx.get("https://feeds.reuters.com/reuters/worldNews").mock(
-        return_value=httpx.Response(200, text=rss_xml)
+        return_value=httpx.Response(200, content=rss_xml)
     )
 
     result = await fetch(news_config, "2025-01-17")
@@ -217,3 +410,72 @@ async def test_fetch_handles_timeout(news_config: SourceConfig) -> None:
 
     assert result["articles"] == []
     assert len(result["feed_errors"]) == 1
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_fetch_records_hanging_feed_as_timeout(
+    news_config: SourceConfig,
+    rss_xml: bytes,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that a feed exceeding its deadline is recorded without blocking others."""
+    import asyncio
+
+    from fetcher.sources import news_scraper
+
+    monkeypatch.setattr(news_scraper, "retry_budget", lambda timeout, retry: 0)
+    monkeypatch.setattr(news_scraper, "FEED_DEADLINE_SLACK", 0.05)
+
+    async def _hang(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(5)
+        return httpx.Response(200, text="")
+
+    respx.get("https://feeds.reuters.com/reuters/worldNews").mock(side_effect=_hang)
+    respx.get("https://example.com/feed").mock(return_value=httpx.Response(200, content=rss_xml))
+    config = SourceConfig(
+        name="news",
+        settings={
+            "feeds": [
+                {"url": "https://feeds.reuters.com/reuters/worldNews", "name": "Reuters"},
+                {"url": "https://example.com/feed", "name": "Example"},
+            ],
+            "keywords": news_config.get("keywords"),
+        },
+        timeout=10,
+        retry=RetryConfig(),
+    )
+
+    result = await fetch(config, "2025-01-17")
+
+    assert result["feed_errors"] == [{"feed": "Reuters", "error": "timeout"}]
+    assert result["articles"]
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_enrich_articles_caps_per_host_concurrency() -> None:
+    """Test body fetches to one host never exceed the per-host limit."""
+    import asyncio
+
+    in_flight: dict[str, int] = {}
+    peak: dict[str, int] = {}
+
+    async def _slow(request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        in_flight[host] = in_flight.get(host, 0) + 1
+        peak[host] = max(peak.get(host, 0), in_flight[host])
+        await asyncio.sleep(0.01)
+        in_flight[host] -= 1
+        return httpx.Response(200, text=ARTICLE_HTML)
+
+    respx.get(url__regex=r"https://(a|b)\.example\.com/.*").mock(side_effect=_slow)
+    articles = [{"url": f"https://{h}.example.com/{i}"} for h in "ab" for i in range(6)]
+
+    sem = asyncio.Semaphore(10)
+    host_sems = _host_semaphores(per_host=2)
+    async with httpx.AsyncClient() as client:
+        await asyncio.gather(*[_enrich_article(client, a, sem, host_sems) for a in articles])
+
+    assert peak == {"a.example.com": 2, "b.example.com": 2}
+    assert all(a["body_text"] for a in articles)
@@ -9,7 +9,14 @@ import pytest
 import respx
 
 from fetcher.config import RetryConfig, SourceConfig
-from fetcher.sources.parliament import TRACKED_BILLS, fetch
+from fetcher.sources.parliament import (
+    TRACKED_BILLS,
+    _build_keyword_matcher,
+    _count_keywords,
+    _fetch_bills,
+    _search_debate_content,
+    fetch,
+)
 
 
 @pytest.fixture
@@ -49,6 +56,75 @@ def hansard_response() -> dict[str, Any]:
     }
 
 
+def test_count_keywords_matches_str_count() -> None:
+    """Test single-scan counting agrees with per-keyword str.count."""
+    keywords = ["China", "Chinese", "PRC", "Hong Kong", "Kong"]
+    text = "china and the chinese prc delegation met hong kong officials in china"
+
+    counts = _count_keywords(text, _build_keyword_matcher(keywords))
+
+    assert counts == {kw.lower(): text.count(kw.lower()) for kw in keywords}
+
+
+def test_count_keywords_accumulates() -> None:
+    """Test that passing a counts dict accumulates across texts."""
+    matcher = _build_keyword_matcher(["China"])
+    counts = _count_keywords("china", matcher)
+    _count_keywords("china and china", matcher, counts)
+
+    assert counts == {"china": 3}
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_search_debate_content_counts_speeches() -> None:
+    """Test keyword counts across paginated EN/FR speech content."""
+    base = "https://api.openparliament.ca"
+    respx.get(f"{base}/debates/2025/1/17/", params={"format": "json"}).mock(
+        return_value=httpx.Response(
+            200, json={"related": {"speeches_url": "/speeches/?document=1"}},
+        )
+    )
+    respx.get(f"{base}/speeches/", params={"document": "1", "limit": "200"}).mock(
+        return_value=httpx.Response(200, json={
+            "objects": [
+                {"content": {"en": "<p>China and Huawei</p>", "fr": "<p>la Chine</p>"}},
+                {"content": {"en": "<p>canola exports to China</p>", "fr": ""}},
+            ],
+            "pagination": {"next_url": None},
+        })
+    )
+
+    async with httpx.AsyncClient() as client:
+        counts = await _search_debate_content(
+            client, base, "/debates/2025/1/17/",
+            _build_keyword_matcher(["China", "Huawei", "PRC"]), 10,
+        )
+
+    assert counts == {"china": 2, "huawei": 1}
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_fetch_bills_falls_back_to_previous_session() -> None:
+    """Test bills are fetched per session in order and kept in tracked order."""
+    base = "https://api.openparliament.ca"
+    respx.get(url__regex=rf"{base}/bills/45-1/.*").mock(return_value=httpx.Response(404))
+    respx.get(url__regex=rf"{base}/bills/44-1/.*").mock(
+        side_effect=lambda request: httpx.Response(200, json={
+            "name": {"en": request.url.path.split("/")[-2], "fr": ""},
+            "status_code": "RoyalAssent",
+        })
+    )
+
+    async with httpx.AsyncClient() as client:
+        bills = await _fetch_bills(client, base, "45-1", 10)
+
+    assert [b["id"] for b in bills] == TRACKED_BILLS
+    assert all(b["session"] == "44-1" for b in bills)
+    assert [b["title"] for b in bills] == TRACKED_BILLS
+
+
 @respx.mock
 @pytest.mark.asyncio
 async def test_fetch_returns_bills_and_hansard(
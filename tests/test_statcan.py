@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import json
+from collections.abc import Callable
 from typing import Any
 
 import httpx
@@ -12,10 +14,14 @@ from fetcher.config import RetryConfig, SourceConfig
 from fetcher.sources.statcan import (
     COMMODITY_COORDS,
     COMMODITY_TABLE_PID,
+    TABLE_PID,
     WDS_BASE,
+    _commodity_record,
     _determine_trend,
     _extract_latest_and_previous,
-    _fetch_commodities,
+    _query_wds,
+    _wds_payload,
+    _WdsDataPoint,
     fetch,
 )
 
@@ -104,7 +110,7 @@ def _make_commodity_response(
             results.append({
                 "status": "SUCCESS",
                 "object": {
-                    "coordinate": comm["import_coordinate"],
+                    "coordinate": comm.import_coordinate,
                     "vectorId": 1000000 + i * 2,
                     "vectorDataPoint": [
                         {"refPer": "2025-10-01", "value": import_val_prev, "scalarFactorCode": 3},
@@ -115,7 +121,7 @@ def _make_commodity_response(
             results.append({
                 "status": "SUCCESS",
                 "object": {
-                    "coordinate": comm["export_coordinate"],
+                    "coordinate": comm.export_coordinate,
                     "vectorId": 1000001 + i * 2,
                     "vectorDataPoint": [
                         {"refPer": "2025-10-01", "value": export_val_prev, "scalarFactorCode": 3},
@@ -154,6 +160,16 @@ class TestDetermineTrend:
         assert _determine_trend(10.0, 0) == "stable"
 
 
+def test_commodity_record_converts_and_derives() -> None:
+    """Test millions conversion, balance and trend for one commodity."""
+    record = _commodity_record(COMMODITY_COORDS[0], 110_000.0, 100_000.0, 55_000.0, None)
+
+    assert record["import_cad_millions"] == 110.0
+    assert record["export_cad_millions"] == 55.0
+    assert record["balance_cad_millions"] == -55.0
+    assert record["trend"] == "up"  # 165.0 vs 100.0
+
+
 class TestExtractLatestAndPrevious:
     """Tests for the _extract_latest_and_previous helper."""
 
@@ -161,21 +177,33 @@ class TestExtractLatestAndPrevious:
         assert _extract_latest_and_previous([]) == (None, None)
 
     def test_single_point(self) -> None:
-        assert _extract_latest_and_previous([{"value": 42.0}]) == (42.0, None)
+        assert _extract_latest_and_previous([_WdsDataPoint(value=42.0)]) == (42.0, None)
 
     def test_two_points(self) -> None:
-        pts = [{"value": 10.0}, {"value": 20.0}]
+        pts = [_WdsDataPoint(value=10.0), _WdsDataPoint(value=20.0)]
         assert _extract_latest_and_previous(pts) == (20.0, 10.0)
 
     def test_three_points_takes_last_two(self) -> None:
-        pts = [{"value": 1.0}, {"value": 2.0}, {"value": 3.0}]
+        pts = [_WdsDataPoint(value=1.0), _WdsDataPoint(value=2.0), _WdsDataPoint(value=3.0)]
         assert _extract_latest_and_previous(pts) == (3.0, 2.0)
 
+    def test_string_values_are_coerced(self) -> None:
+        pts = [_WdsDataPoint(value="n/a"), _WdsDataPoint(value="12.5")]
+        assert _extract_latest_and_previous(pts) == (12.5, None)
+
 
 # ──────────────────────────────────────────────────────────────
-# Existing aggregate-trade tests (updated for two POST calls)
+# Existing aggregate-trade tests (updated for the batched POST call)
 # ──────────────────────────────────────────────────────────────
 
+def _batched(
+    aggregate: list[dict[str, Any]],
+    commodity: list[dict[str, Any]],
+) -> httpx.Response:
+    """Answer the single batched WDS POST with aggregate and commodity items."""
+    return httpx.Response(200, json=aggregate + commodity)
+
+
 @respx.mock
 @pytest.mark.asyncio
 async def test_fetch_success(
@@ -184,13 +212,10 @@ async def test_fetch_success(
 ) -> None:
     """Test successful data fetch from StatCan WDS."""
     commodity_resp = _make_commodity_response()
-    # The endpoint is called twice: once for aggregates, once for commodities.
+    # Aggregates and commodities come back from one batched query
     respx.post(
         f"{WDS_BASE}/getDataFromCubePidCoordAndLatestNPeriods"
-    ).mock(side_effect=[
-        httpx.Response(200, json=wds_response),
-        httpx.Response(200, json=commodity_resp),
-    ])
+    ).mock(return_value=_batched(wds_response, commodity_resp))
 
     result = await fetch(statcan_config, "2025-01-17")
 
@@ -212,10 +237,7 @@ async def test_fetch_includes_series(
     commodity_resp = _make_commodity_response()
     respx.post(
         f"{WDS_BASE}/getDataFromCubePidCoordAndLatestNPeriods"
-    ).mock(side_effect=[
-        httpx.Response(200, json=wds_response),
-        httpx.Response(200, json=commodity_resp),
-    ])
+    ).mock(return_value=_batched(wds_response, commodity_resp))
 
     result = await fetch(statcan_config, "2025-01-17")
 
@@ -225,6 +247,51 @@ async def test_fetch_includes_series(
     assert len(result["series"]["Exports to China"]) == 3
 
 
+@respx.mock
+@pytest.mark.asyncio
+async def test_fetch_columnar_series(wds_response: list[dict[str, Any]]) -> None:
+    """Test the columnar series layout carries the same data as rows."""
+    respx.post(
+        f"{WDS_BASE}/getDataFromCubePidCoordAndLatestNPeriods"
+    ).mock(return_value=_batched(wds_response, _make_commodity_response()))
+    config = SourceConfig(
+        name="statcan",
+        settings={"base_url": WDS_BASE, "series_format": "columnar"},
+        timeout=10,
+        retry=RetryConfig(),
+    )
+
+    result = await fetch(config, "2025-01-17")
+
+    imports = result["series"]["Imports from China"]
+    assert imports == {
+        "scalar": "millions",
+        "periods": ["2025-09-01", "2025-10-01", "2025-11-01"],
+        "values": [7290.5, 8070.3, 7324.7],
+    }
+    assert result["imports_cad_millions"] == 7324.7
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_fetch_matches_aggregate_results_by_coordinate(
+    statcan_config: SourceConfig,
+    wds_response: list[dict[str, Any]],
+) -> None:
+    """Test reordered aggregate results are mapped by their coordinate."""
+    imports, exports = wds_response
+    imports["object"]["coordinate"] = "1.1.1.1.11.0.0.0.0.0"
+    exports["object"]["coordinate"] = "1.2.1.1.11.0.0.0.0.0"
+    respx.post(
+        f"{WDS_BASE}/getDataFromCubePidCoordAndLatestNPeriods"
+    ).mock(return_value=_batched([exports, imports], _make_commodity_response()))
+
+    result = await fetch(statcan_config, "2025-01-17")
+
+    assert result["imports_cad_millions"] == 7324.7
+    assert result["exports_cad_millions"] == 3980.3
+
+
 @respx.mock
 @pytest.mark.asyncio
 async def test_fetch_computes_totals(
@@ -235,10 +302,7 @@ async def test_fetch_computes_totals(
     commodity_resp = _make_commodity_response()
     respx.post(
         f"{WDS_BASE}/getDataFromCubePidCoordAndLatestNPeriods"
-    ).mock(side_effect=[
-        httpx.Response(200, json=wds_response),
-        httpx.Response(200, json=commodity_resp),
-    ])
+    ).mock(return_value=_batched(wds_response, commodity_resp))
 
     result = await fetch(statcan_config, "2025-01-17")
 
@@ -289,10 +353,7 @@ async def test_fetch_commodities_success(
     commodity_resp = _make_commodity_response()
     respx.post(
         f"{WDS_BASE}/getDataFromCubePidCoordAndLatestNPeriods"
-    ).mock(side_effect=[
-        httpx.Response(200, json=wds_response),
-        httpx.Response(200, json=commodity_resp),
-    ])
+    ).mock(return_value=_batched(wds_response, commodity_resp))
 
     result = await fetch(statcan_config, "2025-01-17")
 
@@ -308,23 +369,47 @@ async def test_fetch_commodities_success(
     assert first["trend"] in ("up", "down", "stable")
 
 
+def _parallel_config() -> SourceConfig:
+    """A StatCan config that sends each aggregate series as its own POST."""
+    return SourceConfig(
+        name="statcan",
+        settings={"base_url": WDS_BASE, "parallel_series": True},
+        timeout=10,
+        retry=RetryConfig(),
+    )
+
+
+def _aggregates_then(
+    wds_response: list[dict[str, Any]],
+    commodity_answer: httpx.Response | Exception,
+) -> Callable[[httpx.Request], httpx.Response]:
+    """Answer each aggregate POST from *wds_response* and the commodity batch otherwise."""
+    by_coord = dict(zip(("1.1.1.1.11.0.0.0.0.0", "1.2.1.1.11.0.0.0.0.0"), wds_response))
+
+    def _respond(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        if body[0]["productId"] == COMMODITY_TABLE_PID:
+            if isinstance(commodity_answer, Exception):
+                raise commodity_answer
+            return commodity_answer
+        return httpx.Response(200, json=[by_coord[body[0]["coordinate"]]])
+
+    return _respond
+
+
 @respx.mock
 @pytest.mark.asyncio
-async def test_fetch_commodities_http_error_returns_empty(
-    statcan_config: SourceConfig,
+async def test_fetch_commodities_http_error_keeps_aggregate(
     wds_response: list[dict[str, Any]],
 ) -> None:
-    """Commodity HTTP failure should result in empty commodities list."""
-    respx.post(
-        f"{WDS_BASE}/getDataFromCubePidCoordAndLatestNPeriods"
-    ).mock(side_effect=[
-        httpx.Response(200, json=wds_response),
-        httpx.Response(503),  # commodity call fails
-    ])
+    """A failed commodity batch should only drop commodities."""
+    respx.post(f"{WDS_BASE}/getDataFromCubePidCoordAndLatestNPeriods").mock(
+        side_effect=_aggregates_then(wds_response, httpx.Response(503)),
+    )
 
-    result = await fetch(statcan_config, "2025-01-17")
+    result = await fetch(_parallel_config(), "2025-01-17")
 
-    # Aggregate data should still be present
+    assert "error" not in result
     assert result["imports_cad_millions"] == 7324.7
     # Commodities should gracefully return empty
     assert result["commodities"] == []
@@ -332,19 +417,17 @@ async def test_fetch_commodities_http_error_returns_empty(
 
 @respx.mock
 @pytest.mark.asyncio
-async def test_fetch_commodities_timeout_returns_empty(
-    statcan_config: SourceConfig,
+async def test_fetch_commodities_timeout_keeps_aggregate(
     wds_response: list[dict[str, Any]],
 ) -> None:
-    """Commodity timeout should result in empty commodities list."""
-    respx.post(
-        f"{WDS_BASE}/getDataFromCubePidCoordAndLatestNPeriods"
-    ).mock(side_effect=[
-        httpx.Response(200, json=wds_response),
-        httpx.ConnectTimeout("Connection timed out"),
-    ])
+    """A timed-out commodity batch should only drop commodities."""
+    respx.post(f"{WDS_BASE}/getDataFromCubePidCoordAndLatestNPeriods").mock(
+        side_effect=_aggregates_then(
+            wds_response, httpx.ConnectTimeout("Connection timed out"),
+        ),
+    )
 
-    result = await fetch(statcan_config, "2025-01-17")
+    result = await fetch(_parallel_config(), "2025-01-17")
 
     assert result["imports_cad_millions"] == 7324.7
     assert result["commodities"] == []
@@ -364,7 +447,7 @@ async def test_fetch_commodities_partial_failure(
     results.append({
         "status": "SUCCESS",
         "object": {
-            "coordinate": first_comm["import_coordinate"],
+            "coordinate": first_comm.import_coordinate,
             "vectorId": 1000000,
             "vectorDataPoint": [
                 {"refPer": "2025-10-01", "value": 100000.0, "scalarFactorCode": 3},
@@ -375,7 +458,7 @@ async def test_fetch_commodities_partial_failure(
     results.append({
         "status": "SUCCESS",
         "object": {
-            "coordinate": first_comm["export_coordinate"],
+            "coordinate": first_comm.export_coordinate,
             "vectorId": 1000001,
             "vectorDataPoint": [
                 {"refPer": "2025-10-01", "value": 50000.0, "scalarFactorCode": 3},
@@ -390,10 +473,7 @@ async def test_fetch_commodities_partial_failure(
 
     respx.post(
         f"{WDS_BASE}/getDataFromCubePidCoordAndLatestNPeriods"
-    ).mock(side_effect=[
-        httpx.Response(200, json=wds_response),
-        httpx.Response(200, json=results),
-    ])
+    ).mock(return_value=_batched(wds_response, results))
 
     result = await fetch(statcan_config, "2025-01-17")
 
@@ -419,7 +499,7 @@ async def test_fetch_commodities_trend_calculation(
     results.append({
         "status": "SUCCESS",
         "object": {
-            "coordinate": first_comm["import_coordinate"],
+            "coordinate": first_comm.import_coordinate,
             "vectorId": 1000000,
             "vectorDataPoint": [
                 {"refPer": "2025-10-01", "value": 100000.0, "scalarFactorCode": 3},
@@ -430,7 +510,7 @@ async def test_fetch_commodities_trend_calculation(
     results.append({
         "status": "SUCCESS",
         "object": {
-            "coordinate": first_comm["export_coordinate"],
+            "coordinate": first_comm.export_coordinate,
             "vectorId": 1000001,
             "vectorDataPoint": [
                 {"refPer": "2025-10-01", "value": 100000.0, "scalarFactorCode": 3},
@@ -445,10 +525,7 @@ async def test_fetch_commodities_trend_calculation(
 
     respx.post(
         f"{WDS_BASE}/getDataFromCubePidCoordAndLatestNPeriods"
-    ).mock(side_effect=[
-        httpx.Response(200, json=wds_response),
-        httpx.Response(200, json=results),
-    ])
+    ).mock(return_value=_batched(wds_response, results))
 
     result = await fetch(statcan_config, "2025-01-17")
 
@@ -466,10 +543,7 @@ async def test_fetch_commodities_all_failed_returns_empty(
     commodity_resp = _make_commodity_response(all_success=False)
     respx.post(
         f"{WDS_BASE}/getDataFromCubePidCoordAndLatestNPeriods"
-    ).mock(side_effect=[
-        httpx.Response(200, json=wds_response),
-        httpx.Response(200, json=commodity_resp),
-    ])
+    ).mock(return_value=_batched(wds_response, commodity_resp))
 
     result = await fetch(statcan_config, "2025-01-17")
 
@@ -483,10 +557,130 @@ async def test_fetch_commodities_all_failed_returns_empty(
 async def test_commodity_coords_have_required_fields() -> None:
     """Verify COMMODITY_COORDS structure is well-formed."""
     for comm in COMMODITY_COORDS:
-        assert "label" in comm, f"Missing 'label' in {comm}"
-        assert "label_zh" in comm, f"Missing 'label_zh' in {comm}"
-        assert "import_coordinate" in comm, f"Missing 'import_coordinate' in {comm}"
-        assert "export_coordinate" in comm, f"Missing 'export_coordinate' in {comm}"
+        assert comm.label, f"Missing label in {comm}"
+        assert comm.label_zh, f"Missing label_zh in {comm}"
         # Import and export coordinates should differ only in trade dimension
-        assert comm["import_coordinate"].startswith("1.1.")
-        assert comm["export_coordinate"].startswith("1.2.")
+        assert comm.import_coordinate.startswith("1.1.")
+        assert comm.export_coordinate.startswith("1.2.")
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_fetch_sends_one_batched_query(
+    statcan_config: SourceConfig,
+    wds_response: list[dict[str, Any]],
+) -> None:
+    """Test aggregate and commodity coordinates share a single POST."""
+    route = respx.post(f"{WDS_BASE}/getDataFromCubePidCoordAndLatestNPeriods").mock(
+        return_value=_batched(wds_response, _make_commodity_response()),
+    )
+
+    result = await fetch(statcan_config, "2025-01-17")
+
+    assert route.call_count == 1
+    body = json.loads(route.calls.last.request.content)
+    assert [p["productId"] for p in body].count(TABLE_PID) == 2
+    assert [p["productId"] for p in body].count(COMMODITY_TABLE_PID) == 2 * len(COMMODITY_COORDS)
+    assert "error" not in result
+    assert len(result["commodities"]) == len(COMMODITY_COORDS)
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_query_wds_decodes_large_body_off_loop(
+    wds_response: list[dict[str, Any]],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test bodies over the threshold are decoded in a worker thread."""
+    offloaded: list[Any] = []
+
+    async def fake_to_thread(func: Callable[..., Any], *args: Any) -> Any:
+        offloaded.append(func)
+        return func(*args)
+
+    monkeypatch.setattr("fetcher.sources.statcan._THREADED_PARSE_BYTES", 10)
+    monkeypatch.setattr("fetcher.sources.statcan.asyncio.to_thread", fake_to_thread)
+    respx.post(f"{WDS_BASE}/getDataFromCubePidCoordAndLatestNPeriods").mock(
+        return_value=httpx.Response(200, json=wds_response)
+    )
+    payload = _wds_payload(((TABLE_PID, "1.1.1.1.11.0.0.0.0.0"),), 3)
+
+    async with httpx.AsyncClient() as client:
+        results = await _query_wds(client, WDS_BASE, payload, 10)
+
+    assert offloaded
+    assert [p.value for p in results[0].object.vector_data_point] == [7290.5, 8070.3, 7324.7]
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_fetch_tolerates_malformed_items(
+    statcan_config: SourceConfig,
+    wds_response: list[dict[str, Any]],
+) -> None:
+    """Test a null point list or non-numeric value only blanks that item."""
+    commodity_resp = _make_commodity_response()
+    commodity_resp[0]["object"]["vectorDataPoint"] = None
+    commodity_resp[1]["object"]["vectorDataPoint"][-1]["value"] = "x"
+    wds_response[0]["object"]["vectorDataPoint"][0]["value"] = None
+    respx.post(f"{WDS_BASE}/getDataFromCubePidCoordAndLatestNPeriods").mock(
+        return_value=_batched(wds_response, commodity_resp)
+    )
+
+    result = await fetch(statcan_config, "2025-01-17")
+
+    assert "error" not in result
+    assert result["imports_cad_millions"] == 7324.7
+    assert result["exports_cad_millions"] == 3980.3
+    assert len(result["commodities"]) == len(COMMODITY_COORDS) - 1
+    assert result["commodities"][0]["name"] == COMMODITY_COORDS[1].label
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_fetch_rejects_malformed_response(statcan_config: SourceConfig) -> None:
+    """Test a body that is not a list of result items is reported as an error."""
+    respx.post(f"{WDS_BASE}/getDataFromCubePidCoordAndLatestNPeriods").mock(
+        return_value=httpx.Response(200, json={"message": "maintenance"}),
+    )
+
+    result = await fetch(statcan_config, "2025-01-17")
+
+    assert result["error"].startswith("Invalid WDS response")
+    assert result["commodities"] == []
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_fetch_parallel_series_splits_aggregate_requests(
+    wds_response: list[dict[str, Any]],
+) -> None:
+    """Test parallel_series sends one POST per aggregate series and tolerates one failing."""
+    imports, _ = wds_response
+    imports["object"]["coordinate"] = "1.1.1.1.11.0.0.0.0.0"
+
+    def _respond(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        if body[0]["productId"] == COMMODITY_TABLE_PID:
+            return httpx.Response(200, json=_make_commodity_response())
+        if body[0]["coordinate"] == "1.1.1.1.11.0.0.0.0.0":
+            return httpx.Response(200, json=[imports])
+        return httpx.Response(503)
+
+    route = respx.post(f"{WDS_BASE}/getDataFromCubePidCoordAndLatestNPeriods").mock(
+        side_effect=_respond,
+    )
+    config = SourceConfig(
+        name="statcan",
+        settings={"base_url": WDS_BASE, "parallel_series": True},
+        timeout=10,
+        retry=RetryConfig(),
+    )
+
+    result = await fetch(config, "2025-01-17")
+
+    assert route.call_count == 3
+    assert "error" not in result
+    assert result["imports_cad_millions"] == 7324.7
+    assert result["exports_cad_millions"] is None
+    assert len(result["commodities"]) == len(COMMODITY_COORDS)
@@ -0,0 +1,134 @@
+"""Tests for The Paper web scraper."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+import respx
+
+from fetcher.config import RetryConfig, SourceConfig
+from fetcher.sources import thepaper_scraper
+from fetcher.sources.thepaper_scraper import _fetch_channel_articles, _parse_article_page
+
+CHANNEL = {"id": "25950", "name": "澎湃国际"}
+CHANNEL_URL = "https://www.thepaper.cn/channel_25950"
+
+
+@pytest.fixture
+def channel_html(fixtures_dir: Path) -> str:
+    return (fixtures_dir / "thepaper_channel.html").read_text()
+
+
+@pytest.fixture
+def article_html(fixtures_dir: Path) -> str:
+    return (fixtures_dir / "thepaper_article.html").read_text()
+
+
+def test_parse_article_page(article_html: str) -> None:
+    """Test body paragraphs and the publish date are extracted."""
+    body, date = _parse_article_page(article_html)
+
+    assert body == (
+        "加拿大总理周三表示，将继续与中方就油菜籽关税问题进行沟通。"
+        " 中国商务部此前宣布对加拿大油菜籽加征反倾销税。"
+    )
+    assert date == "2026-02-05"
+
+
+def test_parse_article_page_skips_comments_and_noise(article_html: str) -> None:
+    """Test comments inside <p>, scripts and asides are left out of the body."""
+    body, _ = _parse_article_page(article_html)
+
+    assert "ad slot" not in body
+    assert "window.track" not in body
+    assert "相关阅读" not in body
+
+
+def test_parse_article_page_with_xml_declaration(article_html: str) -> None:
+    """Test XHTML pages starting with an encoding declaration still parse."""
+    declared = '<?xml version="1.0" encoding="utf-8"?>\n' + article_html
+
+    assert _parse_article_page(declared) == _parse_article_page(article_html)
+
+
+def test_parse_article_page_chinese_date() -> None:
+    """Test the 2026年02月05日 date form is recognised."""
+    html = (
+        "<html><body><div class='news_about'>2026年02月05日 10:30</div>"
+        "<div class='news_txt'><p>正文</p></div></body></html>"
+    )
+
+    assert _parse_article_page(html) == ("正文", "2026-02-05")
+
+
+def test_parse_article_page_empty() -> None:
+    """Test an empty page yields no body and no date."""
+    assert _parse_article_page("") == ("", None)
+
+
+@respx.mock
+async def test_fetch_channel_articles(channel_html: str) -> None:
+    """Test article links are normalized, deduplicated and short titles dropped."""
+    respx.get(CHANNEL_URL).mock(return_value=httpx.Response(200, text=channel_html))
+
+    async with httpx.AsyncClient() as client:
+        articles = await _fetch_channel_articles(client, CHANNEL, timeout=10)
+
+    assert [(a["title"], a["url"]) for a in articles] == [
+        ("加拿大总理就油菜籽关税问题回应中方", "https://www.thepaper.cn/newsDetail_forward_30000001"),
+        ("中欧贸易谈判进入新阶段", "https://www.thepaper.cn/newsDetail_forward_30000002"),
+        ("日本央行维持利率不变", "https://www.thepaper.cn/newsDetail_forward_30000004"),
+    ]
+    assert all(a["source"] == "澎湃国际" and a["language"] == "zh" for a in articles)
+
+
+@respx.mock
+async def test_fetch_channel_articles_with_xml_declaration(channel_html: str) -> None:
+    """Test channel pages starting with an encoding declaration still parse."""
+    declared = '<?xml version="1.0" encoding="utf-8"?>\n' + channel_html
+    respx.get(CHANNEL_URL).mock(return_value=httpx.Response(200, text=declared))
+
+    async with httpx.AsyncClient() as client:
+        articles = await _fetch_channel_articles(client, CHANNEL, timeout=10)
+
+    assert len(articles) == 3
+
+
+@respx.mock
+async def test_fetch_channel_articles_http_error() -> None:
+    """Test a failed channel page yields no articles."""
+    respx.get(CHANNEL_URL).mock(return_value=httpx.Response(503))
+
+    async with httpx.AsyncClient() as client:
+        assert await _fetch_channel_articles(client, CHANNEL, timeout=10) == []
+
+
+@respx.mock
+async def test_fetch_paces_body_starts_after_slot_frees(
+    channel_html: str, monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test body fetches queued behind a slow one still start one interval apart."""
+    monkeypatch.setattr(thepaper_scraper, "CHANNELS", [CHANNEL])
+    monkeypatch.setattr(thepaper_scraper, "BODY_CONCURRENCY", 1)
+    monkeypatch.setattr(thepaper_scraper, "BODY_START_INTERVAL", 0.05)
+    starts: list[float] = []
+
+    async def article_page(request: httpx.Request) -> httpx.Response:
+        starts.append(time.monotonic())
+        if len(starts) == 1:
+            await asyncio.sleep(0.3)  # later fetches queue up behind this one
+        return httpx.Response(200, text="<html><body></body></html>")
+
+    respx.get(CHANNEL_URL).mock(return_value=httpx.Response(200, text=channel_html))
+    respx.get(url__startswith="https://www.thepaper.cn/newsDetail").mock(side_effect=article_page)
+    config = SourceConfig(name="thepaper", settings={}, timeout=10, retry=RetryConfig())
+
+    result = await thepaper_scraper.fetch(config, "2026-02-05")
+
+    assert result["scraped_total"] == 3
+    gaps = [later - earlier for earlier, later in zip(starts, starts[1:])]
+    assert min(gaps) >= 0.04
@@ -12,6 +12,7 @@ from fetcher.config import RetryConfig, SourceConfig
 from fetcher.sources.xinhua import (
     CANADA_KEYWORDS,
     POLICY_KEYWORDS,
+    _extract_article_body,
     _extract_articles_from_html,
     _filter_relevant,
     fetch,
@@ -53,12 +54,67 @@ def test_extract_articles_resolves_relative_urls(xinhua_html: str) -> None:
             assert article["source_url"].startswith("http")
 
 
+def test_extract_articles_caps_article_count() -> None:
+    """Test at most max_articles elements are read from a page."""
+    items = "".join(
+        f'<div class="news_item"><a href="/2026-01/{i:02d}/c_{i}.htm">Story {i}</a></div>'
+        for i in range(1, 30)
+    )
+    html = f"<html><body>{items}</body></html>"
+
+    articles = _extract_articles_from_html(html, "http://english.news.cn/", max_articles=5)
+
+    assert [a["title"] for a in articles] == [f"Story {i}" for i in range(1, 6)]
+
+
+def test_extract_articles_reads_snippet_and_date() -> None:
+    """Test body snippet and date come from the element's p and span.time."""
+    html = (
+        '<html><body><div class="news_item">'
+        '<a href="/world/c_1.htm">Ottawa talks</a>'
+        '<p></p><div class="des">Ignored, p comes first</div>'
+        '<span class="time">2026-01-29</span><em>ignored</em>'
+        '</div></body></html>'
+    )
+
+    articles = _extract_articles_from_html(html, "http://english.news.cn/")
+
+    assert articles == [{
+        "title": "Ottawa talks",
+        "body": "",
+        "date": "2026-01-29",
+        "source_url": "http://english.news.cn/world/c_1.htm",
+        "source": "Xinhua",
+    }]
+
+
+def test_extract_articles_with_xml_declaration(xinhua_html: str) -> None:
+    """Test section pages starting with an encoding declaration are read."""
+    declared = '<?xml version="1.0" encoding="utf-8"?>\n' + xinhua_html
+    base_url = "http://www.xinhuanet.com/english/"
+
+    articles = _extract_articles_from_html(declared, base_url)
+
+    assert articles
+    assert articles == _extract_articles_from_html(xinhua_html, base_url)
+
+
 def test_extract_articles_from_empty_html() -> None:
     """Test extraction from empty/minimal HTML."""
     articles = _extract_articles_from_html("<html><body></body></html>", "http://example.com")
     assert articles == []
 
 
+def test_extract_article_body_with_xml_declaration() -> None:
+    """Test article pages starting with an encoding declaration are read."""
+    paragraph = "Canada and China held talks on trade and tariffs in Beijing on Monday."
+    html = (
+        '<?xml version="1.0" encoding="utf-8"?>\n'
+        f'<html><body><div id="detail"><p>{paragraph}</p></div></body></html>'
+    )
+    assert _extract_article_body(html) == paragraph
+
+
 def test_filter_relevant_canada_keywords(xinhua_html: str) -> None:
     """Test filtering for Canada-related content."""
     articles = _extract_articles_from_html(xinhua_html, "http://www.xinhuanet.com/english/")
@@ -187,3 +243,62 @@ async def test_fetch_empty_page(xinhua_config: SourceConfig) -> None:
     assert result["total_scraped"] == 0
     assert result["total_relevant"] == 0
     assert result["articles"] == []
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_fetch_keeps_sections_that_succeed(
+    xinhua_config: SourceConfig,
+    xinhua_html: str,
+) -> None:
+    """Test a failing section does not drop articles from the others."""
+    respx.get("http://english.news.cn/china/index.htm").mock(
+        side_effect=httpx.ConnectTimeout("Timed out")
+    )
+    respx.get("http://english.news.cn/world/index.htm").mock(
+        return_value=httpx.Response(200, text=xinhua_html)
+    )
+    respx.get("http://english.news.cn/").mock(
+        return_value=httpx.Response(403)
+    )
+    respx.get(url__regex=r".*\.html?$").mock(
+        return_value=httpx.Response(200, text="<html></html>")
+    )
+
+    result = await fetch(xinhua_config, "2025-01-17")
+
+    assert "error" not in result
+    assert result["total_scraped"] == len(
+        _extract_articles_from_html(xinhua_html, "http://english.news.cn/world/index.htm")
+    )
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_fetch_dedupes_titles_ignoring_case_and_spacing(
+    xinhua_config: SourceConfig,
+) -> None:
+    """Test the same headline from two sections is kept once."""
+    respx.get("http://english.news.cn/china/index.htm").mock(
+        return_value=httpx.Response(200, text=(
+            '<div class="news_item"><a href="/2026-01/29/c_1.htm">'
+            "China, Canada sign  trade deal</a></div>"
+        ))
+    )
+    respx.get("http://english.news.cn/world/index.htm").mock(
+        return_value=httpx.Response(200, text=(
+            '<div class="news_item"><a href="/2026-01/29/c_2.htm">'
+            "China, Canada Sign Trade Deal</a></div>"
+        ))
+    )
+    respx.get("http://english.news.cn/").mock(
+        return_value=httpx.Response(200, text="<html></html>")
+    )
+    respx.get(url__regex=r".*\.html?$").mock(
+        return_value=httpx.Response(200, text="<html></html>")
+    )
+
+    result = await fetch(xinhua_config, "2025-01-17")
+
+    assert result["total_scraped"] == 1
+    assert result["articles"][0]["source_url"] == "http://english.news.cn/2026-01/29/c_1.htm"
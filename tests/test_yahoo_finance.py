@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pandas as pd
@@ -10,13 +9,23 @@ import pytest
 
 from fetcher.config import RetryConfig, SourceConfig
 from fetcher.sources.yahoo_finance import (
+    _date_window,
     _fetch_index_data,
     _fetch_sector_data,
     _fetch_stock_data,
+    _history_cache,
+    _ticker,
     fetch,
 )
 
 
+@pytest.fixture(autouse=True)
+def _clear_ticker_cache() -> None:
+    """Keep cached Tickers and history (mocks included) from leaking between tests."""
+    _ticker.cache_clear()
+    _history_cache.clear()
+
+
 @pytest.fixture
 def yf_config() -> SourceConfig:
     return SourceConfig(
@@ -95,6 +104,12 @@ def _make_stock_df(close_values: list[float]) -> pd.DataFrame:
     )
 
 
+def test_date_window_ends_day_after_target() -> None:
+    """Test the history window is exclusive of its end and spans the lookback."""
+    assert _date_window("2025-01-17", 10) == ("2025-01-08", "2025-01-18")
+    assert _date_window("2024-12-31", 10) == ("2024-12-22", "2025-01-01")
+
+
 # =============================================================================
 # Index tests (existing)
 # =============================================================================
@@ -119,6 +134,43 @@ def test_fetch_index_data_success(
     assert len(result["sparkline"]) > 0
 
 
+@patch("fetcher.sources.yahoo_finance.yf.Ticker")
+def test_history_is_cached_across_calls(
+    mock_ticker_cls: MagicMock, mock_history_df: pd.DataFrame,
+) -> None:
+    """Test a repeated fetch for the same date reuses the cached history."""
+    mock_ticker = MagicMock()
+    mock_ticker.history.return_value = mock_history_df
+    mock_ticker_cls.return_value = mock_ticker
+
+    first = _fetch_index_data("000001.SS", "Shanghai Composite", "2025-01-17")
+    second = _fetch_index_data("000001.SS", "Shanghai Composite", "2025-01-17")
+
+    assert first == second
+    mock_ticker.history.assert_called_once_with(
+        start="2025-01-08", end="2025-01-18", actions=False,
+    )
+
+
+@patch("fetcher.sources.yahoo_finance.yf.Ticker")
+def test_market_holiday_compares_exchange_dates(
+    mock_ticker_cls: MagicMock, mock_history_df: pd.DataFrame,
+) -> None:
+    """Test the holiday flag uses the exchange-local date of the last close."""
+    hist = mock_history_df.tz_localize("Asia/Shanghai")
+    mock_ticker = MagicMock()
+    mock_ticker.history.return_value = hist
+    mock_ticker_cls.return_value = mock_ticker
+
+    trading_day = _fetch_index_data("000001.SS", "Shanghai Composite", "2025-01-17")
+    holiday = _fetch_index_data("000001.SS", "Shanghai Composite", "2025-01-20")
+
+    assert trading_day["latest_date"] == "2025-01-17"
+    assert trading_day["market_holiday"] is False
+    assert holiday["latest_date"] == "2025-01-17"
+    assert holiday["market_holiday"] is True
+
+
 @patch("fetcher.sources.yahoo_finance.yf.Ticker")
 def test_fetch_index_data_empty_history(mock_ticker_cls: MagicMock) -> None:
     """Test handling of empty history (market holiday / no data)."""
@@ -163,6 +215,26 @@ async def test_fetch_multiple_indices(
     assert len(result["indices"]) == 2
     assert result["summary"]["indices_fetched"] == 2
     assert result["summary"]["indices_failed"] == 0
+    assert result["summary"]["all_markets_closed"] is False
+
+
+@patch("fetcher.sources.yahoo_finance.yf.Ticker")
+@pytest.mark.asyncio
+async def test_fetch_all_markets_closed(
+    mock_ticker_cls: MagicMock,
+    yf_config: SourceConfig,
+    mock_history_df: pd.DataFrame,
+) -> None:
+    """Test markets are closed when every fetched index is on a holiday."""
+    mock_ticker = MagicMock()
+    mock_ticker.history.return_value = mock_history_df
+    mock_ticker_cls.return_value = mock_ticker
+
+    # Last bar is Friday 2025-01-17; the target is the following Monday
+    result = await fetch(yf_config, "2025-01-20")
+
+    assert result["summary"]["indices_fetched"] == 2
+    assert result["summary"]["all_markets_closed"] is True
 
 
 @patch("fetcher.sources.yahoo_finance.yf.Ticker")
@@ -173,13 +245,9 @@ async def test_fetch_partial_failure(
     mock_history_df: pd.DataFrame,
 ) -> None:
     """Test that partial failures are handled (one index fails, other succeeds)."""
-    call_count = 0
-
-    def side_effect(*args: Any, **kwargs: Any) -> MagicMock:
-        nonlocal call_count
-        call_count += 1
+    def side_effect(symbol: str) -> MagicMock:
         mock = MagicMock()
-        if call_count == 1:
+        if symbol == "000001.SS":
             mock.history.return_value = mock_history_df
         else:
             mock.history.return_value = pd.DataFrame()
@@ -414,31 +482,20 @@ async def test_fetch_returns_movers(
     # The watchlist in yf_full_config has 10 stocks.
     # We will make each stock have a different change_pct.
     change_pcts = [5.0, -3.0, 8.0, -1.5, 2.0, -7.0, 1.0, 0.5, -2.0, 3.5]
-    call_idx = 0
+    watchlist = [s["ticker"] for s in yf_full_config.get("watchlist", [])]
+    pct_by_symbol = dict(zip(watchlist, change_pcts))
 
+    # Tickers are fetched concurrently, so mock data is keyed by symbol
     def ticker_side_effect(symbol: str) -> MagicMock:
-        nonlocal call_idx
         mock = MagicMock()
-
-        # First call is for the 1 index, next 2 are sectors, then 10 watchlist stocks
-        if call_idx < 1:
-            # Index
-            mock.history.return_value = _make_stock_df([3200.0, 3210.0, 3220.0, 3230.0, 3240.0])
-        elif call_idx < 3:
-            # Sectors
-            mock.history.return_value = _make_stock_df([1000.0, 1010.0])
-        else:
+        if symbol in pct_by_symbol:
             # Stocks: use change_pcts to compute prev/current close
-            stock_idx = call_idx - 3
-            if stock_idx < len(change_pcts):
-                pct = change_pcts[stock_idx]
-                prev = 100.0
-                curr = prev * (1 + pct / 100)
-                mock.history.return_value = _make_stock_df([prev, curr])
-            else:
-                mock.history.return_value = _make_stock_df([100.0, 100.0])
-
-        call_idx += 1
+            prev = 100.0
+            curr = prev * (1 + pct_by_symbol[symbol] / 100)
+            mock.history.return_value = _make_stock_df([prev, curr])
+        else:
+            # Index and sectors
+            mock.history.return_value = _make_stock_df([3200.0, 3210.0, 3220.0, 3230.0, 3240.0])
         return mock
 
     mock_ticker_cls.side_effect = ticker_side_effect
@@ -462,8 +519,10 @@ async def test_fetch_returns_movers(
     # The top gainer should have the highest change_pct (8.0)
     assert gainers[0]["change_pct"] == 8.0
 
-    # The bottom loser should have the lowest change_pct (-7.0)
-    assert losers[-1]["change_pct"] == -7.0
+    # Losers should be sorted ascending, worst (-7.0) first
+    for i in range(len(losers) - 1):
+        assert losers[i]["change_pct"] <= losers[i + 1]["change_pct"]
+    assert losers[0]["change_pct"] == -7.0
 
 
 @patch("fetcher.sources.yahoo_finance.yf.Ticker")
@@ -473,22 +532,19 @@ async def test_fetch_movers_with_failures(
     yf_full_config: SourceConfig,
 ) -> None:
     """Test movers when some stocks fail to fetch."""
-    call_idx = 0
+    watchlist = [s["ticker"] for s in yf_full_config.get("watchlist", [])]
+    # Every other stock returns empty (simulating failure)
+    failing = set(watchlist[::2])
 
     def ticker_side_effect(symbol: str) -> MagicMock:
-        nonlocal call_idx
         mock = MagicMock()
-
-        if call_idx < 3:
-            # Index + sectors: return valid data
-            mock.history.return_value = _make_stock_df([100.0, 105.0])
-        elif call_idx % 2 == 0:
-            # Every other stock returns empty (simulating failure)
+        if symbol in failing:
             mock.history.return_value = pd.DataFrame()
-        else:
+        elif symbol in watchlist:
             mock.history.return_value = _make_stock_df([100.0, 102.0])
-
-        call_idx += 1
+        else:
+            # Index + sectors: return valid data
+            mock.history.return_value = _make_stock_df([100.0, 105.0])
         return mock
 
     mock_ticker_cls.side_effect = ticker_side_effect